@@ -1,12 +1,17 @@
 __all__ = ["settings"]
 
-try:
-    from importlib import metadata
+from ._settings import settings
 
-    v = metadata.version(__package__)
-    __version__ = f"{v}"
-except Exception:  # pragma: no cover
-    __version__ = "idb"
-    pass
 
-from ._settings import settings
+def __getattr__(name: str) -> str:
+    """Resolve `__version__` on first access, since `importlib.metadata` is slow."""
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from importlib import metadata
+
+        version = f"{metadata.version(__package__)}"
+    except Exception:  # pragma: no cover
+        version = "idb"
+    globals()["__version__"] = version
+    return version
@@ -1,19 +1,314 @@
+import os
+import typing as ty
+
+import click
+import pydantic
 import typer
 
+from skypy import settings
 from skypy.utils.logger import set_up_logging
-from skypy.za import ZATrainerEditor
+from skypy.utils.profiling import StartupProfiler
+
+if ty.TYPE_CHECKING:  # pragma: no cover
+    from skypy.schemas import ZATrainerDataArray
 
 # Define app
 app = typer.Typer()
+za_app = typer.Typer(help="Headless tools for the ZA trainer data.")
+app.add_typer(za_app, name="za")
+
+# Errors shown in the summary of a `pydantic.ValidationError`
+MAX_SHOWN_ERRORS = 5
+
+
+def _validation_summary(error: pydantic.ValidationError) -> str:
+    """Short summary of a validation error: its count, then the first few errors."""
+    details = error.errors(include_url=False)
+    lines = [f"{len(details)} validation error(s):"]
+    for detail in details[:MAX_SHOWN_ERRORS]:
+        where = ".".join(map(str, detail["loc"]))
+        lines.append(f"  {where}: {detail['msg']} (got {detail['input']!r})")
+    if len(details) > MAX_SHOWN_ERRORS:
+        lines.append("  ...")
+    return "\n".join(lines)
+
+
+def _load_input(input_file: str) -> "ZATrainerDataArray":
+    """Load the trainer data of `--input`, validated: it is not trusted.
+
+    Raises:
+        typer.BadParameter: If the data is invalid.
+    """
+    from skypy.za.load import load_trainer_data
 
+    try:
+        return load_trainer_data(
+            file_name=os.path.basename(input_file),
+            input_dir=os.path.dirname(input_file),
+            ignore_output_dir=True,
+        )
+    except pydantic.ValidationError as ex:
+        raise typer.BadParameter(_validation_summary(ex), param_hint="--input") from ex
 
-@app.command()
-def trainer_editor_za() -> None:
+
+@app.callback(invoke_without_command=True)
+def trainer_editor_za(
+    ctx: typer.Context,
+    profile: ty.Annotated[
+        bool,
+        typer.Option(
+            help="Profile the startup, and write HTML/JSON reports to the output directory.",
+        ),
+    ] = settings.profile,
+) -> None:
     """Launch the ZA Trainer Editor."""
+    if ctx.invoked_subcommand is not None:
+        return
     set_up_logging()
-    ui = ZATrainerEditor()
+    profiler = StartupProfiler(enabled=profile)
+    # Imported here, so that the import can be profiled
+    with profiler.stage("import"):
+        from skypy.za import ZATrainerEditor
+
+    ui = ZATrainerEditor(profiler=profiler)
+    profiler.write(os.path.join(ui.output_dir, "profile"))
     ui.mainloop()
 
 
+@za_app.command("edit")
+def za_edit(
+    assignments: ty.Annotated[
+        list[str],
+        typer.Argument(
+            help="Assignments such as `level*=1.2`, `ai_expert=true` or `item=Leftovers`.",
+            show_default=False,
+        ),
+    ],
+    trainer: ty.Annotated[
+        list[str] | None,
+        typer.Option("--trainer", "-t", help="Trainer ID glob, e.g. `ev_m02_*`."),
+    ] = None,
+    rank: ty.Annotated[
+        list[int] | None,
+        typer.Option(help="ZA rank of the trainers."),
+    ] = None,
+    species: ty.Annotated[
+        list[str] | None,
+        typer.Option("--species", "-s", help="Species, by name or ID."),
+    ] = None,
+    level: ty.Annotated[
+        str | None,
+        typer.Option(help="Level range `MIN:MAX`, either bound optional."),
+    ] = None,
+    slot: ty.Annotated[
+        list[int] | None,
+        typer.Option(help="Pokémon slot, from 1 to 6."),
+    ] = None,
+    input_file: ty.Annotated[
+        str,
+        typer.Option("--input", "-i", help="Trainer data, JSON or binary."),
+    ] = settings.files.file_trainer_data,
+    output: ty.Annotated[
+        str | None,
+        typer.Option("--output", "-o", help="JSON file to write the edited data to."),
+    ] = None,
+    create_binaries: ty.Annotated[
+        bool,
+        typer.Option("--bin/--no-bin", help="Also write the binary next to the JSON."),
+    ] = False,
+    dry_run: ty.Annotated[
+        bool,
+        typer.Option(help="Only report what would change."),
+    ] = False,
+) -> None:
+    """Edit the selected trainers and Pokémon in one pass, then write JSON/binary."""
+    from skypy.za.edit import (
+        TrainerSelector,
+        edit_trdata_array,
+        parse_assignment,
+        parse_level_range,
+        resolve_value,
+    )
+
+    set_up_logging()
+    if output is None and not dry_run:
+        raise typer.BadParameter("Required, unless --dry-run.", param_hint="--output")
+    try:
+        parsed = [parse_assignment(text) for text in assignments]
+        selector = TrainerSelector(
+            tr_ids=tuple(trainer or ()),
+            ranks=tuple(rank or ()),
+            species=tuple(resolve_value("dev_id", s) for s in species or ()),
+            level=parse_level_range(level) if level else (None, None),
+            slots=tuple(slot or ()),
+        )
+    except ValueError as ex:
+        raise typer.BadParameter(str(ex)) from ex
+
+    zatrdata = _load_input(input_file)
+    try:
+        result = edit_trdata_array(zatrdata, selector, parsed)
+    except pydantic.ValidationError as ex:
+        typer.echo(_validation_summary(ex), err=True)
+        raise typer.Exit(code=1) from ex
+    except ValueError as ex:
+        raise typer.BadParameter(str(ex)) from ex
+    typer.echo(f"Selected {result.trainers} trainer(s), {result.pokemon} Pokémon.")
+    for text, count in result.changed.items():
+        typer.echo(f"  {text}: {count} value(s) changed")
+    if dry_run or output is None:
+        return
+    result.zatrdata.dump(output, create_binaries=create_binaries)
+    typer.echo(f"Wrote {output}")
+
+
+@za_app.command("mod")
+def za_mod(
+    recipe: ty.Annotated[
+        str,
+        typer.Argument(help="Mod recipe, a YAML or TOML file."),
+    ] = settings.files.file_trainer_data_mod,
+    input_file: ty.Annotated[
+        str,
+        typer.Option("--input", "-i", help="Trainer data, JSON or binary."),
+    ] = settings.files.file_trainer_data,
+    output: ty.Annotated[
+        str | None,
+        typer.Option("--output", "-o", help="JSON file to write the modded data to."),
+    ] = None,
+    create_binaries: ty.Annotated[
+        bool,
+        typer.Option("--bin/--no-bin", help="Also write the binary next to the JSON."),
+    ] = False,
+    dry_run: ty.Annotated[
+        bool,
+        typer.Option(help="Only report what each rule would change."),
+    ] = False,
+) -> None:
+    """Apply the rules of a mod recipe in one pass, then write JSON/binary."""
+    from skypy.za.mod import apply_trdata_mod, load_mod_recipe
+
+    set_up_logging()
+    if output is None and not dry_run:
+        raise typer.BadParameter("Required, unless --dry-run.", param_hint="--output")
+    try:
+        parsed = load_mod_recipe(recipe)
+    except ValueError as ex:
+        raise typer.BadParameter(str(ex), param_hint="RECIPE") from ex
+
+    zatrdata = _load_input(input_file)
+    try:
+        report = apply_trdata_mod(zatrdata, parsed)
+    except pydantic.ValidationError as ex:
+        typer.echo(_validation_summary(ex), err=True)
+        raise typer.Exit(code=1) from ex
+    except ValueError as ex:
+        raise typer.BadParameter(str(ex), param_hint="RECIPE") from ex
+    typer.echo(report.summary())
+    if dry_run or output is None:
+        return
+    report.zatrdata.dump(output, create_binaries=create_binaries)
+    typer.echo(f"Wrote {output}")
+
+
+@za_app.command("validate")
+def za_validate(
+    input_file: ty.Annotated[
+        str,
+        typer.Option("--input", "-i", help="Trainer data, JSON or binary."),
+    ] = settings.files.file_trainer_data,
+    rule: ty.Annotated[
+        list[str] | None,
+        typer.Option("--rule", "-r", help="Rule to check. Defaults to all rules."),
+    ] = None,
+    as_json: ty.Annotated[
+        bool,
+        typer.Option("--json", help="Print the report as JSON."),
+    ] = False,
+    strict: ty.Annotated[
+        bool,
+        typer.Option(help="Also fail on warnings."),
+    ] = False,
+) -> None:
+    """Check the trainer data against the schema and cross-table rules, and report
+    the issues.
+
+    Exits with code 1 if there is an error (or a warning, with --strict).
+    """
+    import json
+
+    from skypy.za.validate import VALIDATION_RULES, validate_trdata_file
+
+    # Logs go to stdout too: keep them out of the JSON report
+    set_up_logging(level="WARNING" if as_json else None)
+    unknown = [name for name in rule or () if name not in VALIDATION_RULES]
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown rule(s) {unknown}, expected any of {list(VALIDATION_RULES)}.",
+            param_hint="--rule",
+        )
+
+    # Not trusted: out-of-range values and unknown keys are reported as issues
+    report = validate_trdata_file(input_file, rule or None)
+    typer.echo(json.dumps(report.to_dict(), indent=2) if as_json else report.summary())
+    if report.errors or (strict and report.warnings):
+        raise typer.Exit(code=1)
+
+
+@za_app.command("query")
+def za_query(
+    sql: ty.Annotated[
+        str,
+        typer.Argument(
+            help="SQL query, e.g. `SELECT za_rank, avg(level) FROM trainers JOIN "
+            "pokemon USING (trainer_idx) GROUP BY za_rank`.",
+            show_default=False,
+        ),
+    ],
+    input_file: ty.Annotated[
+        str,
+        typer.Option("--input", "-i", help="Trainer data, JSON or binary."),
+    ] = settings.files.file_trainer_data,
+    raw: ty.Annotated[
+        bool,
+        typer.Option(help="Also register the move, item and species tables."),
+    ] = True,
+    output_format: ty.Annotated[
+        str,
+        typer.Option(
+            "--format",
+            "-f",
+            click_type=click.Choice(["table", "csv", "json"]),
+            help="Format of the result.",
+        ),
+    ] = "table",
+) -> None:
+    """Run a SQL query over the trainer data and the game data, with DuckDB.
+
+    Views: trainers, pokemon, moves, and (with --raw) waza, personal_waza, waza_params,
+    items, abilities, species, evolutions, learnset, species_names, waza_names and
+    item_names.
+    """
+    import duckdb
+    import polars as pl
+
+    from skypy.za.query import query
+
+    # Logs go to stdout too: keep them out of machine-readable results
+    set_up_logging(level="WARNING" if output_format != "table" else None)
+    zatrdata = _load_input(input_file)
+    try:
+        result = query(sql, zatrdata, raw=raw)
+    except duckdb.Error as ex:
+        raise typer.BadParameter(str(ex), param_hint="SQL") from ex
+    if output_format == "csv":
+        typer.echo(result.write_csv(), nl=False)
+    elif output_format == "json":
+        typer.echo(result.write_json())
+    else:
+        with pl.Config(tbl_rows=-1, tbl_cols=-1, fmt_str_lengths=100):
+            typer.echo(result)
+
+
 if __name__ == "__main__":
     app()
@@ -1 +1,2 @@
 from .core import *
+from .tables import *  # noqa: F403
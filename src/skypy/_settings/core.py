@@ -1,12 +1,13 @@
 __all__ = ["Settings", "settings"]
 
-import json
 import os
 import typing as ty
 
 import pydantic
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .tables import DisplayNames, NameIndex, lookup_tables
+
 
 class AppliedChanges(pydantic.BaseModel):
     """Settings for applied changes."""
@@ -44,6 +45,10 @@ class Files(pydantic.BaseModel):
         "trdata_array.json",
         description="File name for the trainer data.",
     )
+    trainer_data_mod: str = pydantic.Field(
+        "trdata_mod.yaml",
+        description="File name for the default trainer data mod recipe.",
+    )
     waza: str = pydantic.Field(
         "waza_array.json",
         description="File name for the waza data.",
@@ -91,6 +96,18 @@ class Files(pydantic.BaseModel):
         """Full path to trainer data file."""
         return os.path.join(self.assets, "za", self.trainer_data)
 
+    @pydantic.computed_field()  # type: ignore
+    @property
+    def za_raw_assets(self) -> str:
+        """Directory of the tables dumped from the game (`flatc --json` output)."""
+        return os.path.join(self.root, "assets", "za", "Raw")
+
+    @pydantic.computed_field()  # type: ignore
+    @property
+    def file_trainer_data_mod(self) -> str:
+        """Full path to the default trainer data mod recipe."""
+        return os.path.join(self.assets, "za", self.trainer_data_mod)
+
 
 class Settings(BaseSettings):
     """App settings."""
@@ -111,6 +128,10 @@ class Settings(BaseSettings):
         "TRACE",
         description="Logging level.",
     )
+    profile: bool = pydantic.Field(
+        False,
+        description="If `True`, profile the startup of the trainer editor, and write the reports to its output directory.",
+    )
     applied_changes: AppliedChanges = pydantic.Field(
         AppliedChanges(),
         description="Applied changes.",
@@ -126,11 +147,14 @@ class Settings(BaseSettings):
         return os.path.join(self.files.assets, "za", "species.txt")
 
     @property
-    def za_species_table(self) -> list[str]:
+    def za_species_table(self) -> tuple[str, ...]:
         """ZA species table."""
-        with open(self.za_species_table_file, encoding="utf-8") as f:
-            species_list = [line.strip() for line in f if line.strip()]
-        return species_list
+        return lookup_tables.table(self.za_species_table_file)
+
+    @property
+    def za_species_names(self) -> DisplayNames:
+        """ZA species table, as unique display labels."""
+        return lookup_tables.display_names(self.za_species_table_file)
 
     @property
     def za_waza_table_file(self) -> str:
@@ -138,11 +162,14 @@ class Settings(BaseSettings):
         return os.path.join(self.files.assets, "za", "moves.txt")
 
     @property
-    def za_waza_table(self) -> list[str]:
+    def za_waza_table(self) -> tuple[str, ...]:
         """ZA waza table."""
-        with open(self.za_waza_table_file, encoding="utf-8") as f:
-            waza_list = [line.strip() for line in f if line.strip()]
-        return waza_list
+        return lookup_tables.table(self.za_waza_table_file)
+
+    @property
+    def za_waza_names(self) -> DisplayNames:
+        """ZA waza table, as unique display labels."""
+        return lookup_tables.display_names(self.za_waza_table_file)
 
     @property
     def za_items_table_file(self) -> str:
@@ -150,11 +177,14 @@ class Settings(BaseSettings):
         return os.path.join(self.files.assets, "za", "items.txt")
 
     @property
-    def za_items_table(self) -> list[str]:
+    def za_items_table(self) -> tuple[str, ...]:
         """ZA items table."""
-        with open(self.za_items_table_file, encoding="utf-8") as f:
-            items_list = [line.strip() for line in f if line.strip()]
-        return items_list
+        return lookup_tables.table(self.za_items_table_file)
+
+    @property
+    def za_item_names(self) -> DisplayNames:
+        """ZA items table, as unique display labels."""
+        return lookup_tables.display_names(self.za_items_table_file)
 
     @property
     def za_mappings_location(self) -> str:
@@ -167,9 +197,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "wazaId.json")
 
     @property
-    def za_waza_mappings(self) -> dict[str, int]:
+    def za_waza_mappings(self) -> ty.Mapping[str, int]:
         """ZA waza mappings."""
-        return _get_mappings(self.za_waza_mappings_file)
+        return lookup_tables.mapping(self.za_waza_mappings_file)
+
+    @property
+    def za_waza_index(self) -> NameIndex:
+        """ZA waza name/ID index."""
+        return lookup_tables.index(self.za_waza_mappings_file)
 
     @property
     def za_species_mappings_file(self) -> str:
@@ -177,9 +212,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "devId.json")
 
     @property
-    def za_species_mappings(self) -> dict[str, int]:
+    def za_species_mappings(self) -> ty.Mapping[str, int]:
         """ZA species mappings."""
-        return _get_mappings(self.za_species_mappings_file)
+        return lookup_tables.mapping(self.za_species_mappings_file)
+
+    @property
+    def za_species_index(self) -> NameIndex:
+        """ZA species name/ID index."""
+        return lookup_tables.index(self.za_species_mappings_file)
 
     @property
     def za_ball_mappings_file(self) -> str:
@@ -187,9 +227,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "ballId.json")
 
     @property
-    def za_ball_mappings(self) -> dict[str, int]:
+    def za_ball_mappings(self) -> ty.Mapping[str, int]:
         """ZA ball mappings."""
-        return _get_mappings(self.za_ball_mappings_file)
+        return lookup_tables.mapping(self.za_ball_mappings_file)
+
+    @property
+    def za_ball_index(self) -> NameIndex:
+        """ZA ball name/ID index."""
+        return lookup_tables.index(self.za_ball_mappings_file)
 
     @property
     def za_seikaku_mappings_file(self) -> str:
@@ -197,9 +242,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "seikaku.json")
 
     @property
-    def za_seikaku_mappings(self) -> dict[str, int]:
+    def za_seikaku_mappings(self) -> ty.Mapping[str, int]:
         """ZA seikaku mappings."""
-        return _get_mappings(self.za_seikaku_mappings_file)
+        return lookup_tables.mapping(self.za_seikaku_mappings_file)
+
+    @property
+    def za_seikaku_index(self) -> NameIndex:
+        """ZA seikaku name/ID index."""
+        return lookup_tables.index(self.za_seikaku_mappings_file)
 
     @property
     def za_rare_type_mappings_file(self) -> str:
@@ -207,9 +257,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "rareType.json")
 
     @property
-    def za_rare_type_mappings(self) -> dict[str, int]:
+    def za_rare_type_mappings(self) -> ty.Mapping[str, int]:
         """ZA rare type mappings."""
-        return _get_mappings(self.za_rare_type_mappings_file)
+        return lookup_tables.mapping(self.za_rare_type_mappings_file)
+
+    @property
+    def za_rare_type_index(self) -> NameIndex:
+        """ZA rare type name/ID index."""
+        return lookup_tables.index(self.za_rare_type_mappings_file)
 
     @property
     def za_rank_mappings_file(self) -> str:
@@ -217,9 +272,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "rank.json")
 
     @property
-    def za_rank_mappings(self) -> dict[str, int]:
+    def za_rank_mappings(self) -> ty.Mapping[str, int]:
         """ZA rank mappings."""
-        return _get_mappings(self.za_rank_mappings_file)
+        return lookup_tables.mapping(self.za_rank_mappings_file)
+
+    @property
+    def za_rank_index(self) -> NameIndex:
+        """ZA rank name/ID index."""
+        return lookup_tables.index(self.za_rank_mappings_file)
 
     @property
     def za_item_mappings_file(self) -> str:
@@ -227,9 +287,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "item.json")
 
     @property
-    def za_item_mappings(self) -> dict[str, int]:
+    def za_item_mappings(self) -> ty.Mapping[str, int]:
         """ZA item mappings."""
-        return _get_mappings(self.za_item_mappings_file)
+        return lookup_tables.mapping(self.za_item_mappings_file)
+
+    @property
+    def za_item_index(self) -> NameIndex:
+        """ZA item name/ID index."""
+        return lookup_tables.index(self.za_item_mappings_file)
 
     @property
     def za_sex_mappings_file(self) -> str:
@@ -237,9 +302,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "sex.json")
 
     @property
-    def za_sex_mappings(self) -> dict[str, int]:
+    def za_sex_mappings(self) -> ty.Mapping[str, int]:
         """ZA sex mappings."""
-        return _get_mappings(self.za_sex_mappings_file)
+        return lookup_tables.mapping(self.za_sex_mappings_file)
+
+    @property
+    def za_sex_index(self) -> NameIndex:
+        """ZA sex name/ID index."""
+        return lookup_tables.index(self.za_sex_mappings_file)
 
     @property
     def za_tokusei_mappings_file(self) -> str:
@@ -247,16 +317,14 @@ class Settings(BaseSettings):
         return os.path.join(self.za_mappings_location, "tokusei.json")
 
     @property
-    def za_tokusei_mappings(self) -> dict[str, int]:
+    def za_tokusei_mappings(self) -> ty.Mapping[str, int]:
         """ZA tokusei mappings."""
-        return _get_mappings(self.za_tokusei_mappings_file)
+        return lookup_tables.mapping(self.za_tokusei_mappings_file)
 
-
-def _get_mappings(filename: str) -> dict[str, int]:
-    """Get mappings from a file."""
-    with open(filename, encoding="utf-8") as f:
-        mappings: dict[str, int] = json.load(f)
-    return mappings
+    @property
+    def za_tokusei_index(self) -> NameIndex:
+        """ZA tokusei name/ID index."""
+        return lookup_tables.index(self.za_tokusei_mappings_file)
 
 
 settings = Settings()
@@ -0,0 +1,251 @@
+__all__ = ["LookupTableRegistry", "NameIndex", "DisplayNames", "lookup_tables"]
+
+import json
+import os
+import threading
+import types
+import typing as ty
+
+T = ty.TypeVar("T")
+
+
+class _CacheEntry(ty.NamedTuple):
+    """Cached value, together with the modification time of the file it came from."""
+
+    mtime_ns: int
+    value: ty.Any
+
+
+class NameIndex:
+    """Bidirectional index between names and IDs, built once from a mapping.
+
+    Both directions are plain dictionary lookups, so resolving a name or an ID
+    costs O(1) regardless of the size of the mapping.
+
+    Policy for ambiguous or missing entries:
+        - Name to ID: every name of the source mapping resolves, including several
+          names sharing the same ID (aliases).
+        - ID to name: if several names share an ID, the first one declared in the
+          source mapping is the canonical name.
+        - IDs without a name: `to_name()` raises `KeyError`, while `name_or_id()`
+          returns the ID unchanged. This matches what `flatc` emits for enum values
+          that have no name, so such values survive a JSON round-trip.
+    """
+
+    def __init__(self, mapping: ty.Mapping[str, int]) -> None:
+        """Args:
+        mapping (Mapping[str, int]):
+            Name to ID mapping, in declaration order.
+        """
+        self._ids: dict[str, int] = dict(mapping)
+        self._names: dict[int, str] = {}
+        for name, value in self._ids.items():
+            self._names.setdefault(value, name)
+
+    def __len__(self) -> int:
+        """Number of names."""
+        return len(self._ids)
+
+    def __contains__(self, name: object) -> bool:
+        """Whether the name is known."""
+        return name in self._ids
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        """All names, in declaration order."""
+        return tuple(self._ids)
+
+    @property
+    def ids(self) -> tuple[int, ...]:
+        """All distinct IDs, in declaration order."""
+        return tuple(self._names)
+
+    def to_id(self, name: str) -> int:
+        """Get the ID of a name. Raises `KeyError` if the name is unknown."""
+        return self._ids[name]
+
+    def to_name(self, value: int) -> str:
+        """Get the canonical name of an ID. Raises `KeyError` if the ID has no name."""
+        return self._names[value]
+
+    def has_id(self, value: int) -> bool:
+        """Whether the ID has a name."""
+        return value in self._names
+
+    def name_or_id(self, value: int) -> str | int:
+        """Get the canonical name of an ID, or the ID itself if it has no name."""
+        return self._names.get(value, value)
+
+
+class DisplayNames:
+    """Bidirectional index between the IDs of a line-based table and unique labels.
+
+    A table maps IDs (line numbers) to English names, which are not unique: the items
+    table repeats e.g. "Poké Ball" and the "???" placeholder. Labels tell them apart,
+    so that a name picked in a dropdown always resolves to the ID it was shown for.
+
+    Policy for duplicate names:
+        - The first ID of a name is its canonical ID, labelled with the bare name,
+          so resolving a bare name gives the first ID (as `tuple.index()` did).
+        - Other IDs sharing the name are labelled `"<name> #<ID>"`.
+        - `ids_of()` lists all IDs sharing a name.
+    """
+
+    def __init__(self, table: ty.Sequence[str]) -> None:
+        """Args:
+        table (Sequence[str]):
+            English names, indexed by ID.
+        """
+        self.table: tuple[str, ...] = tuple(table)
+        self._ids: dict[str, int] = {}
+        self._labels: list[str] = []
+        self._duplicates: dict[str, list[int]] = {}
+        for value, name in enumerate(self.table):
+            self._duplicates.setdefault(name, []).append(value)
+        for value, name in enumerate(self.table):
+            label = name if name not in self._ids else f"{name} #{value}"
+            while label in self._ids or (label != name and label in self._duplicates):
+                label = f"{label}'"
+            self._ids[label] = value
+            self._labels.append(label)
+
+    def __len__(self) -> int:
+        """Number of IDs."""
+        return len(self.table)
+
+    def __contains__(self, label: object) -> bool:
+        """Whether the label is known."""
+        return label in self._ids
+
+    @property
+    def labels(self) -> tuple[str, ...]:
+        """All labels, in ID order."""
+        return tuple(self._labels)
+
+    def to_id(self, label: str) -> int:
+        """Get the ID of a label (or bare name). Raises `KeyError` if it is unknown."""
+        return self._ids[label]
+
+    def to_label(self, value: int) -> str:
+        """Get the label of an ID. Raises `KeyError` if the ID is out of range."""
+        if not 0 <= value < len(self._labels):
+            raise KeyError(value)
+        return self._labels[value]
+
+    def label_or_id(self, value: int) -> str | int:
+        """Get the label of an ID, or the ID itself if it is out of range."""
+        return self._labels[value] if 0 <= value < len(self._labels) else value
+
+    def ids_of(self, name: str) -> tuple[int, ...]:
+        """All IDs sharing an English name, canonical ID first."""
+        return tuple(self._duplicates.get(name, ()))
+
+    def is_ambiguous(self, name: str) -> bool:
+        """Whether several IDs share an English name."""
+        return len(self._duplicates.get(name, ())) > 1
+
+
+class LookupTableRegistry:
+    """Registry of the static lookup tables (names, mappings) shipped with the assets.
+
+    Each file is read and parsed only once, and exposed as an immutable object:
+    line-based tables as a `tuple` of strings, JSON mappings as a read-only mapping.
+    A cached entry is invalidated only when the modification time of the underlying
+    file changes, so editing an asset while the app runs is still picked up.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self._cache: dict[tuple[str, str], _CacheEntry] = {}
+        self._lock = threading.RLock()
+
+    def table(self, filename: str) -> tuple[str, ...]:
+        """Get a line-based table (one name per non-empty line).
+
+        Args:
+            filename (str):
+                Path to the text file.
+
+        Returns:
+            tuple[str, ...]: The stripped, non-empty lines of the file.
+        """
+        return self.get(filename, "table", _load_table)
+
+    def mapping(self, filename: str) -> ty.Mapping[str, int]:
+        """Get a JSON mapping (name to ID).
+
+        Args:
+            filename (str):
+                Path to the JSON file.
+
+        Returns:
+            Mapping[str, int]: A read-only view of the mapping.
+        """
+        return self.get(filename, "mapping", _load_mapping)
+
+    def index(self, filename: str) -> NameIndex:
+        """Get the bidirectional index of a JSON mapping (name to ID).
+
+        Args:
+            filename (str):
+                Path to the JSON file.
+        """
+        return self.get(filename, "index", lambda f: NameIndex(self.mapping(f)))
+
+    def display_names(self, filename: str) -> DisplayNames:
+        """Get the unique display labels of a line-based table.
+
+        Args:
+            filename (str):
+                Path to the text file.
+        """
+        return self.get(
+            filename, "display_names", lambda f: DisplayNames(self.table(f))
+        )
+
+    def get(self, filename: str, kind: str, loader: ty.Callable[[str], T]) -> T:
+        """Get a cached value, (re)loading it if the file changed since it was cached.
+
+        Args:
+            filename (str):
+                Path to the file.
+
+            kind (str):
+                Name of the kind of value built from the file.
+                The same file can be cached once per kind.
+
+            loader (Callable[[str], T]):
+                Function building the value from the file path.
+                The value it returns must not be mutated by callers.
+        """
+        key = (os.path.abspath(filename), kind)
+        mtime_ns = os.stat(filename).st_mtime_ns
+        entry = self._cache.get(key)
+        if entry is not None and entry.mtime_ns == mtime_ns:
+            value: T = entry.value
+            return value
+        with self._lock:
+            value = loader(filename)
+            self._cache[key] = _CacheEntry(mtime_ns, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop all cached tables."""
+        with self._lock:
+            self._cache.clear()
+
+
+def _load_table(filename: str) -> tuple[str, ...]:
+    """Load a line-based table from a file."""
+    with open(filename, encoding="utf-8") as f:
+        return tuple(line.strip() for line in f if line.strip())
+
+
+def _load_mapping(filename: str) -> ty.Mapping[str, int]:
+    """Load a JSON mapping from a file."""
+    with open(filename, encoding="utf-8") as f:
+        mappings: dict[str, int] = json.load(f)
+    return types.MappingProxyType(mappings)
+
+
+lookup_tables = LookupTableRegistry()
@@ -1 +1,8 @@
 from .za import *  # noqa
+from .za_fbs import *  # noqa
+from .za_fbs_reader import *  # noqa
+from .za_columnar import *  # noqa
+from .za_construct import *  # noqa
+from .za_stream import *  # noqa
+from .za_raw import *  # noqa
+from .za_personal import *  # noqa
@@ -1,5 +1,7 @@
 __all__ = [
     "ZATrainerDataArray",
+    "LazyTrainerList",
+    "ZATrainerDataSnapshot",
     "ZATrainerData",
     "ZAEffortTalentValues",
     "ZAWazaData",
@@ -9,7 +11,7 @@ __all__ = [
 
 import json
 import os
-import subprocess
+import typing as ty
 
 import pydantic
 from loguru import logger
@@ -40,11 +42,15 @@ COMMON_MODEL_CFG = pydantic.ConfigDict(
 
 
 def get_key_by_value(
-    mapping: dict[str, int],
+    mapping: ty.Mapping[str, int],
     value: int,
     default: str | None = None,
 ) -> str:
-    """Get the key by value from a mapping."""
+    """Get the key by value from a mapping.
+
+    This scans the whole mapping: the schemas use the O(1) `NameIndex` lookups of
+    `settings.za_*_index` instead.
+    """
     try:
         return next(key for key, val in mapping.items() if val == value)
     except StopIteration:
@@ -132,17 +138,22 @@ class ZAWazaData(pydantic.BaseModel):
         """Get the English name of the Waza."""
         return settings.za_waza_table[self.waza_id]
 
+    @property
+    def waza_id_label(self) -> str:
+        """Get the unique display label of the Waza, see `DisplayNames`."""
+        return str(settings.za_waza_names.label_or_id(self.waza_id))
+
     @pydantic.field_serializer("waza_id", when_used="json")
-    def serialize_waza_id(self, v: int) -> str:
+    def serialize_waza_id(self, v: int) -> str | int:
         """Serialize the Waza ID to the string representation."""
-        return get_key_by_value(settings.za_waza_mappings, v)
+        return settings.za_waza_index.name_or_id(v)
 
     @pydantic.field_validator("waza_id", mode="before")
     @classmethod
     def validate_waza_id(cls, v: str | int) -> int:
         """Validate the Waza ID. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_waza_mappings[v]
+            return settings.za_waza_index.to_id(v)
         return v
 
 
@@ -227,6 +238,21 @@ class ZAPokemonData(pydantic.BaseModel):
         """Get the English name of the Pokemon."""
         return settings.za_species_table[self.dev_id]
 
+    @property
+    def dev_id_label(self) -> str:
+        """Get the unique display label of the Pokemon, see `DisplayNames`."""
+        return str(settings.za_species_names.label_or_id(self.dev_id))
+
+    @property
+    def ball_id_label(self) -> str:
+        """Get the unique display label of the Ball, see `DisplayNames`."""
+        return str(settings.za_item_names.label_or_id(self.ball_id))
+
+    @property
+    def item_label(self) -> str:
+        """Get the unique display label of the Item, see `DisplayNames`."""
+        return str(settings.za_item_names.label_or_id(self.item))
+
     @property
     def ball_id_english(self) -> str:
         """Get the English name of the Ball."""
@@ -242,91 +268,91 @@ class ZAPokemonData(pydantic.BaseModel):
     def validate_dev_id(cls, v: str | int) -> int:
         """Validate the Dev ID. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_species_mappings[v]
+            return settings.za_species_index.to_id(v)
         return v
 
     @pydantic.field_serializer("dev_id", when_used="json")
-    def serialize_dev_id(self, v: int) -> str:
+    def serialize_dev_id(self, v: int) -> str | int:
         """Serialize the Dev ID to the string representation."""
-        return get_key_by_value(settings.za_species_mappings, v)
+        return settings.za_species_index.name_or_id(v)
 
     @pydantic.field_validator("ball_id", mode="before")
     @classmethod
     def validate_ball_id(cls, v: str | int) -> int:
         """Validate the Ball ID. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_ball_mappings[v]
+            return settings.za_ball_index.to_id(v)
         return v
 
     @pydantic.field_serializer("ball_id", when_used="json")
-    def serialize_ball_id(self, v: int) -> str:
+    def serialize_ball_id(self, v: int) -> str | int:
         """Serialize the Ball ID to the string representation."""
-        return get_key_by_value(settings.za_ball_mappings, v)
+        return settings.za_ball_index.name_or_id(v)
 
     @pydantic.field_validator("seikaku", mode="before")
     @classmethod
     def validate_seikaku(cls, v: str | int) -> int:
         """Validate the Seikaku. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_seikaku_mappings[v]
+            return settings.za_seikaku_index.to_id(v)
         return v
 
     @pydantic.field_serializer("seikaku", when_used="json")
-    def serialize_seikaku(self, v: int) -> str:
+    def serialize_seikaku(self, v: int) -> str | int:
         """Serialize the Seikaku to the string representation."""
-        return get_key_by_value(settings.za_seikaku_mappings, v)
+        return settings.za_seikaku_index.name_or_id(v)
 
     @pydantic.field_validator("rare_type", mode="before")
     @classmethod
     def validate_rare_type(cls, v: str | int) -> int:
         """Validate the Rare type. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_rare_type_mappings[v]
+            return settings.za_rare_type_index.to_id(v)
         return v
 
     @pydantic.field_serializer("rare_type", when_used="json")
-    def serialize_rare_type(self, v: int) -> str:
+    def serialize_rare_type(self, v: int) -> str | int:
         """Serialize the Rare type to the string representation."""
-        return get_key_by_value(settings.za_rare_type_mappings, v)
+        return settings.za_rare_type_index.name_or_id(v)
 
     @pydantic.field_validator("item", mode="before")
     @classmethod
     def validate_item(cls, v: str | int) -> int:
         """Validate the Item. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_item_mappings[v]
+            return settings.za_item_index.to_id(v)
         return v
 
     @pydantic.field_serializer("item", when_used="json")
-    def serialize_item(self, v: int) -> str:
+    def serialize_item(self, v: int) -> str | int:
         """Serialize the Item to the string representation."""
-        return get_key_by_value(settings.za_item_mappings, v)
+        return settings.za_item_index.name_or_id(v)
 
     @pydantic.field_validator("sex", mode="before")
     @classmethod
     def validate_sex(cls, v: str | int) -> int:
         """Validate the Sex. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_sex_mappings[v]
+            return settings.za_sex_index.to_id(v)
         return v
 
     @pydantic.field_serializer("sex", when_used="json")
-    def serialize_sex(self, v: int) -> str:
+    def serialize_sex(self, v: int) -> str | int:
         """Serialize the Sex to the string representation."""
-        return get_key_by_value(settings.za_sex_mappings, v)
+        return settings.za_sex_index.name_or_id(v)
 
     @pydantic.field_validator("tokusei", mode="before")
     @classmethod
     def validate_tokusei(cls, v: str | int) -> int:
         """Validate the Tokusei. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_tokusei_mappings[v]
+            return settings.za_tokusei_index.to_id(v)
         return v
 
     @pydantic.field_serializer("tokusei", when_used="json")
-    def serialize_tokusei(self, v: int) -> str:
+    def serialize_tokusei(self, v: int) -> str | int:
         """Serialize the Tokusei to the string representation."""
-        return get_key_by_value(settings.za_tokusei_mappings, v)
+        return settings.za_tokusei_index.name_or_id(v)
 
 
 class ZATrainerData(pydantic.BaseModel):
@@ -462,13 +488,309 @@ class ZATrainerData(pydantic.BaseModel):
     def validate_za_rank(cls, v: str | int) -> int:
         """Validate the ZA rank. If `str`, convert to `int` using the mappings."""
         if isinstance(v, str):
-            return settings.za_rank_mappings[v]
+            return settings.za_rank_index.to_id(v)
         return v
 
     @pydantic.field_serializer("za_rank", when_used="json")
-    def serialize_za_rank(self, v: int) -> str:
+    def serialize_za_rank(self, v: int) -> str | int:
         """Serialize the ZA rank to the string representation."""
-        return get_key_by_value(settings.za_rank_mappings, v)
+        return settings.za_rank_index.name_or_id(v)
+
+
+class LazyTrainerList(ty.MutableSequence[ZATrainerData]):
+    """List of trainers, each materialized from its raw record on first access.
+
+    Raw records are kept as loaded (e.g. JSON dictionaries), and a `ZATrainerData` is
+    only built when a trainer is accessed. Trainers that were never accessed are dumped
+    back verbatim, so both loading and dumping cost scale with the number of trainers
+    actually used.
+
+    Trainer IDs can be read without materializing anything, see `tr_id_at()`.
+
+    The records are also the saved state: a trainer is dirty if it was added, or if
+    its dump differs from its record. `mark_clean()` and `dump_json()` make the
+    current state the saved one. Only materialized trainers can be dirty, so
+    finding changes costs one dump per materialized trainer.
+
+    To save in the background, take a `snapshot()`, write it from any thread, then
+    `commit()` it: trainers modified in the meantime stay dirty.
+    """
+
+    def __init__(
+        self,
+        records: ty.Iterable[dict[str, ty.Any]],
+        materialize: ty.Callable[[dict[str, ty.Any]], ZATrainerData],
+    ) -> None:
+        """Args:
+        records (Iterable[dict[str, Any]]):
+            Raw records, as dumped with `by_alias=True` and `exclude_unset=True`.
+
+        materialize (Callable[[dict[str, Any]], ZATrainerData]):
+            Function building a trainer from a record, e.g.
+            `ZATrainerData.model_validate`.
+        """
+        self._records: list[dict[str, ty.Any] | None] = list(records)
+        self._trainers: list[ZATrainerData | None] = [None] * len(self._records)
+        self._fragments: list[str | None] = [None] * len(self._records)
+        self._materialize = materialize
+        self._removed = 0
+        # Bumped whenever trainers are inserted or removed, so that positions in a
+        # snapshot can be matched with the current positions
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Number of trainers."""
+        return len(self._records)
+
+    @ty.overload
+    def __getitem__(self, index: int) -> ZATrainerData: ...
+
+    @ty.overload
+    def __getitem__(self, index: slice) -> list[ZATrainerData]: ...
+
+    def __getitem__(self, index: int | slice) -> ZATrainerData | list[ZATrainerData]:
+        """Get a trainer (or a list of trainers), materializing it if needed."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        trainer = self._trainers[index]
+        if trainer is None:
+            record = self._records[index]
+            assert record is not None
+            trainer = self._materialize(record)
+            self._trainers[index] = trainer
+        return trainer
+
+    @ty.overload
+    def __setitem__(self, index: int, value: ZATrainerData) -> None: ...
+
+    @ty.overload
+    def __setitem__(self, index: slice, value: ty.Iterable[ZATrainerData]) -> None: ...
+
+    def __setitem__(
+        self,
+        index: int | slice,
+        value: ZATrainerData | ty.Iterable[ZATrainerData],
+    ) -> None:
+        """Replace a trainer (or a slice of trainers)."""
+        if isinstance(index, slice):
+            assert not isinstance(value, ZATrainerData)
+            trainers = list(value)
+            self._removed += sum(r is not None for r in self._records[index])
+            self._trainers[index] = trainers
+            self._records[index] = [None] * len(trainers)
+            self._fragments[index] = [None] * len(trainers)
+            self._generation += 1
+        else:
+            assert isinstance(value, ZATrainerData)
+            # The record is kept: it is what the new trainer is compared against
+            self._trainers[index] = value
+
+    def __delitem__(self, index: int | slice) -> None:
+        """Delete a trainer (or a slice of trainers)."""
+        if isinstance(index, slice):
+            self._removed += sum(r is not None for r in self._records[index])
+        elif self._records[index] is not None:
+            self._removed += 1
+        del self._trainers[index]
+        del self._records[index]
+        del self._fragments[index]
+        self._generation += 1
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another sequence of trainers."""
+        if not isinstance(other, ty.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        """Representation, without materializing the trainers."""
+        return (
+            f"{self.__class__.__name__}({len(self)} trainers, "
+            f"{self.materialized_count} materialized)"
+        )
+
+    def insert(self, index: int, value: ZATrainerData) -> None:
+        """Insert a trainer."""
+        self._trainers.insert(index, value)
+        self._records.insert(index, None)
+        self._fragments.insert(index, None)
+        self._generation += 1
+
+    @property
+    def materialized_count(self) -> int:
+        """Number of trainers built so far."""
+        return sum(trainer is not None for trainer in self._trainers)
+
+    def is_materialized(self, index: int) -> bool:
+        """Whether the trainer at this position was built."""
+        return self._trainers[index] is not None
+
+    def tr_id_at(self, index: int) -> str:
+        """Get the ID of the trainer at this position, without materializing it."""
+        trainer = self._trainers[index]
+        if trainer is not None:
+            return trainer.tr_id
+        record = self._records[index]
+        assert record is not None
+        trid: str = record[_TR_ID_ALIAS] if _TR_ID_ALIAS in record else record["tr_id"]
+        return trid
+
+    @property
+    def removed_count(self) -> int:
+        """Number of saved trainers removed since the last save."""
+        return self._removed
+
+    def dirty_positions(self) -> list[int]:
+        """Positions of the trainers added or modified since the last save."""
+        return [
+            i
+            for i, (record, trainer) in enumerate(zip(self._records, self._trainers))
+            if trainer is not None and (record is None or _dump(trainer) != record)
+        ]
+
+    def changes(self) -> dict[str, list[str]]:
+        """Fields modified since the last save, by trainer ID.
+
+        Fields are dotted paths of aliases (e.g. `"poke1.level"`), as in the dumped
+        JSON. Added trainers list all their fields.
+        """
+        changes: dict[str, list[str]] = {}
+        for i in self.dirty_positions():
+            trainer = self._trainers[i]
+            assert trainer is not None
+            paths = _diff_paths(self._records[i] or {}, _dump(trainer))
+            changes.setdefault(trainer.tr_id, []).extend(paths)
+        return changes
+
+    def mark_clean(self) -> list[int]:
+        """Make the current state the saved state.
+
+        Returns:
+            list[int]: Positions of the trainers that were dirty.
+        """
+        dirty = self.dirty_positions()
+        for i in dirty:
+            trainer = self._trainers[i]
+            assert trainer is not None
+            self._records[i] = _dump(trainer)
+            self._fragments[i] = None
+        self._removed = 0
+        return dirty
+
+    def dump_records(self) -> list[dict[str, ty.Any]]:
+        """Dump the trainers to JSON-compatible records, by alias and excluding unset
+        fields. Trainers that were never materialized are returned as is.
+        """
+        records: list[dict[str, ty.Any]] = []
+        for record, trainer in zip(self._records, self._trainers):
+            if trainer is not None:
+                record = _dump(trainer)
+            assert record is not None
+            records.append(record)
+        return records
+
+    def snapshot(self) -> "ZATrainerDataSnapshot":
+        """Take a snapshot of the current state, to be dumped from any thread.
+
+        Only materialized trainers are dumped: the records of the other trainers, and
+        the records of clean trainers, are shared with the snapshot (they are never
+        mutated), as are the cached JSON texts.
+        """
+        records: list[dict[str, ty.Any]] = []
+        fragments: list[str | None] = []
+        for i, (record, trainer) in enumerate(zip(self._records, self._trainers)):
+            fragment = self._fragments[i]
+            if trainer is not None:
+                dumped = _dump(trainer)
+                if dumped != record:
+                    record, fragment = dumped, None
+            assert record is not None
+            records.append(record)
+            fragments.append(fragment)
+        return ZATrainerDataSnapshot(records, fragments, self._generation)
+
+    def commit(self, snapshot: "ZATrainerDataSnapshot") -> bool:
+        """Make a snapshot the saved state, once it was written.
+
+        Trainers modified after the snapshot was taken stay dirty. If trainers were
+        inserted or removed since, positions no longer match and nothing is marked
+        clean.
+
+        Returns:
+            bool: Whether the snapshot was committed.
+        """
+        if snapshot.generation != self._generation:
+            logger.trace("Trainers were added or removed, not committing snapshot.")
+            return False
+        for i, record in enumerate(snapshot.records):
+            if self._records[i] is not record:
+                self._records[i] = record
+                self._fragments[i] = snapshot.fragments[i]
+            elif self._fragments[i] is None:
+                self._fragments[i] = snapshot.fragments[i]
+        self._removed = 0
+        return True
+
+    def dump_json(self) -> str:
+        """Dump the trainers to JSON, as `ZATrainerDataArray.dump()` writes it, and
+        mark them clean.
+
+        The JSON text of each trainer is cached, and only the trainers modified since
+        the last call are serialized again.
+        """
+        snapshot = self.snapshot()
+        text = snapshot.to_json()
+        self.commit(snapshot)
+        return text
+
+
+class ZATrainerDataSnapshot(ty.NamedTuple):
+    """State of the trainer data at a point in time, detached from the models.
+
+    Records are JSON-compatible and must not be mutated, so a snapshot can be dumped
+    from a worker thread while the trainers keep being edited.
+    """
+
+    records: list[dict[str, ty.Any]]
+    """Trainer records, as dumped with `by_alias=True` and `exclude_unset=True`."""
+    fragments: list[str | None]
+    """Cached JSON text of each record, if already serialized."""
+    generation: int | None = None
+    """Structure generation of the `LazyTrainerList` it was taken from, if any."""
+
+    def to_json(self) -> str:
+        """Dump the records to JSON, as `ZATrainerDataArray.dump()` writes it.
+
+        Records without a cached text are serialized, and their text is cached.
+        """
+        fragments = self.fragments
+        for i, fragment in enumerate(fragments):
+            if fragment is None:
+                text = json.dumps(self.records[i], indent=2, ensure_ascii=False)
+                fragments[i] = text.replace("\n", "\n    ")
+        if not fragments:
+            return '{\n  "values": []\n}'
+        body = ",\n    ".join(ty.cast(list[str], fragments))
+        return f'{{\n  "values": [\n    {body}\n  ]\n}}'
+
+
+def _dump(trainer: ZATrainerData) -> dict[str, ty.Any]:
+    """Dump a trainer to a JSON-compatible record."""
+    return trainer.model_dump(mode="json", by_alias=True, exclude_unset=True)
+
+
+def _diff_paths(old: ty.Any, new: ty.Any, prefix: str = "") -> list[str]:
+    """Dotted paths of the values that differ between two records."""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return [] if old == new else [prefix]
+    paths: list[str] = []
+    for key in {**old, **new}:
+        path = f"{prefix}.{key}" if prefix else key
+        paths.extend(_diff_paths(old.get(key), new.get(key), path))
+    return paths
+
+
+_TR_ID_ALIAS = ZATrainerData.model_fields["tr_id"].alias or "tr_id"
 
 
 class ZATrainerDataArray(pydantic.BaseModel):
@@ -485,6 +807,8 @@ class ZATrainerDataArray(pydantic.BaseModel):
     @pydantic.model_serializer(when_used="json")
     def model_serialize(self) -> dict:
         """Serialize the model to a dictionary."""
+        if isinstance(self.values, LazyTrainerList):
+            return {"values": self.values.dump_records()}
         return {
             "values": [
                 trainer.model_dump(mode="json", by_alias=True, exclude_unset=True)
@@ -492,24 +816,173 @@ class ZATrainerDataArray(pydantic.BaseModel):
             ]
         }
 
+    @pydantic.field_serializer("values", mode="wrap")
+    def serialize_values(
+        self,
+        values: ty.Sequence[ZATrainerData],
+        handler: pydantic.SerializerFunctionWrapHandler,
+    ) -> ty.Any:
+        """Serialize lazy trainers as a list."""
+        if isinstance(values, LazyTrainerList):
+            values = list(values)
+        return handler(values)
+
+    _positions: dict[str, int] = pydantic.PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: ty.Any, /) -> None:
+        """Build the index of trainer positions."""
+        self._reindex()
+
+    def __len__(self) -> int:
+        """Number of trainers."""
+        return len(self.values)
+
+    def __contains__(self, trid: object) -> bool:
+        """Whether a trainer with this ID exists."""
+        return isinstance(trid, str) and self._position(trid) is not None
+
+    def __getitem__(self, key: str | int) -> ZATrainerData:
+        """Get a trainer by ID, or by position if `key` is an `int`."""
+        if isinstance(key, int):
+            return self.values[key]
+        return self.get_trainer(key)
+
     @property
     def table(self) -> list[ZATrainerData]:
         """Get the table of trainers."""
         return self.values
 
+    @property
+    def tr_ids(self) -> list[str]:
+        """IDs of all trainers, in order. Lazy trainers are not materialized."""
+        return [self._tr_id_at(i) for i in range(len(self.values))]
+
+    def changes(self) -> dict[str, list[str]]:
+        """Fields modified since the data was loaded or last dumped, by trainer ID.
+
+        See `LazyTrainerList.changes()`. Changes are only tracked for lazy trainer
+        data (see `skypy.schemas.lazy_trdata_array()`): otherwise, every trainer is
+        reported, without field paths.
+        """
+        if isinstance(self.values, LazyTrainerList):
+            return self.values.changes()
+        return {trid: [] for trid in self.tr_ids}
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether trainers were added, modified or removed since the last dump."""
+        if isinstance(self.values, LazyTrainerList):
+            return bool(self.values.removed_count or self.values.dirty_positions())
+        return True
+
+    def snapshot(self) -> ZATrainerDataSnapshot:
+        """Take a snapshot of the data, to dump it from another thread.
+
+        See `LazyTrainerList.snapshot()`. For trainer data that is not lazy, every
+        trainer is dumped.
+        """
+        if isinstance(self.values, LazyTrainerList):
+            return self.values.snapshot()
+        records = [_dump(trainer) for trainer in self.values]
+        return ZATrainerDataSnapshot(records, [None] * len(records))
+
+    def commit(self, snapshot: ZATrainerDataSnapshot) -> bool:
+        """Mark a snapshot as saved, see `LazyTrainerList.commit()`.
+
+        Returns:
+            bool: Whether the snapshot was committed. Always `False` for trainer data
+                that is not lazy, as changes are not tracked.
+        """
+        if isinstance(self.values, LazyTrainerList):
+            return self.values.commit(snapshot)
+        return False
+
+    def _tr_id_at(self, i: int) -> str:
+        """Get the ID of the trainer at position `i`."""
+        if isinstance(self.values, LazyTrainerList):
+            return self.values.tr_id_at(i)
+        return self.values[i].tr_id
+
+    def _reindex(self, start: int = 0) -> None:
+        """(Re)build the `tr_id` to position index, from position `start` onwards.
+
+        If several trainers share an ID, the first one wins.
+        """
+        if start == 0:
+            self._positions = {}
+        else:
+            self._positions = {k: i for k, i in self._positions.items() if i < start}
+        for i in range(start, len(self.values)):
+            self._positions.setdefault(self._tr_id_at(i), i)
+
+    def _position(self, trid: str) -> int | None:
+        """Get the position of a trainer in `values`, or `None` if it does not exist.
+
+        Hits are O(1). Otherwise the index may be stale (`values` was edited directly,
+        e.g. a trainer renamed in place), so it is rebuilt once and the lookup
+        retried: misses are O(n), and rare.
+        """
+        i = self._positions.get(trid)
+        if i is not None and i < len(self.values) and self._tr_id_at(i) == trid:
+            return i
+        self._reindex()
+        return self._positions.get(trid)
+
     def get_trainer(self, trid: str) -> ZATrainerData:
         """Get a trainer by ID."""
-        for trainer in self.table:
-            if trainer.tr_id == trid:
-                return trainer
-        raise ValueError(f"Trainer with ID {trid} not found.")
+        i = self._position(trid)
+        if i is None:
+            raise ValueError(f"Trainer with ID {trid} not found.")
+        return self.values[i]
 
     def set_trainer(self, trid: str, trainer: ZATrainerData) -> None:
-        """Set a trainer by ID."""
-        for i, t in enumerate(self.table):
-            if t.tr_id == trid:
-                self.table[i] = trainer
-                break
+        """Set a trainer by ID. Nothing happens if there is no trainer with this ID."""
+        i = self._position(trid)
+        if i is None:
+            logger.trace(f"Trainer with ID {trid} not found, not setting it.")
+            return
+        self.values[i] = trainer
+        if trainer.tr_id != trid:
+            del self._positions[trid]
+            self._positions.setdefault(trainer.tr_id, i)
+
+    def get_many(self, trids: ty.Iterable[str]) -> list[ZATrainerData]:
+        """Get several trainers by ID, in the given order."""
+        return [self.get_trainer(trid) for trid in trids]
+
+    def set_many(self, trainers: ty.Mapping[str, ZATrainerData]) -> None:
+        """Set several trainers by ID. IDs that do not exist are ignored."""
+        for trid, trainer in trainers.items():
+            self.set_trainer(trid, trainer)
+
+    def add_trainer(self, trainer: ZATrainerData, index: int | None = None) -> None:
+        """Insert a new trainer.
+
+        Args:
+            trainer (ZATrainerData):
+                Trainer to add. Its ID must not exist yet.
+
+            index (int, optional):
+                Position where to insert the trainer. Defaults to the end of the table.
+        """
+        if trainer.tr_id in self:
+            raise ValueError(f"Trainer with ID {trainer.tr_id} already exists.")
+        if index is None or index >= len(self.values):
+            self.values.append(trainer)
+            self._positions[trainer.tr_id] = len(self.values) - 1
+            return
+        index = index % len(self.values) if index < 0 else index
+        self.values.insert(index, trainer)
+        self._reindex(start=index)
+
+    def remove_trainer(self, trid: str) -> ZATrainerData:
+        """Remove a trainer by ID, and return it."""
+        i = self._position(trid)
+        if i is None:
+            raise ValueError(f"Trainer with ID {trid} not found.")
+        trainer = self.values.pop(i)
+        self._reindex(start=i)
+        return trainer
 
     def dump(
         self,
@@ -517,15 +990,108 @@ class ZATrainerDataArray(pydantic.BaseModel):
         bfbs_file: str | None = None,
         create_binaries: bool = False,
     ) -> None:
-        """Dump the data to a JSON file."""
+        """Dump the data to a JSON file.
+
+        Args:
+            path (str):
+                Path of the JSON file.
+
+            bfbs_file (str, optional):
+                The game's binary schema (`.bfbs`). Binaries are encoded in-process,
+                and the layout of the encoder is checked against this schema first.
+                Defaults to `settings.files.za_trainers_bfbs_file`, if it exists.
+                See `skypy.schemas.check_bfbs_layout()`.
+
+            create_binaries (bool):
+                Whether to also write the FlatBuffers binary next to the JSON file,
+                with the same name and a `.bin` extension.
+                Defaults to `False`.
+
+        Raises:
+            ValueError: If the binary schema does not match the layout of the encoder.
+                Nothing is written then.
+        """
+        if create_binaries:
+            from .za_fbs import check_bfbs_layout, resolve_bfbs_file
+
+            bfbs_file = resolve_bfbs_file(bfbs_file)
+            if bfbs_file is not None:
+                check_bfbs_layout(bfbs_file)
+
         with open(path, "w", encoding="utf-8") as f:
-            data = self.model_dump(mode="json", by_alias=True, exclude_unset=True)
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            logger.trace(f"Dumped data to {path}: {data}")
+            if isinstance(self.values, LazyTrainerList):
+                # Only the trainers changed since the last dump are serialized
+                f.write(self.values.dump_json())
+            else:
+                data = self.model_dump(mode="json", by_alias=True, exclude_unset=True)
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            logger.trace(f"Dumped data to {path}.")
 
         if create_binaries:
-            bfbs_file = bfbs_file or settings.files.za_trainers_bfbs_file
-            if os.path.exists(bfbs_file):
-                logger.trace(f"Creating binary for {path}...")
-                dirname = os.path.dirname(path)
-                subprocess.run(["flatc", "-b", "-o", dirname, bfbs_file, path])
+            self.dump_binary(f"{os.path.splitext(path)[0]}.bin", bfbs_file)
+
+    def dump_binary(self, path: str, bfbs_file: str | None = None) -> None:
+        """Dump the data to a FlatBuffers binary (`trdata_array.bin`).
+
+        The layout of the encoder is checked against the binary schema first, if any.
+        See `dump()`.
+        """
+        from .za_fbs import check_bfbs_layout, encode_trdata_array, resolve_bfbs_file
+
+        bfbs_file = resolve_bfbs_file(bfbs_file)
+        if bfbs_file is not None:
+            check_bfbs_layout(bfbs_file)
+        logger.trace(f"Creating binary {path}...")
+        with open(path, "wb") as f:
+            f.write(encode_trdata_array(self))
+        logger.trace(f"Created binary {path}.")
+
+    @classmethod
+    def load_binary(cls, path: str) -> "ZATrainerDataArray":
+        """Load the data from a FlatBuffers binary (`trdata_array.bin`)."""
+        from .za_fbs import decode_trdata_array
+
+        with open(path, "rb") as f:
+            return decode_trdata_array(f.read())
+
+    def to_arrow(self) -> ty.Any:
+        """Convert to Arrow tables (trainers, pokemon, moves).
+
+        See `skypy.schemas.ZATrainerTables` for the layout.
+        """
+        from .za_columnar import trdata_array_to_arrow
+
+        return trdata_array_to_arrow(self)
+
+    @classmethod
+    def from_arrow(
+        cls, trainers: ty.Any, pokemon: ty.Any, moves: ty.Any
+    ) -> "ZATrainerDataArray":
+        """Build from Arrow tables (trainers, pokemon, moves).
+
+        See `skypy.schemas.ZATrainerTables` for the layout.
+        """
+        from .za_columnar import trdata_array_from_arrow
+
+        return trdata_array_from_arrow(trainers, pokemon, moves)
+
+    def to_polars(self) -> ty.Any:
+        """Convert to Polars data frames (trainers, pokemon, moves).
+
+        See `skypy.schemas.ZATrainerTables` for the layout.
+        """
+        from .za_columnar import trdata_array_to_polars
+
+        return trdata_array_to_polars(self)
+
+    @classmethod
+    def from_polars(
+        cls, trainers: ty.Any, pokemon: ty.Any, moves: ty.Any
+    ) -> "ZATrainerDataArray":
+        """Build from Polars data frames (trainers, pokemon, moves).
+
+        See `skypy.schemas.ZATrainerTables` for the layout.
+        """
+        from .za_columnar import trdata_array_from_polars
+
+        return trdata_array_from_polars(trainers, pokemon, moves)
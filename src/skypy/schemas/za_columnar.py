@@ -0,0 +1,273 @@
+__all__ = [
+    "CATEGORICAL_FIELDS",
+    "ZATrainerTables",
+    "trdata_array_to_arrow",
+    "trdata_array_from_arrow",
+    "trdata_array_to_polars",
+    "trdata_array_from_polars",
+]
+
+import functools
+import typing as ty
+
+import pydantic
+
+from .za import ZATrainerDataArray
+from .za_fbs import _PARAM_FBS, _POKE_FBS, _TRAINER_FBS, _WAZA_FBS, FbsField
+
+# Arrow and Polars are only imported by the functions using them
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+    import pyarrow as pa
+
+CATEGORICAL_FIELDS = frozenset(
+    {
+        "za_rank",
+        "dev_id",
+        "sex",
+        "item",
+        "ball_id",
+        "seikaku",
+        "tokusei",
+        "rare_type",
+        "waza_id",
+    }
+)
+"""Enum-like ID columns, dictionary-encoded in Arrow tables."""
+
+
+@functools.cache
+def _arrow_types() -> dict[str, "pa.DataType"]:
+    """Arrow types of the FlatBuffers scalar kinds and structs."""
+    import pyarrow as pa
+
+    return {
+        "bool": pa.bool_(),
+        "uint8": pa.uint8(),
+        "int16": pa.int16(),
+        "uint16": pa.uint16(),
+        "int32": pa.int32(),
+        "uint64": pa.uint64(),
+        "float32": pa.float32(),
+        "string": pa.string(),
+        _PARAM_FBS.name: pa.struct([(f.name, pa.int32()) for f in _PARAM_FBS.fields]),
+    }
+
+
+# Columns of each table, and the slots linking a table to its children
+_TRAINER_COLUMNS = tuple(f for f in _TRAINER_FBS.fields if f.kind != "table")
+_POKE_SLOTS = tuple(f for f in _TRAINER_FBS.fields if f.table is _POKE_FBS)
+_POKEMON_COLUMNS = tuple(f for f in _POKE_FBS.fields if f.table is not _WAZA_FBS)
+_WAZA_SLOTS = tuple(f for f in _POKE_FBS.fields if f.table is _WAZA_FBS)
+_MOVE_COLUMNS = _WAZA_FBS.fields
+
+
+class ZATrainerTables[T](ty.NamedTuple):
+    """Normalized, columnar layout of the trainer data.
+
+    - `trainers`: one row per trainer, keyed by `trainer_idx` (position in the array).
+    - `pokemon`: one row per Pokémon, keyed by `trainer_idx` and `slot` (1 to 6).
+    - `moves`: one row per move, keyed by `trainer_idx`, `slot` and `waza_slot`
+      (1 to 4).
+
+    Columns are named after the model attributes. A null value is a field that is not
+    set on the model, so it is left out of dumps exactly like `exclude_unset=True`.
+    Talent and effort values are struct columns.
+    """
+
+    trainers: T
+    pokemon: T
+    moves: T
+
+
+def trdata_array_to_arrow(
+    zatrdata: ZATrainerDataArray,
+) -> "ZATrainerTables[pa.Table]":
+    """Convert trainer data to Arrow tables.
+
+    Enum-like IDs (`CATEGORICAL_FIELDS`) and the `tr_id` of the child tables are
+    dictionary-encoded.
+
+    Args:
+        zatrdata (ZATrainerDataArray):
+            The trainer data.
+    """
+    trainers = _new_columns(("trainer_idx",), _TRAINER_COLUMNS)
+    pokemon = _new_columns(("trainer_idx", "tr_id", "slot"), _POKEMON_COLUMNS)
+    moves = _new_columns(("trainer_idx", "tr_id", "slot", "waza_slot"), _MOVE_COLUMNS)
+    for i, trainer in enumerate(zatrdata.values):
+        trainers["trainer_idx"].append(i)
+        _append_row(trainers, trainer, _TRAINER_COLUMNS)
+        trainer_set = trainer.model_fields_set
+        for slot, poke_field in enumerate(_POKE_SLOTS, start=1):
+            if poke_field.name not in trainer_set:
+                continue
+            poke = getattr(trainer, poke_field.name)
+            _append_keys(pokemon, i, trainer.tr_id, slot)
+            _append_row(pokemon, poke, _POKEMON_COLUMNS)
+            poke_set = poke.model_fields_set
+            for waza_slot, waza_field in enumerate(_WAZA_SLOTS, start=1):
+                if waza_field.name not in poke_set:
+                    continue
+                _append_keys(moves, i, trainer.tr_id, slot, waza_slot)
+                _append_row(moves, getattr(poke, waza_field.name), _MOVE_COLUMNS)
+
+    return ZATrainerTables(
+        trainers=_to_table(trainers, _TRAINER_COLUMNS),
+        pokemon=_to_table(pokemon, _POKEMON_COLUMNS),
+        moves=_to_table(moves, _MOVE_COLUMNS),
+    )
+
+
+def trdata_array_from_arrow(
+    trainers: "pa.Table",
+    pokemon: "pa.Table",
+    moves: "pa.Table",
+) -> ZATrainerDataArray:
+    """Build trainer data from Arrow tables laid out as `ZATrainerTables`.
+
+    Trainers are kept in the row order of `trainers`. Extra columns are ignored, and
+    columns may be plain or dictionary-encoded.
+
+    Args:
+        trainers (pa.Table):
+            Trainers table.
+
+        pokemon (pa.Table):
+            Pokémon table.
+
+        moves (pa.Table):
+            Moves table.
+    """
+    records: dict[int, dict[str, ty.Any]] = {}
+    for row in trainers.select(["trainer_idx", *_names(_TRAINER_COLUMNS)]).to_pylist():
+        i = row.pop("trainer_idx")
+        records[i] = _set_values(row)
+    for row in pokemon.select(
+        ["trainer_idx", "slot", *_names(_POKEMON_COLUMNS)]
+    ).to_pylist():
+        trainer = records[row.pop("trainer_idx")]
+        poke_field = _POKE_SLOTS[row.pop("slot") - 1]
+        trainer[poke_field.name] = _set_values(row)
+    for row in moves.select(
+        ["trainer_idx", "slot", "waza_slot", *_names(_MOVE_COLUMNS)]
+    ).to_pylist():
+        trainer = records[row.pop("trainer_idx")]
+        poke = trainer[_POKE_SLOTS[row.pop("slot") - 1].name]
+        waza_field = _WAZA_SLOTS[row.pop("waza_slot") - 1]
+        poke[waza_field.name] = _set_values(row)
+    return ZATrainerDataArray.model_validate({"values": list(records.values())})
+
+
+def trdata_array_to_polars(
+    zatrdata: ZATrainerDataArray,
+) -> "ZATrainerTables[pl.DataFrame]":
+    """Convert trainer data to Polars data frames.
+
+    Same layout as `trdata_array_to_arrow()`, with `tr_id` as a categorical column.
+
+    Args:
+        zatrdata (ZATrainerDataArray):
+            The trainer data.
+    """
+    tables = trdata_array_to_arrow(zatrdata)
+    return ZATrainerTables(*(_to_polars(table) for table in tables))
+
+
+def trdata_array_from_polars(
+    trainers: "pl.DataFrame",
+    pokemon: "pl.DataFrame",
+    moves: "pl.DataFrame",
+) -> ZATrainerDataArray:
+    """Build trainer data from Polars data frames laid out as `ZATrainerTables`.
+
+    Args:
+        trainers (pl.DataFrame):
+            Trainers data frame.
+
+        pokemon (pl.DataFrame):
+            Pokémon data frame.
+
+        moves (pl.DataFrame):
+            Moves data frame.
+    """
+    return trdata_array_from_arrow(
+        trainers.to_arrow(), pokemon.to_arrow(), moves.to_arrow()
+    )
+
+
+def _names(fields: tuple[FbsField, ...]) -> list[str]:
+    """Names of the fields."""
+    return [field.name for field in fields]
+
+
+def _new_columns(
+    keys: tuple[str, ...],
+    fields: tuple[FbsField, ...],
+) -> dict[str, list]:
+    """Empty columns for the keys and fields of a table."""
+    return {name: [] for name in (*keys, *_names(fields))}
+
+
+def _append_keys(columns: dict[str, list], *keys: ty.Any) -> None:
+    """Append the key values of a row, in column order."""
+    for name, value in zip(columns, keys):
+        columns[name].append(value)
+
+
+def _append_row(
+    columns: dict[str, list],
+    obj: pydantic.BaseModel,
+    fields: tuple[FbsField, ...],
+) -> None:
+    """Append the fields of a model, with `None` for the fields that are not set."""
+    fields_set = obj.model_fields_set
+    for field in fields:
+        value = getattr(obj, field.name) if field.name in fields_set else None
+        if isinstance(value, pydantic.BaseModel):
+            value = value.model_dump(exclude_unset=True)
+        columns[field.name].append(value)
+
+
+def _to_table(columns: dict[str, list], fields: tuple[FbsField, ...]) -> "pa.Table":
+    """Build a table, typing and dictionary-encoding the columns."""
+    import pyarrow as pa
+
+    arrow_types = _arrow_types()
+    types = {
+        field.name: arrow_types[field.table.name if field.table else field.kind]
+        for field in fields
+    }
+    arrays: dict[str, pa.Array] = {}
+    for name, values in columns.items():
+        if name in types:
+            array = pa.array(values, type=types[name])
+            if name in CATEGORICAL_FIELDS:
+                array = array.dictionary_encode()
+        elif name == "tr_id":
+            # Key of a child table
+            array = pa.array(values, type=pa.string()).dictionary_encode()
+        elif name == "trainer_idx":
+            array = pa.array(values, type=pa.int32())
+        else:
+            array = pa.array(values, type=pa.uint8())
+        arrays[name] = array
+    return pa.table(arrays)
+
+
+def _to_polars(table: "pa.Table") -> "pl.DataFrame":
+    """Convert a table to Polars, decoding dictionary-encoded IDs to integers."""
+    import polars as pl
+
+    df = pl.from_arrow(table)
+    assert isinstance(df, pl.DataFrame)
+    return df
+
+
+def _set_values(row: dict[str, ty.Any]) -> dict[str, ty.Any]:
+    """Drop the `None` values of a row (fields that are not set), recursively."""
+    return {
+        key: _set_values(value) if isinstance(value, dict) else value
+        for key, value in row.items()
+        if value is not None
+    }
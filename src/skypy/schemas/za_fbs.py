@@ -0,0 +1,488 @@
+__all__ = [
+    "FbsField",
+    "FbsTable",
+    "ZA_TRDATA_ARRAY_FBS",
+    "BFBS_BASE_TYPES",
+    "check_bfbs_layout",
+    "resolve_bfbs_file",
+    "encode_trdata_array",
+    "decode_trdata_array",
+    "trdata_array_from_fbs_json",
+    "trdata_array_to_fbs_json",
+]
+
+import os
+import typing as ty
+
+import flatbuffers
+import pydantic
+from flatbuffers import number_types
+from flatbuffers.table import Table
+from loguru import logger
+
+from skypy import settings
+from skypy._settings import lookup_tables
+
+from .za import (
+    ZAEffortTalentValues,
+    ZAPokemonData,
+    ZATrainerData,
+    ZATrainerDataArray,
+    ZAWazaData,
+)
+
+SCALAR_FLAGS: dict[str, type] = {
+    "bool": number_types.BoolFlags,
+    "uint8": number_types.Uint8Flags,
+    "int16": number_types.Int16Flags,
+    "uint16": number_types.Uint16Flags,
+    "int32": number_types.Int32Flags,
+    "uint64": number_types.Uint64Flags,
+    "float32": number_types.Float32Flags,
+}
+SCALAR_DEFAULTS: dict[str, ty.Any] = {
+    "bool": False,
+    "uint8": 0,
+    "int16": 0,
+    "uint16": 0,
+    "int32": 0,
+    "uint64": 0,
+    "float32": 0.0,
+}
+
+BFBS_BASE_TYPES: dict[str, int] = {
+    "bool": 2,
+    "uint8": 4,
+    "int16": 5,
+    "uint16": 6,
+    "int32": 7,
+    "uint64": 10,
+    "float32": 11,
+    "string": 13,
+    "vector": 14,
+    "table": 15,
+}
+"""`reflection.BaseType` of each field kind, as stored in a `.bfbs` binary schema."""
+
+
+class FbsField(ty.NamedTuple):
+    """A field of a FlatBuffers table."""
+
+    name: str
+    """Attribute name on the pydantic model."""
+    fbs_name: str
+    """Field name in the FlatBuffers schema."""
+    kind: str
+    """Scalar type name, or `"string"`, `"table"`, `"vector"`."""
+    table: ty.Optional["FbsTable"] = None
+    """Layout of the child table(s), for `"table"` and `"vector"` fields."""
+
+
+class FbsTable(ty.NamedTuple):
+    """A FlatBuffers table, bound to the pydantic model it is decoded into."""
+
+    name: str
+    model: type[pydantic.BaseModel]
+    fields: tuple[FbsField, ...]
+
+    @property
+    def is_leaf(self) -> bool:
+        """Whether the table only holds scalars."""
+        return all(f.kind in SCALAR_FLAGS for f in self.fields)
+
+
+def vtable_offset(slot: int) -> int:
+    """Offset of a field slot in a vtable."""
+    return 4 + 2 * slot
+
+
+# Layout of the `trdata_array` schema. The position of a field in `fields` is its
+# vtable slot, `fbs_name` is its name in the schema (as printed by
+# `flatc --json --raw-binary`, see `assets/za/Raw/trdata_array.json`).
+# All scalars default to `0`/`False` in the schema.
+_PARAM_FBS = FbsTable(
+    "ParamSet",
+    ZAEffortTalentValues,
+    tuple(
+        FbsField(name, name, "int32")
+        for name in ("HP", "ATK", "DEF", "SPA", "SPD", "SPE")
+    ),
+)
+_WAZA_FBS = FbsTable(
+    "WazaSet",
+    ZAWazaData,
+    (
+        FbsField("waza_id", "WazaId", "uint16"),
+        FbsField("is_plus_waza", "IsPlusWaza", "bool"),
+    ),
+)
+_POKE_FBS = FbsTable(
+    "PokeData",
+    ZAPokemonData,
+    (
+        FbsField("dev_id", "DevId", "uint16"),
+        FbsField("form_id", "FormId", "int16"),
+        FbsField("sex", "Sex", "int32"),
+        FbsField("item", "Item", "uint16"),
+        FbsField("level", "Level", "int32"),
+        FbsField("ball_id", "BallId", "int32"),
+        FbsField("waza_1", "Waza1", "table", _WAZA_FBS),
+        FbsField("waza_2", "Waza2", "table", _WAZA_FBS),
+        FbsField("waza_3", "Waza3", "table", _WAZA_FBS),
+        FbsField("waza_4", "Waza4", "table", _WAZA_FBS),
+        FbsField("seikaku", "Seikaku", "int32"),
+        FbsField("tokusei", "Tokusei", "int32"),
+        FbsField("talent_value", "TalentValue", "table", _PARAM_FBS),
+        FbsField("effort_value", "EffortValue", "table", _PARAM_FBS),
+        FbsField("rare_type", "RareType", "int32"),
+        FbsField("scale_value", "ScaleValue", "int32"),
+    ),
+)
+_TRAINER_FBS = FbsTable(
+    "TrainerData",
+    ZATrainerData,
+    (
+        FbsField("tr_id", "TrId", "string"),
+        FbsField("tr_type", "TrType", "uint64"),
+        FbsField("tr_type_2", "TrType2", "uint64"),
+        FbsField("za_rank", "ZARank", "int32"),
+        FbsField("money_rate", "MoneyRate", "int32"),
+        FbsField("meg_evolution", "MegEvolution", "bool"),
+        FbsField("last_hand", "LastHandMega", "bool"),
+        *(FbsField(f"poke_{i}", f"Poke{i}", "table", _POKE_FBS) for i in range(1, 7)),
+        FbsField("ai_basic", "AiBasic", "bool"),
+        FbsField("ai_high", "AiHigh", "bool"),
+        FbsField("ai_expert", "AiExpert", "bool"),
+        FbsField("ai_double", "AiDouble", "bool"),
+        FbsField("ai_raid", "AiRaid", "bool"),
+        FbsField("ai_weak", "AiWeak", "bool"),
+        FbsField("ai_item", "AiItem", "bool"),
+        FbsField("ai_change", "AiChange", "bool"),
+        FbsField("view_horizontal_angle", "ViewHorizontalAngle", "float32"),
+        FbsField("view_vertical_angle", "ViewVerticalAngle", "float32"),
+        FbsField("view_range", "ViewRange", "float32"),
+        FbsField("hearing_range", "HearingRange", "float32"),
+    ),
+)
+ZA_TRDATA_ARRAY_FBS = FbsTable(
+    "TrainerDataArray",
+    ZATrainerDataArray,
+    (FbsField("values", "Table", "vector", _TRAINER_FBS),),
+)
+
+
+def resolve_bfbs_file(bfbs_file: str | None = None) -> str | None:
+    """Binary schema to check the layout against, see `check_bfbs_layout()`.
+
+    Args:
+        bfbs_file (str, optional):
+            Path of the `.bfbs` file. The default, `settings.files.za_trainers_bfbs_file`,
+            is only used if it exists.
+
+    Returns:
+        str | None: The path, or `None` if there is no schema to check against.
+    """
+    default = settings.files.za_trainers_bfbs_file
+    if not bfbs_file or os.path.abspath(bfbs_file) == os.path.abspath(default):
+        return default if os.path.exists(default) else None
+    return bfbs_file
+
+
+def check_bfbs_layout(
+    bfbs: str | bytes,
+    spec: FbsTable = ZA_TRDATA_ARRAY_FBS,
+) -> None:
+    """Check a layout against the game's binary schema (`flatc --binary --schema`).
+
+    Starting from the root table of the schema, each field must have the slot, name,
+    type and default (`0`) the layout gives it, so the encoder writes what the game
+    reads. Results are cached until the file changes.
+
+    Args:
+        bfbs (str | bytes):
+            Path or content of the `.bfbs` file.
+
+        spec (FbsTable):
+            The layout. Defaults to `ZA_TRDATA_ARRAY_FBS`.
+
+    Raises:
+        ValueError: If the file is not a binary schema, or does not match the layout.
+    """
+    if isinstance(bfbs, str):
+        lookup_tables.get(bfbs, f"bfbs_layout.{spec.name}", lambda p: _check(p, spec))
+    else:
+        _check(bfbs, spec)
+
+
+def _check(bfbs: str | bytes, spec: FbsTable) -> bool:
+    """Check a layout against a binary schema, see `check_bfbs_layout()`."""
+    source = "Binary schema"
+    if isinstance(bfbs, str):
+        source = bfbs
+        with open(bfbs, "rb") as f:
+            bfbs = f.read()
+    if len(bfbs) < 8 or bfbs[4:8] != b"BFBS":
+        raise ValueError(f"{source} is not a FlatBuffers binary schema (.bfbs).")
+    schema = Table(bytearray(bfbs), 0)
+    schema.Pos = schema.Indirect(0)
+    objects = _bfbs_tables(schema, 0)
+    root = _bfbs_table(schema, 4)
+    if root is None:
+        raise ValueError(f"{source} has no root table.")
+    errors: list[str] = []
+    _check_table(spec, root, objects, errors, set())
+    if errors:
+        raise ValueError(
+            f"{source} does not match the layout of {spec.name}:\n  - "
+            + "\n  - ".join(errors)
+        )
+    logger.trace(f"{source} matches the layout of {spec.name}.")
+    return True
+
+
+def _check_table(
+    spec: FbsTable,
+    obj: Table,
+    objects: list[Table],
+    errors: list[str],
+    seen: set[str],
+) -> None:
+    """Compare the fields of a `reflection.Object` with a layout, recursively."""
+    if spec.name in seen:
+        return
+    seen.add(spec.name)
+    name = _bfbs_string(obj, 0)
+    schema_fields: dict[int, Table] = {}
+    for field in _bfbs_tables(obj, 1):
+        if not _bfbs_scalar(field, 6, number_types.BoolFlags, False):  # deprecated
+            schema_fields[_bfbs_scalar(field, 2, number_types.Uint16Flags, 0)] = field
+    for slot, field in enumerate(spec.fields):
+        where = f"{name}.{field.fbs_name}"
+        schema_field = schema_fields.pop(slot, None)
+        if schema_field is None:
+            errors.append(f"{where}: no field in slot {slot}")
+            continue
+        fbs_name = _bfbs_string(schema_field, 0)
+        if fbs_name != field.fbs_name:
+            errors.append(f"{where}: slot {slot} is {fbs_name!r}")
+        type_ = _bfbs_table(schema_field, 1)
+        assert type_ is not None  # required
+        base_type = _bfbs_scalar(type_, 0, number_types.Int8Flags, 0)
+        element = _bfbs_scalar(type_, 1, number_types.Int8Flags, 0)
+        index = _bfbs_scalar(type_, 2, number_types.Int32Flags, -1)
+        expected = BFBS_BASE_TYPES[field.kind]
+        if base_type != expected:
+            errors.append(f"{where}: {field.kind} in the layout, type {base_type}")
+        elif field.kind == "vector" and element != BFBS_BASE_TYPES["table"]:
+            errors.append(f"{where}: vector of tables in the layout, type {element}")
+        elif field.kind in SCALAR_FLAGS and (
+            _bfbs_scalar(schema_field, 4, number_types.Int64Flags, 0)
+            or _bfbs_scalar(schema_field, 5, number_types.Float64Flags, 0.0)
+        ):
+            errors.append(f"{where}: the default is not 0")
+        elif field.table is not None and 0 <= index < len(objects):
+            _check_table(field.table, objects[index], objects, errors, seen)
+    for schema_field in schema_fields.values():
+        errors.append(f"{name}.{_bfbs_string(schema_field, 0)}: not in the layout")
+
+
+def _bfbs_scalar(table: Table, slot: int, flags: type, default: ty.Any) -> ty.Any:
+    """Scalar field of a table of the binary schema."""
+    offset = table.Offset(vtable_offset(slot))
+    return table.Get(flags, table.Pos + offset) if offset else default
+
+
+def _bfbs_string(table: Table, slot: int) -> str:
+    """String field of a table of the binary schema."""
+    offset = table.Offset(vtable_offset(slot))
+    return table.String(table.Pos + offset).decode("utf-8") if offset else ""
+
+
+def _bfbs_table(table: Table, slot: int) -> Table | None:
+    """Table field of a table of the binary schema."""
+    offset = table.Offset(vtable_offset(slot))
+    return Table(table.Bytes, table.Indirect(table.Pos + offset)) if offset else None
+
+
+def _bfbs_tables(table: Table, slot: int) -> list[Table]:
+    """Vector of tables field of a table of the binary schema."""
+    offset = table.Offset(vtable_offset(slot))
+    if not offset:
+        return []
+    start = table.Vector(offset)
+    return [
+        Table(table.Bytes, table.Indirect(start + 4 * i))
+        for i in range(table.VectorLen(offset))
+    ]
+
+
+def encode_trdata_array(zatrdata: ZATrainerDataArray) -> bytes:
+    """Encode trainer data to the `trdata_array.bin` FlatBuffers binary.
+
+    Only the fields set on the models are written, exactly like dumping them to JSON
+    with `exclude_unset=True` and running `flatc -b` on the result.
+    Identical tables made of scalars only (e.g. empty moves) are written once and
+    shared, which keeps both the encoding time and the file size down.
+
+    Args:
+        zatrdata (ZATrainerDataArray):
+            The trainer data.
+
+    Returns:
+        bytes: The binary.
+    """
+    builder = flatbuffers.Builder(1024 * 1024)
+    root = _encode_table(builder, ZA_TRDATA_ARRAY_FBS, zatrdata, {})
+    builder.Finish(root)
+    return bytes(builder.Output())
+
+
+def decode_trdata_array(buf: bytes | bytearray | memoryview) -> ZATrainerDataArray:
+    """Decode a `trdata_array.bin` FlatBuffers binary.
+
+    Every field present in a table is set on the models, and scalars missing from a
+    table are set to the schema default (`0`), so the models hold the values the
+    game reads rather than the pydantic defaults.
+
+    Args:
+        buf (bytes | bytearray | memoryview):
+            The binary.
+    """
+    root = Table(buf, 0)
+    root.Pos = root.Indirect(0)
+    data = _decode_table(root, ZA_TRDATA_ARRAY_FBS)
+    return ZATrainerDataArray.model_validate(data)
+
+
+def trdata_array_from_fbs_json(data: dict[str, ty.Any]) -> ZATrainerDataArray:
+    """Parse the JSON printed by `flatc --json` (schema field names, e.g. `TrId`).
+
+    Args:
+        data (dict[str, Any]):
+            The JSON data, e.g. `assets/za/Raw/trdata_array.json`.
+    """
+    return ZATrainerDataArray.model_validate(_from_fbs_json(ZA_TRDATA_ARRAY_FBS, data))
+
+
+def trdata_array_to_fbs_json(zatrdata: ZATrainerDataArray) -> dict[str, ty.Any]:
+    """Convert trainer data to the JSON printed by `flatc --json --defaults-json`.
+
+    Unset fields are printed with their schema default, as the game would read them.
+
+    Args:
+        zatrdata (ZATrainerDataArray):
+            The trainer data.
+    """
+    return _to_fbs_json(ZA_TRDATA_ARRAY_FBS, zatrdata)
+
+
+def _encode_table(
+    builder: flatbuffers.Builder,
+    spec: FbsTable,
+    obj: pydantic.BaseModel,
+    shared: dict[tuple, int],
+) -> int:
+    """Encode a model as a table, children first, and return its offset."""
+    fields_set = obj.model_fields_set
+    children: list[tuple[int, int]] = []
+    scalars: list[tuple[int, str, ty.Any]] = []
+    for slot, field in enumerate(spec.fields):
+        if field.name not in fields_set:
+            continue
+        value = getattr(obj, field.name)
+        if field.kind == "string":
+            children.append((slot, builder.CreateString(value)))
+        elif field.kind == "table":
+            assert field.table is not None
+            children.append((slot, _encode_table(builder, field.table, value, shared)))
+        elif field.kind == "vector":
+            assert field.table is not None
+            offsets = [_encode_table(builder, field.table, v, shared) for v in value]
+            builder.StartVector(4, len(offsets), 4)
+            for offset in reversed(offsets):
+                builder.PrependUOffsetTRelative(offset)
+            children.append((slot, builder.EndVector()))
+        elif value != SCALAR_DEFAULTS[field.kind]:
+            scalars.append((slot, field.kind, value))
+
+    key = (spec.name, tuple(scalars))
+    if spec.is_leaf and key in shared:
+        return shared[key]
+    builder.StartObject(len(spec.fields))
+    for slot, child in children:
+        builder.PrependUOffsetTRelativeSlot(slot, child, 0)
+    for slot, kind, value in scalars:
+        builder.PrependSlot(SCALAR_FLAGS[kind], slot, value, SCALAR_DEFAULTS[kind])
+    offset = int(builder.EndObject())
+    if spec.is_leaf:
+        shared[key] = offset
+    return offset
+
+
+def _decode_table(table: Table, spec: FbsTable) -> dict[str, ty.Any]:
+    """Decode a table into a dictionary keyed by model attribute names."""
+    data: dict[str, ty.Any] = {}
+    for slot, field in enumerate(spec.fields):
+        offset = table.Offset(vtable_offset(slot))
+        if field.kind in SCALAR_FLAGS:
+            if offset:
+                flags = SCALAR_FLAGS[field.kind]
+                data[field.name] = table.Get(flags, table.Pos + offset)
+            else:
+                data[field.name] = SCALAR_DEFAULTS[field.kind]
+        elif not offset:
+            continue
+        elif field.kind == "string":
+            data[field.name] = table.String(table.Pos + offset).decode("utf-8")
+        elif field.kind == "table":
+            assert field.table is not None
+            child = Table(table.Bytes, table.Indirect(table.Pos + offset))
+            data[field.name] = _decode_table(child, field.table)
+        elif field.kind == "vector":
+            assert field.table is not None
+            start = table.Vector(offset)
+            data[field.name] = [
+                _decode_table(
+                    Table(table.Bytes, table.Indirect(start + 4 * i)), field.table
+                )
+                for i in range(table.VectorLen(offset))
+            ]
+    return data
+
+
+def _from_fbs_json(spec: FbsTable, data: dict[str, ty.Any]) -> dict[str, ty.Any]:
+    """Rename the keys of `flatc --json` output to model attribute names."""
+    out: dict[str, ty.Any] = {}
+    for field in spec.fields:
+        if field.fbs_name not in data:
+            continue
+        value = data[field.fbs_name]
+        if field.kind == "table":
+            assert field.table is not None
+            value = _from_fbs_json(field.table, value)
+        elif field.kind == "vector":
+            assert field.table is not None
+            value = [_from_fbs_json(field.table, v) for v in value]
+        out[field.name] = value
+    return out
+
+
+def _to_fbs_json(spec: FbsTable, obj: pydantic.BaseModel) -> dict[str, ty.Any]:
+    """Convert a model to `flatc --json --defaults-json` output."""
+    fields_set = obj.model_fields_set
+    out: dict[str, ty.Any] = {}
+    for field in spec.fields:
+        is_set = field.name in fields_set
+        value = getattr(obj, field.name)
+        if field.kind == "table":
+            assert field.table is not None
+            if is_set:
+                out[field.fbs_name] = _to_fbs_json(field.table, value)
+        elif field.kind == "vector":
+            assert field.table is not None
+            out[field.fbs_name] = [_to_fbs_json(field.table, v) for v in value]
+        elif field.kind == "string":
+            out[field.fbs_name] = value if is_set else ""
+        else:
+            out[field.fbs_name] = value if is_set else SCALAR_DEFAULTS[field.kind]
+    return out
@@ -0,0 +1,249 @@
+__all__ = ["FbsView", "FbsVectorView", "ZATrainerDataReader"]
+
+import functools
+import mmap
+import typing as ty
+
+import pydantic
+from flatbuffers.table import Table
+
+from .za import ZATrainerDataArray
+from .za_fbs import (
+    SCALAR_DEFAULTS,
+    SCALAR_FLAGS,
+    ZA_TRDATA_ARRAY_FBS,
+    FbsField,
+    FbsTable,
+    _decode_table,
+    vtable_offset,
+)
+
+
+@functools.cache
+def _field_slots(spec: FbsTable) -> dict[str, tuple[int, FbsField]]:
+    """Slot and field of each model attribute name of a table."""
+    return {field.name: (slot, field) for slot, field in enumerate(spec.fields)}
+
+
+class FbsView:
+    """Lazy, read-only view over a FlatBuffers table.
+
+    Fields are read from the underlying buffer when accessed, using the model
+    attribute names (e.g. `view.poke_1.waza_1.waza_id`), and nothing is copied or
+    validated until `to_model()` is called. Scalars missing from the table read as the
+    schema default, sub-tables and strings missing from the table read as `None`.
+    """
+
+    __slots__ = ("_spec", "_table")
+
+    def __init__(self, table: Table, spec: FbsTable) -> None:
+        """Args:
+        table (Table):
+            The table, positioned on the buffer.
+
+        spec (FbsTable):
+            Layout of the table.
+        """
+        self._table = table
+        self._spec = spec
+
+    def __getattr__(self, name: str) -> ty.Any:
+        """Read a field from the buffer."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            slot, field = _field_slots(self._spec)[name]
+        except KeyError:
+            raise AttributeError(
+                f"{self._spec.name!r} has no field {name!r}."
+            ) from None
+        table = self._table
+        offset = table.Offset(vtable_offset(slot))
+        if field.kind in SCALAR_FLAGS:
+            if not offset:
+                return SCALAR_DEFAULTS[field.kind]
+            return table.Get(SCALAR_FLAGS[field.kind], table.Pos + offset)
+        if not offset:
+            return None
+        if field.kind == "string":
+            return table.String(table.Pos + offset).decode("utf-8")
+        assert field.table is not None
+        if field.kind == "table":
+            child = Table(table.Bytes, table.Indirect(table.Pos + offset))
+            return FbsView(child, field.table)
+        return FbsVectorView(table, offset, field.table)
+
+    def __dir__(self) -> list[str]:
+        """Field names, for completion."""
+        return list(_field_slots(self._spec))
+
+    def __repr__(self) -> str:
+        """Representation, without reading the fields."""
+        return f"{self.__class__.__name__}({self._spec.name}@{self._table.Pos})"
+
+    def has_field(self, name: str) -> bool:
+        """Whether the field is present in the buffer (i.e. it was set when encoded)."""
+        slot, _ = _field_slots(self._spec)[name]
+        return bool(self._table.Offset(vtable_offset(slot)))
+
+    def to_dict(self) -> dict[str, ty.Any]:
+        """Decode the whole table, keyed by model attribute names."""
+        return _decode_table(self._table, self._spec)
+
+    def to_model(self) -> pydantic.BaseModel:
+        """Decode and validate the whole table into its pydantic model."""
+        return self._spec.model.model_validate(self.to_dict())
+
+
+class FbsVectorView(ty.Sequence[FbsView]):
+    """Lazy, read-only view over a vector of FlatBuffers tables."""
+
+    def __init__(self, table: Table, offset: int, spec: FbsTable) -> None:
+        """Args:
+        table (Table):
+            The table holding the vector.
+
+        offset (int):
+            Offset of the vector field in the table.
+
+        spec (FbsTable):
+            Layout of the items.
+        """
+        self._table = table
+        self._start = int(table.Vector(offset))
+        self._length = int(table.VectorLen(offset))
+        self._spec = spec
+
+    def __len__(self) -> int:
+        """Number of items."""
+        return self._length
+
+    @ty.overload
+    def __getitem__(self, index: int) -> FbsView: ...
+
+    @ty.overload
+    def __getitem__(self, index: slice) -> list[FbsView]: ...
+
+    def __getitem__(self, index: int | slice) -> FbsView | list[FbsView]:
+        """Get an item (or a list of items) by position."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        position = index + self._length if index < 0 else index
+        if not 0 <= position < self._length:
+            raise IndexError(f"Index {index} out of range ({self._length}).")
+        table = self._table
+        return FbsView(
+            Table(table.Bytes, table.Indirect(self._start + 4 * position)), self._spec
+        )
+
+
+class ZATrainerDataReader:
+    """Zero-copy reader for a `trdata_array.bin` FlatBuffers binary.
+
+    The file is memory-mapped and trainers, Pokémon and moves are exposed as lazy
+    `FbsView`s: only the fields that are read are decoded, so listing the trainer IDs
+    or reading a few fields does not parse the whole file.
+
+    Views read from the mapped file, so they must not be used after `close()`.
+
+    Example:
+        >>> with ZATrainerDataReader("trdata_array.bin") as reader:
+        ...     reader["00_test_data"].poke_1.level
+    """
+
+    def __init__(self, path: str | None = None, buf: ty.Any = None) -> None:
+        """Args:
+        path (str, optional):
+            Path to the binary. It is memory-mapped.
+
+        buf (bytes-like, optional):
+            The binary, if already in memory. Exactly one of `path` and `buf` must
+            be given.
+        """
+        if (path is None) == (buf is None):
+            raise ValueError("Exactly one of `path` and `buf` must be given.")
+        self.path = path
+        self._mmap: mmap.mmap | None = None
+        if path is not None:
+            with open(path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            buf = self._mmap
+        root = Table(buf, 0)
+        root.Pos = root.Indirect(0)
+        self.root = FbsView(root, ZA_TRDATA_ARRAY_FBS)
+        self._positions: dict[str, int] | None = None
+
+    def __enter__(self) -> "ZATrainerDataReader":
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Close the file on exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of trainers."""
+        return len(self.trainers)
+
+    def __iter__(self) -> ty.Iterator[FbsView]:
+        """Iterate over the trainers."""
+        return iter(self.trainers)
+
+    def __contains__(self, trid: object) -> bool:
+        """Whether a trainer with this ID exists."""
+        return trid in self.positions
+
+    def __getitem__(self, key: str | int) -> FbsView:
+        """Get a trainer by ID, or by position if `key` is an integer."""
+        if isinstance(key, int):
+            return self.trainers[key]
+        return self.get_trainer(key)
+
+    @functools.cached_property
+    def trainers(self) -> FbsVectorView:
+        """Lazy view over the trainers."""
+        trainers: FbsVectorView | None = self.root.values
+        if trainers is None:
+            raise ValueError("The binary holds no trainer table.")
+        return trainers
+
+    @property
+    def positions(self) -> dict[str, int]:
+        """Position of each trainer ID. Only the IDs are read to build it."""
+        if self._positions is None:
+            self._positions = {}
+            for i, trainer in enumerate(self.trainers):
+                self._positions.setdefault(trainer.tr_id, i)
+        return self._positions
+
+    @property
+    def tr_ids(self) -> list[str]:
+        """All trainer IDs, in file order."""
+        return [trainer.tr_id for trainer in self.trainers]
+
+    def get_trainer(self, trid: str) -> FbsView:
+        """Get a trainer by ID.
+
+        Args:
+            trid (str):
+                Trainer ID.
+
+        Raises:
+            ValueError: If there is no trainer with this ID.
+        """
+        try:
+            return self.trainers[self.positions[trid]]
+        except KeyError:
+            raise ValueError(f"Trainer with ID {trid} not found.") from None
+
+    def to_model(self) -> ZATrainerDataArray:
+        """Decode and validate the whole file."""
+        model = self.root.to_model()
+        assert isinstance(model, ZATrainerDataArray)
+        return model
+
+    def close(self) -> None:
+        """Close the memory-mapped file, if any."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
@@ -0,0 +1,302 @@
+__all__ = [
+    "PERSONAL_ARRAY_FILE",
+    "LEARN_SOURCES",
+    "ZAPersonalTables",
+    "parse_personal_array",
+    "load_personal_array",
+]
+
+import os
+import typing as ty
+
+from loguru import logger
+
+from skypy import settings
+from skypy._settings import lookup_tables
+
+# Arrow and Polars are only imported by the functions using them
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+
+PERSONAL_ARRAY_FILE = "personal_array.txt"
+"""Name of the personal table, in `settings.files.za_raw_assets`."""
+
+LEARN_SOURCES = ("level_up", "machine", "egg", "reminder")
+"""How a move is learned, the `source` column of `ZAPersonalTables.learnset`."""
+
+# Bumped whenever the layout of the sidecar changes, so stale sidecars are rebuilt
+_SIDECAR_VERSION = "1"
+_SIDECAR_EXT = ".arrow"
+_KEYS = ("dev_id", "form_id")
+_STATS = ("HP", "ATK", "DEF", "SPA", "SPD", "SPE")
+# Positions in the `|`-separated cells. The other values of `Info` are not mapped.
+_INFO = {
+    "dev_id": 0,
+    "form_id": 1,
+    "national_dex": 2,
+    "color": 3,
+    "height": 5,
+    "weight": 6,
+}
+_SCALARS = {
+    "IsPresentInGame": "is_present",
+    "Dex": "dex",
+    "Type1": "type_1",
+    "Type2": "type_2",
+    "Ability1": "ability_1",
+    "Ability2": "ability_2",
+    "AbilityH": "ability_h",
+    "EXPGrowth": "exp_growth",
+    "CatchRate": "catch_rate",
+    "EggGroup1": "egg_group_1",
+    "EggGroup2": "egg_group_2",
+    "HatchCycles": "hatch_cycles",
+    "BaseFriendship": "base_friendship",
+    "BaseEXPAddend": "base_exp",
+    "EvoStage": "evo_stage",
+    "IsTypeChangeDisallowed": "is_type_change_disallowed",
+}
+_FLAGS = ("IsPresentInGame", "IsTypeChangeDisallowed")
+# Columns holding lists of entries, each entry the given number of values
+_EVOLUTION = {
+    "level": 0,
+    "method": 1,
+    "argument": 2,
+    "into_dev_id": 6,
+    "into_form_id": 7,
+}
+_EVOLUTION_SIZE = 8
+_LEARNSET = {"waza_id": 0, "level": 1, "plus_level": 2}
+_LEARNSET_SIZE = 3
+_MOVE_LISTS = {
+    "TechnicalMachine": "machine",
+    "EggMoves": "egg",
+    "ReminderMoves": "reminder",
+}
+_LISTS = ("Evolutions", "Learnset", *_MOVE_LISTS)
+
+
+class ZAPersonalTables(ty.NamedTuple):
+    """Columnar layout of the personal table (`personal_array.txt`).
+
+    - `species`: one row per species form, keyed by `dev_id` and `form_id`, as the
+      Pokémon of the trainer data. Base stats and EV yields are struct columns.
+    - `evolutions`: one row per evolution, keyed by `dev_id` and `form_id`, the species
+      evolving into `into_dev_id` and `into_form_id`.
+    - `learnset`: one row per move a species form can learn, keyed by `dev_id` and
+      `form_id`. `source` is one of `LEARN_SOURCES`, `level` and `plus_level` are only
+      set for `level_up` moves.
+    """
+
+    species: "pl.DataFrame"
+    evolutions: "pl.DataFrame"
+    learnset: "pl.DataFrame"
+
+    def get_species(self, dev_id: int, form_id: int = 0) -> dict[str, ty.Any]:
+        """Get the row of a species form.
+
+        Raises:
+            KeyError: If the species form is not in the table.
+        """
+        import polars as pl
+
+        rows = self.species.filter(
+            (pl.col("dev_id") == dev_id) & (pl.col("form_id") == form_id)
+        )
+        if rows.is_empty():
+            raise KeyError((dev_id, form_id))
+        return rows.row(0, named=True)
+
+
+def parse_personal_array(source: str | bytes) -> ZAPersonalTables:
+    """Parse the personal table, a TSV file whose cells pack arrays with `|`.
+
+    Cells are split and cast column by column, and the entries of the evolution and
+    move columns are exploded into their own tables, without a Python loop over rows.
+
+    Args:
+        source (str | bytes):
+            Path of the file, or its content.
+    """
+    return _to_tables(_parse_nested(source))
+
+
+def load_personal_array(
+    path: str | None = None,
+    sidecar: bool = True,
+) -> ZAPersonalTables:
+    """Load the personal table, cached until the file changes.
+
+    The parsed tables are also cached to an Arrow IPC sidecar next to the file (e.g.
+    `personal_array.species.arrow`), so that later processes memory-map them instead of
+    parsing the text again. The sidecar records the size and modification time of the file it
+    was built from, and is rebuilt when they change. Failing to write it is not an
+    error.
+
+    Args:
+        path (str, optional):
+            Path of the file. Defaults to `personal_array.txt` in
+            `settings.files.za_raw_assets`.
+
+        sidecar (bool):
+            Whether to read and write the sidecar.
+    """
+    if path is None:
+        path = os.path.join(settings.files.za_raw_assets, PERSONAL_ARRAY_FILE)
+
+    def _load(filename: str) -> ZAPersonalTables:
+        tables = _read_sidecar(filename) if sidecar else None
+        if tables is None:
+            tables = parse_personal_array(filename)
+            if sidecar:
+                _write_sidecar(filename, tables)
+        return tables
+
+    return lookup_tables.get(path, f"personal:{sidecar}", _load)
+
+
+def _sidecar_paths(path: str) -> dict[str, str]:
+    """Paths of the sidecar files of a personal table, one per table."""
+    stem = os.path.splitext(path)[0]
+    return {name: f"{stem}.{name}{_SIDECAR_EXT}" for name in ZAPersonalTables._fields}
+
+
+def _parse_nested(source: str | bytes) -> "pl.DataFrame":
+    """Parse the file into one row per species form, with the entries of the evolution
+    and move columns as flat lists of integers.
+    """
+    import polars as pl
+
+    raw = pl.read_csv(
+        source,
+        separator="\t",
+        infer_schema=False,
+        quote_char=None,
+        # Trailing empty cells may be left out
+        truncate_ragged_lines=True,
+    )
+
+    def split(column: str) -> pl.Expr:
+        return pl.col(column).str.split("|").cast(pl.List(pl.Int32))
+
+    def stats(column: str) -> pl.Expr:
+        return pl.struct(
+            [split(column).list.get(i).alias(stat) for i, stat in enumerate(_STATS)]
+        )
+
+    gender = pl.col("Gender").str.split("|")
+    nested = raw.select(
+        *[split("Info").list.get(i).alias(name) for name, i in _INFO.items()],
+        *[
+            (pl.col(column) == "True")
+            if column in _FLAGS
+            else pl.col(column).cast(pl.Int32)
+            for column in _SCALARS
+        ],
+        gender.list.get(0).alias("gender_group"),
+        gender.list.get(1).cast(pl.Int32).alias("gender_ratio"),
+        split("Hatch").list.get(0).alias("hatch_dev_id"),
+        split("Hatch").list.get(1).alias("hatch_form_id"),
+        stats("EVYield").alias("ev_yield"),
+        stats("Base").alias("base"),
+        *[split(column).fill_null([]) for column in _LISTS],
+    ).rename(_SCALARS)
+    logger.trace(f"Parsed {nested.height} species form(s).")
+    return nested
+
+
+def _to_tables(nested: "pl.DataFrame") -> ZAPersonalTables:
+    """Explode the entries of the evolution and move columns into child tables."""
+    import polars as pl
+
+    def explode(column: str, fields: dict[str, int], size: int) -> pl.DataFrame:
+        entries = pl.col(column)
+        return (
+            nested.select(
+                *_KEYS,
+                *[
+                    entries.list.gather_every(size, i).alias(n)
+                    for n, i in fields.items()
+                ],
+            )
+            .explode(list(fields))
+            .drop_nulls(next(iter(fields)))
+        )
+
+    level_up = explode("Learnset", _LEARNSET, _LEARNSET_SIZE)
+    moves = [level_up.with_columns(source=pl.lit("level_up"))]
+    for column, source in _MOVE_LISTS.items():
+        listed = nested.select(*_KEYS, pl.col(column).alias("waza_id"))
+        moves.append(
+            listed.explode("waza_id")
+            .drop_nulls("waza_id")
+            .with_columns(source=pl.lit(source))
+        )
+    learnset = pl.concat(moves, how="diagonal").select(
+        *_KEYS,
+        pl.col("source").cast(pl.Enum(LEARN_SOURCES)),
+        *_LEARNSET,
+    )
+    return ZAPersonalTables(
+        species=nested.drop(_LISTS),
+        evolutions=explode("Evolutions", _EVOLUTION, _EVOLUTION_SIZE),
+        learnset=learnset,
+    )
+
+
+def _source_stamp(path: str) -> dict[str, str]:
+    """What identifies the content of a file, without reading it."""
+    stat = os.stat(path)
+    return {
+        "version": _SIDECAR_VERSION,
+        "size": str(stat.st_size),
+        "mtime_ns": str(stat.st_mtime_ns),
+    }
+
+
+def _read_sidecar(path: str) -> ZAPersonalTables | None:
+    """Read the sidecar of a file, if it is up to date."""
+    import polars as pl
+    import pyarrow as pa
+
+    stamp = _source_stamp(path)
+    tables: dict[str, pl.DataFrame] = {}
+    for name, cache in _sidecar_paths(path).items():
+        if not os.path.exists(cache):
+            return None
+        try:
+            with pa.memory_map(cache) as source:
+                reader = pa.ipc.open_file(source)
+                metadata = reader.schema.metadata or {}
+                if {k.decode(): v.decode() for k, v in metadata.items()} != stamp:
+                    logger.trace(f"Sidecar {cache} is stale.")
+                    return None
+                tables[name] = ty.cast(pl.DataFrame, pl.from_arrow(reader.read_all()))
+        except (OSError, pa.ArrowInvalid) as ex:
+            logger.warning(f"Ignoring unreadable sidecar {cache}: {ex}")
+            return None
+    logger.trace(f"Read the personal table of {path} from its sidecar.")
+    return ZAPersonalTables(**tables)
+
+
+def _write_sidecar(path: str, tables: ZAPersonalTables) -> None:
+    """Write the sidecar of a file, replacing each file atomically."""
+    import pyarrow as pa
+
+    stamp = _source_stamp(path)
+    for name, cache in _sidecar_paths(path).items():
+        table = getattr(tables, name).to_arrow().replace_schema_metadata(stamp)
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        try:
+            with (
+                pa.OSFile(tmp, "wb") as sink,
+                pa.ipc.new_file(sink, table.schema) as writer,
+            ):
+                writer.write_table(table)
+            os.replace(tmp, cache)
+        except OSError as ex:
+            logger.warning(f"Could not write sidecar {cache}: {ex}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+    logger.trace(f"Wrote the sidecar of {path}.")
@@ -0,0 +1,492 @@
+__all__ = [
+    "ZARawTable",
+    "ZAWazaInflict",
+    "ZAWazaStatAmps",
+    "ZAWaza",
+    "ZAWazaArray",
+    "ZAPersonalWaza",
+    "ZAPersonalWazaArray",
+    "ZAWazaParam",
+    "ZAWazaParamArray",
+    "ZAItem",
+    "ZAItemArray",
+    "ZATokusei",
+    "ZATokuseiArray",
+]
+
+import os
+import typing as ty
+import weakref
+
+import pydantic
+from loguru import logger
+from pydantic.alias_generators import to_pascal
+
+from skypy import settings
+from skypy._settings import lookup_tables
+
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+
+# Columnar views of the tables, by `id()` of the table, see `ZARawTable.to_polars()`.
+# They are not private attributes, which pydantic compares in `==`, and tables are
+# not hashable, so the entries are dropped by a finalizer of each table instead of
+# being held in a `WeakKeyDictionary`
+_FRAMES: dict[int, "pl.DataFrame"] = {}
+
+# Rows of the Raw tables: attribute names are the snake_case schema names
+RAW_MODEL_CFG = pydantic.ConfigDict(
+    extra="forbid",
+    populate_by_name=True,
+    alias_generator=to_pascal,
+)
+
+
+class ZARawTable[R: pydantic.BaseModel](pydantic.BaseModel):
+    """A table of `assets/za/Raw`, as printed by `flatc --json` (`{"Table": [...]}`).
+
+    Rows are indexed by their ID (`id_field`), or by position for tables without one.
+    Several rows may share an ID, see `get_all()`. `to_polars()` gives a columnar view
+    of the table, built once, to query a column across all rows.
+
+    Tables are loaded with `load()`, which caches them until their file changes: cached
+    tables are shared, and must not be mutated.
+
+    Validation is not skipped for trusted files, as it is for trainers: these rows only
+    hold scalars, which `pydantic-core` validates faster than models can be constructed
+    in Python.
+    """
+
+    model_config = pydantic.ConfigDict(populate_by_name=True)
+
+    file_name: ty.ClassVar[str]
+    """Name of the file, in `settings.files.za_raw_assets`."""
+    id_field: ty.ClassVar[str | None] = None
+    """Attribute holding the ID of a row, `None` if the ID is the position."""
+
+    values: list[R] = pydantic.Field(
+        description="Rows of the table.",
+        alias="Table",
+        serialization_alias="Table",
+    )
+
+    _positions: dict[int, list[int]] = pydantic.PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: ty.Any, /) -> None:
+        """Build the index of row positions."""
+        self._positions = {}
+        for i, row in enumerate(self.values):
+            key = i if self.id_field is None else getattr(row, self.id_field)
+            self._positions.setdefault(key, []).append(i)
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.values)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a row has this ID."""
+        return key in self._positions
+
+    def __getitem__(self, key: int) -> R:
+        """Get the first row with this ID, see `get()`."""
+        return self.get(key)
+
+    @property
+    def ids(self) -> list[int]:
+        """Distinct IDs, in order of first appearance."""
+        return list(self._positions)
+
+    def get(self, key: int) -> R:
+        """Get the first row with this ID.
+
+        Raises:
+            KeyError: If no row has this ID.
+        """
+        return self.values[self._positions[key][0]]
+
+    def get_all(self, key: int) -> list[R]:
+        """Get all rows with this ID, in order. Empty if there is none."""
+        return [self.values[i] for i in self._positions.get(key, ())]
+
+    def to_polars(self) -> "pl.DataFrame":
+        """Columnar view of the table, built on first call.
+
+        Nested tables are struct columns. Tables whose ID is the position get an `id`
+        column.
+        """
+        frame = _FRAMES.get(id(self))
+        if frame is None:
+            import polars as pl
+
+            frame = pl.from_dicts(
+                [row.model_dump() for row in self.values], infer_schema_length=None
+            )
+            if self.id_field is None:
+                frame = frame.with_row_index("id")
+            _FRAMES[id(self)] = frame
+            weakref.finalize(self, _FRAMES.pop, id(self), None)
+        return frame
+
+    @classmethod
+    def row_model(cls) -> type[R]:
+        """Model of the rows."""
+        annotation = cls.model_fields["values"].annotation
+        (row_model,) = ty.get_args(annotation)
+        return ty.cast(type[R], row_model)
+
+    @classmethod
+    def load(cls, path: str | None = None) -> ty.Self:
+        """Load the table from its JSON file, cached until the file changes.
+
+        The file is parsed and validated in one pass by `model_validate_json()`, without
+        building the intermediate Python objects of `json.load()`.
+
+        Args:
+            path (str, optional):
+                Path of the file. Defaults to `file_name` in
+                `settings.files.za_raw_assets`.
+        """
+        if path is None:
+            path = os.path.join(settings.files.za_raw_assets, cls.file_name)
+
+        return lookup_tables.get(path, cls.__name__, cls._read)
+
+    @classmethod
+    def _read(cls, filename: str) -> ty.Self:
+        """Read the table from its JSON file."""
+        with open(filename, "rb") as f:
+            table = cls.model_validate_json(f.read())
+        logger.trace(f"Loaded {len(table)} row(s) from {filename}.")
+        return table
+
+
+class _ZAWrappedRawTable[R: pydantic.BaseModel](ZARawTable[R]):
+    """A Raw table whose rows are each wrapped in their own `{"Table": [row]}`.
+
+    The rows are unwrapped before validation, so these tables are not validated from the
+    JSON bytes directly.
+    """
+
+    @pydantic.model_validator(mode="before")
+    @classmethod
+    def unwrap_rows(cls, data: ty.Any) -> ty.Any:
+        """Unwrap the rows, wrapped in their own table."""
+        if isinstance(data, dict):
+            key = "Table" if "Table" in data else "values"
+            data = {
+                key: [
+                    row
+                    for record in data.get(key, ())
+                    for row in (record["Table"] if "Table" in record else [record])
+                ]
+            }
+        return data
+
+
+class ZAWazaInflict(pydantic.BaseModel):
+    """Status condition inflicted by a move."""
+
+    model_config = RAW_MODEL_CFG
+
+    value: int = 0
+    chance: int = 0
+    turn_1: int = 0
+    turn_2: int = 0
+    turn_3: int = 0
+
+
+class ZAWazaStatAmps(pydantic.BaseModel):
+    """Stat stage changes of a move."""
+
+    model_config = RAW_MODEL_CFG
+
+    stat_1: int = 0
+    stat_2: int = 0
+    stat_3: int = 0
+    stat_1_stage: int = 0
+    stat_2_stage: int = 0
+    stat_3_stage: int = 0
+    stat_1_percent: int = 0
+    stat_2_percent: int = 0
+    stat_3_percent: int = 0
+
+
+class ZAWaza(pydantic.BaseModel):
+    """A move of `waza_array.json`."""
+
+    model_config = RAW_MODEL_CFG
+
+    move_id: int = pydantic.Field(0, alias="MoveID")
+    can_use_move: bool = False
+    type: int = 0
+    quality: int = 0
+    category: int = 0
+    power: int = 0
+    accuracy: int = 0
+    pp: int = pydantic.Field(0, alias="PP")
+    priority: int = 0
+    hit_max: int = 0
+    hit_min: int = 0
+    inflict: ZAWazaInflict = ZAWazaInflict()
+    crit_stage: int = 0
+    flinch: int = 0
+    effect_sequence: int = 0
+    recoil: int = 0
+    self_heal: int = 0
+    damage_heal: int = 0
+    raw_target: int = 0
+    stat_amps: ZAWazaStatAmps = ZAWazaStatAmps()
+    affinity: int = 0
+    flag_makes_contact: bool = False
+    flag_charge: bool = False
+    flag_recharge: bool = False
+    flag_protect: bool = False
+    flag_reflectable: bool = False
+    flag_snatch: bool = False
+    flag_mirror: bool = False
+    flag_punch: bool = False
+    flag_sound: bool = False
+    flag_dance: bool = False
+    flag_gravity: bool = False
+    flag_defrost: bool = False
+    flag_distance_triple: bool = False
+    flag_heal: bool = False
+    flag_ignore_substitute: bool = False
+    flag_fail_sky_battle: bool = False
+    flag_animate_ally: bool = False
+    flag_metronome: bool = False
+    flag_fail_encore: bool = False
+    flag_fail_me_first: bool = False
+    flag_future_attack: bool = False
+    flag_pressure: bool = False
+    flag_combo: bool = False
+    flag_no_sleep_talk: bool = False
+    flag_no_assist: bool = False
+    flag_fail_copycat: bool = False
+    flag_fail_mimic: bool = False
+    flag_fail_instruct: bool = False
+    flag_powder: bool = False
+    flag_bite: bool = False
+    flag_bullet: bool = False
+    flag_no_multi_hit: bool = False
+    flag_no_effectiveness: bool = False
+    flag_sheer_force: bool = False
+    flag_slicing: bool = False
+    flag_wind: bool = False
+    unknown_57: bool = False
+    unknown_58: bool = False
+    unknown_59: bool = False
+    unknown_60: bool = False
+    unknown_61: bool = False
+    unused_62: bool = False
+    unused_63: bool = False
+    unused_64: bool = False
+    unused_65: bool = False
+    unused_66: bool = False
+    unused_67: bool = False
+    unused_68: bool = False
+    unused_69: bool = False
+    unused_70: bool = False
+    unused_71: bool = False
+    flag_cant_use_twice: bool = False
+
+
+class ZAWazaArray(ZARawTable[ZAWaza]):
+    """Moves (`waza_array.json`), by move ID."""
+
+    file_name = "waza_array.json"
+    id_field = "move_id"
+
+
+class ZAPersonalWaza(pydantic.BaseModel):
+    """A row of `personal_waza_param_array.json`: battle parameters of a move."""
+
+    model_config = RAW_MODEL_CFG
+
+    waza_id: int = pydantic.Field(0, alias="WazaID")
+    extention_type: int = 0
+    type: int = 0
+    category: int = 0
+    damage_type: int = 0
+    power: int = 0
+    critical_rank: int = 0
+    hp_recover_ratio: int = 0
+    shrink_per: int = 0
+    sick_param_sick_id: int = pydantic.Field(0, alias="SickParamSickID")
+    sick_param_per: int = 0
+    sick_param_sick_cont: int = 0
+    sick_param_sick_turn_min: int = 0
+    sick_param_sick_turn_max: int = 0
+    rank_effect_0_type: int = 0
+    rank_effect_0_value: int = 0
+    rank_effect_0_per: int = 0
+    rank_effect_1_type: int = 0
+    rank_effect_1_value: int = 0
+    rank_effect_1_per: int = 0
+    rank_effect_2_type: int = 0
+    rank_effect_2_value: int = 0
+    rank_effect_2_per: int = 0
+    damage_recover_ratio: int = 0
+    damage_drain_ratio: int = 0
+    is_guard: bool = False
+    is_avoid_by_float: bool = False
+    is_touch: bool = False
+    is_cut: bool = False
+    is_wind: bool = False
+    can_through_migawari: bool = False
+    can_melt_frozen: bool = False
+    is_hp_recover: bool = False
+    is_kaihuku_huuzi_enable: bool = False
+    is_yubi_wo_huru_permit: bool = False
+    is_sick: bool = False
+    is_mamoru_enable: bool = False
+    cant_kill: bool = False
+    value_effect_ratio: int = 0
+
+
+class ZAPersonalWazaArray(_ZAWrappedRawTable[ZAPersonalWaza]):
+    """Move battle parameters (`personal_waza_param_array.json`), by move ID.
+
+    A move may have several rows.
+    """
+
+    file_name = "personal_waza_param_array.json"
+    id_field = "waza_id"
+
+
+class ZAWazaParam(pydantic.BaseModel):
+    """A row of `waza_param_array.json`: how a move is played in the field."""
+
+    model_config = RAW_MODEL_CFG
+
+    waza_id: int = 0
+    charge_frame: int = 0
+    attack_loop_frame: int = 0
+    spawn_origin: int = 0
+    spawn_locator: str | None = None
+    spawn_offset_x: int = 0
+    spawn_offset_y: float = 0.0
+    spawn_offset_z: float = 0.0
+    shot_direction: int = 0
+    correct_target_type: int = 0
+    impact_motion_speed: float = 0.0
+    play_waza_move_type: int = 0
+    waza_range_min: float = 0.0
+    waza_range_max: float = 0.0
+    height_tolerance: int = 0
+    effective_range: float = 0.0
+    min_shoot_num: int = 0
+    max_shoot_num: int = 0
+    hit_per: int = 0
+    waza_recast_time: int = 0
+    effect_time: float = 0.0
+    effect_value: int = 0
+    add_mega_power_value: float = 0.0
+    played_motion_speed: int = 0
+    overwrite_bullet_id_1: int = 0
+    replace_bullet_id_1: int = 0
+    overwrite_bullet_id_2: int = 0
+    replace_bullet_id_2: int = 0
+    overwrite_bullet_id_3: int = 0
+    replace_bullet_id_3: int = 0
+    overwrite_bullet_id_4: int = 0
+    replace_bullet_id_4: int = 0
+    overwrite_bullet_id_5: int = 0
+    replace_bullet_id_5: int = 0
+    bullet_correct_scale: float = 0.0
+
+
+class ZAWazaParamArray(_ZAWrappedRawTable[ZAWazaParam]):
+    """Move field parameters (`waza_param_array.json`), by move ID.
+
+    A move may have several rows.
+    """
+
+    file_name = "waza_param_array.json"
+    id_field = "waza_id"
+
+
+class ZAItem(pydantic.BaseModel):
+    """An item of `item_data.json`."""
+
+    model_config = RAW_MODEL_CFG
+
+    id: int = 0
+    item_type: int = 0
+    internal_name: str = ""
+    icon_name: str = ""
+    price: int = 0
+    pocket: int = 0
+    slot_max_num: int = 0
+    sort_num: int = 0
+    price_mega_shard: int = 0
+    price_colorful_screw: int = 0
+    can_not_hold: bool = False
+    machine_waza: int = 0
+    machine_index: int = 0
+    work_recv_sleep: bool = False
+    work_recv_poison: bool = False
+    work_recv_burn: bool = False
+    work_recv_freeze: bool = False
+    work_recv_paralyze: bool = False
+    work_recv_confuse: bool = False
+    work_recv_mero: bool = False
+    work_attack: int = 0
+    work_defense: int = 0
+    work_sp_attack: int = 0
+    work_sp_defense: int = 0
+    work_speed: int = 0
+    work_accuracy: int = 0
+    work_critical: int = 0
+    work_effect_guard: int = 0
+    mint_nature: int = 0
+    work_recv_power: int = 0
+    heal_percentage: int = 0
+    work_revival: int = 0
+    revive_percentage: int = 0
+    exp_point_gain: int = 0
+    max_use_level: int = 0
+    work_friendly_1: int = 0
+    work_friendly_2: int = 0
+    work_friendly_3: int = 0
+    work_evolutional: bool = False
+    work_form_change: bool = False
+    work_status_hp: int = 0
+    work_status_atk: int = 0
+    work_status_def: int = 0
+    work_status_spd: int = 0
+    work_status_s_atk: int = 0
+    work_status_s_def: int = 0
+    equip_power: int = 0
+    auto_heal_priority: int = 0
+    can_use_in_battle: bool = False
+    swap_into_id: int = 0
+
+
+class ZAItemArray(ZARawTable[ZAItem]):
+    """Items (`item_data.json`), by item ID."""
+
+    file_name = "item_data.json"
+    id_field = "id"
+
+
+class ZATokusei(pydantic.BaseModel):
+    """An ability of `tokusei_array.json`."""
+
+    model_config = RAW_MODEL_CFG
+
+    disabled_by_neutralizing_gas: bool = False
+    fail_role_play: bool = False
+    no_receiver: bool = False
+    no_entrain: bool = False
+    no_trace: bool = False
+    fail_skill_swap: bool = False
+    cant_suppress: bool = False
+    breakable: bool = False
+    no_transform: bool = False
+
+
+class ZATokuseiArray(ZARawTable[ZATokusei]):
+    """Abilities (`tokusei_array.json`), by ability ID (their position)."""
+
+    file_name = "tokusei_array.json"
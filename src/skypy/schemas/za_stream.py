@@ -0,0 +1,218 @@
+__all__ = ["iter_trdata_records", "iter_trdata_array", "normalize_trdata_record"]
+
+import functools
+import json
+import os
+import typing as ty
+
+from loguru import logger
+
+from .za import ZATrainerData
+from .za_construct import construct_trainer
+from .za_fbs import ZA_TRDATA_ARRAY_FBS, FbsTable
+
+STREAM_CHUNK_SIZE = 1 << 16
+# Keys of the trainer list: `values` in the editor JSON, `Table` in `flatc --json`
+_ARRAY_KEYS = ("values", "Table")
+_WHITESPACE = " \t\n\r"
+_TRAINER_FBS = ty.cast(FbsTable, ZA_TRDATA_ARRAY_FBS.fields[0].table)
+
+
+class _JSONStream:
+    """Text buffer over a JSON file, read one chunk at a time.
+
+    Values are decoded with `json.JSONDecoder.raw_decode()` (the C scanner), and the
+    consumed text is dropped, so the buffer never holds much more than a chunk and the
+    value being decoded.
+    """
+
+    def __init__(self, f: ty.TextIO, chunk_size: int) -> None:
+        """Args:
+        f (TextIO):
+            The file, opened in text mode.
+
+        chunk_size (int):
+            Number of characters read at once.
+        """
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read a chunk, dropping the consumed text. Returns `False` at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        return bool(chunk)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it, or `""` at the end."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos : self.pos + 1]
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, one of `chars`.
+
+        Raises:
+            json.JSONDecodeError: If the next character is not one of `chars`.
+        """
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expected one of {chars!r}", self.buf, self.pos)
+        self.pos += 1
+        return char
+
+    def decode(self) -> ty.Any:
+        """Decode the next value, reading more of the file until it is complete.
+
+        Raises:
+            json.JSONDecodeError: If the value is invalid or truncated.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number may continue in the next chunk
+            if end < len(self.buf) or self.eof or not self._fill():
+                self.pos = end
+                return value
+
+
+def iter_trdata_records(
+    source: str | ty.TextIO,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> ty.Iterator[dict[str, ty.Any]]:
+    """Read trainer records from a trainer data JSON file, one at a time.
+
+    Both layouts are supported: the editor JSON (`{"values": [...]}`, camelCase keys)
+    and the `flatc --json` output (`{"Table": [...]}`, PascalCase schema names, e.g.
+    `assets/za/Raw/trdata_array.json`). Records are yielded with the editor keys, as
+    dumped with `by_alias=True`, whatever their layout, so they can be validated as
+    `ZATrainerData`.
+
+    The file is parsed incrementally: only the current record is held in memory, and
+    the first records are yielded before the rest of the file is read.
+
+    Args:
+        source (str | TextIO):
+            Path of the file, or the file opened in text mode.
+
+        chunk_size (int):
+            Number of characters read at once.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+        ValueError: If the file has no trainer list.
+    """
+    if isinstance(source, str | os.PathLike):
+        with open(source, encoding="utf-8") as f:
+            yield from iter_trdata_records(f, chunk_size)
+        return
+
+    stream = _JSONStream(source, chunk_size)
+    stream.expect("{")
+    if stream.peek() == "}":
+        raise ValueError(f"No trainer list ({' or '.join(_ARRAY_KEYS)}) found.")
+    while True:
+        key = stream.decode()
+        stream.expect(":")
+        if key in _ARRAY_KEYS and stream.peek() == "[":
+            break
+        # Other top-level values are small (e.g. a version), skip them
+        stream.decode()
+        if stream.expect(",}") == "}":
+            raise ValueError(f"No trainer list ({' or '.join(_ARRAY_KEYS)}) found.")
+
+    stream.expect("[")
+    if stream.peek() == "]":
+        return
+    count = 0
+    while True:
+        record = stream.decode()
+        if not isinstance(record, dict):
+            raise ValueError(f"Trainer record {count} is not an object.")
+        yield normalize_trdata_record(record)
+        count += 1
+        if stream.expect(",]") == "]":
+            break
+    logger.trace(f"Streamed {count} trainer record(s).")
+
+
+def iter_trdata_array(
+    source: str | ty.TextIO,
+    trusted: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> ty.Iterator[ZATrainerData]:
+    """Read trainers from a trainer data JSON file, one at a time.
+
+    See `iter_trdata_records()`.
+
+    Args:
+        source (str | TextIO):
+            Path of the file, or the file opened in text mode.
+
+        trusted (bool):
+            Whether the file comes from a trusted source, so validation can be skipped.
+            See `skypy.schemas.construct_trainer()`.
+
+        chunk_size (int):
+            Number of characters read at once.
+
+    Raises:
+        pydantic.ValidationError: If a record is invalid, when not `trusted`.
+    """
+    build: ty.Callable[[dict[str, ty.Any]], ZATrainerData]
+    build = construct_trainer if trusted else ZATrainerData.model_validate
+    for record in iter_trdata_records(source, chunk_size):
+        yield build(record)
+
+
+def normalize_trdata_record(record: dict[str, ty.Any]) -> dict[str, ty.Any]:
+    """Rename the `flatc --json` keys of a trainer record (e.g. `TrId`, `Poke1`) to the
+    editor keys (`trid`, `poke1`). Records with editor keys are returned as they are.
+    """
+    return _to_aliases(_TRAINER_FBS, record)
+
+
+def _to_aliases(spec: FbsTable, record: dict[str, ty.Any]) -> dict[str, ty.Any]:
+    """Rename the schema keys (e.g. `TrId`) of a record to model aliases (`trid`).
+
+    Other keys are kept, so records that already use the aliases are unchanged.
+    """
+    renames = _alias_map(spec)
+    if not any(key in renames for key in record):
+        return record
+    out: dict[str, ty.Any] = {}
+    for key, value in record.items():
+        if key not in renames:
+            out[key] = value
+            continue
+        alias, child = renames[key]
+        if child is not None and isinstance(value, dict):
+            value = _to_aliases(child, value)
+        out[alias] = value
+    return out
+
+
+@functools.cache
+def _alias_map(spec: FbsTable) -> dict[str, tuple[str, FbsTable | None]]:
+    """Schema names of a table, mapped to their model alias and child table."""
+    fields = spec.model.model_fields
+    return {
+        f.fbs_name: (fields[f.name].alias or f.name, f.table)
+        for f in spec.fields
+        if f.kind == "table" or f.fbs_name != (fields[f.name].alias or f.name)
+    }
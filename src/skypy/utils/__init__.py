@@ -1,2 +1,3 @@
 from .nb import *  # noqa
 from .logger import *  # noqa
+from .profiling import *  # noqa
@@ -0,0 +1,95 @@
+__all__ = ["StartupProfiler"]
+
+import contextlib
+import json
+import os
+import time
+import typing as ty
+
+from loguru import logger
+
+if ty.TYPE_CHECKING:  # pragma: no cover
+    from pyinstrument.session import Session
+
+PROFILE_INTERVAL_S = 0.001
+
+
+class StartupProfiler:
+    """Profiles named stages of the startup separately, with `pyinstrument`.
+
+    Each stage is profiled by its own `pyinstrument.Profiler`, so stages must not be
+    nested. Sessions are kept in memory until `write()`, since the output directory
+    is usually only known once the app is initialized.
+
+    When disabled, stages only measure their wall time, and `pyinstrument` is never
+    imported.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        interval: float = PROFILE_INTERVAL_S,
+    ) -> None:
+        """Args:
+        enabled (bool):
+            Whether to profile. Otherwise, only durations are recorded.
+
+        interval (float):
+            Sampling interval, in seconds.
+        """
+        self.enabled = enabled
+        self.interval = interval
+        self.sessions: dict[str, Session] = {}
+        self.durations: dict[str, float] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> ty.Iterator[None]:
+        """Profile the code within this context as the stage `name`.
+
+        Args:
+            name (str):
+                Name of the stage, used in the report file names.
+        """
+        profiler = None
+        if self.enabled:
+            from pyinstrument import Profiler
+
+            profiler = Profiler(interval=self.interval)
+            profiler.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = time.perf_counter() - start
+            if profiler is not None:
+                self.sessions[name] = profiler.stop()
+            logger.debug(f"Startup stage {name!r}: {self.durations[name]:.3f}s")
+
+    def write(self, output_dir: str) -> list[str]:
+        """Write an HTML and a JSON report per profiled stage, and a summary.
+
+        Args:
+            output_dir (str):
+                Directory to write the reports to, created if needed.
+
+        Returns:
+            list[str]: Paths of the written files.
+        """
+        if not self.enabled:
+            return []
+        from pyinstrument.renderers import HTMLRenderer, JSONRenderer
+
+        os.makedirs(output_dir, exist_ok=True)
+        paths: list[str] = []
+        for name, session in self.sessions.items():
+            for renderer, ext in ((HTMLRenderer(), "html"), (JSONRenderer(), "json")):
+                path = os.path.join(output_dir, f"profile_{name}.{ext}")
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(renderer.render(session))
+                paths.append(path)
+        path = os.path.join(output_dir, "profile_summary.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"durations": self.durations}, f, indent=2)
+        paths.append(path)
+        logger.info(f"Wrote startup profile to {output_dir}")
+        return paths
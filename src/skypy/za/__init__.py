@@ -1,4 +1,47 @@
-from .trainer_editor import *  # noqa
-from .mod import *  # noqa
+import importlib
+import typing as ty
+
+from .edit import *  # noqa
+from .legality import *  # noqa
 from .load import *  # noqa
-from .frames import *  # noqa
+from .mod import *  # noqa
+from .query import *  # noqa
+from .save import *  # noqa
+from .search import *  # noqa
+from .tables import *  # noqa
+from .updates import *  # noqa
+from .validate import *  # noqa
+
+# GUI modules import tkinter/customtkinter, so they are only imported when one of
+# their names is first accessed (e.g. `from skypy.za import ZATrainerEditor`)
+_GUI_EXPORTS: dict[str, tuple[str, ...]] = {
+    "trainer_editor": ("ZATrainerEditor",),
+    "picker": ("VirtualList", "TrainerPicker"),
+    "dropdown": ("FilterDropdown", "DropdownPopup"),
+    "frames": (
+        "FieldFrame",
+        "CheckboxFrame",
+        "PkmnFrame",
+        "PkmnSlot",
+        "WazaFrame",
+        "TrainerFrame",
+    ),
+}
+_GUI_MODULES = {
+    name: module for module, names in _GUI_EXPORTS.items() for name in names
+}
+
+
+def __getattr__(name: str) -> ty.Any:
+    """Import GUI names on first access."""
+    module = _GUI_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Names of the package, including GUI names not imported yet."""
+    return sorted({*globals(), *_GUI_MODULES})
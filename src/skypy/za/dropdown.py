@@ -0,0 +1,181 @@
+__all__ = ["FilterDropdown", "DropdownPopup"]
+
+import typing as ty
+
+import customtkinter as ctk
+from loguru import logger
+
+from .picker import VirtualList
+from .search import OptionList
+
+DROPDOWN_VISIBLE_ROWS = 10
+DROPDOWN_MIN_WIDTH = 220
+DROPDOWN_FOCUS_CHECK_MS = 100
+
+
+class FilterDropdown(ctk.CTkButton):
+    """Drop-in replacement of `CTkOptionMenu` for long value lists.
+
+    The button only shows the current value. Clicking it opens the `DropdownPopup` of
+    its window, which lists the values of its `OptionList` and filters them as you
+    type. No widget is created per value, and the popup is shared by all dropdowns of
+    the window.
+
+    As with `CTkOptionMenu`, `command` is only called when the user picks a value, not
+    by `set()`.
+    """
+
+    def __init__(
+        self,
+        master: ty.Any,
+        options: OptionList,
+        command: ty.Callable[[str], None] | None = None,
+        variable: ctk.StringVar | None = None,
+        **kwargs: ty.Any,
+    ) -> None:
+        """Args:
+        master (Any):
+            Parent widget.
+
+        options (OptionList):
+            The values to pick from.
+
+        command (Callable[[str], None], optional):
+            Called with the value picked by the user.
+
+        variable (ctk.StringVar, optional):
+            Variable holding the current value.
+
+        **kwargs (Any):
+            Additional keyword arguments to pass to the parent class.
+        """
+        self.options = options
+        self.variable = variable or ctk.StringVar(master=master, value="")
+        self._on_change: ty.Callable[[str], None] = command or (lambda value: None)
+        kwargs.setdefault("anchor", "w")
+        super().__init__(
+            master, textvariable=self.variable, command=self.open, **kwargs
+        )
+
+    def configure(self, require_redraw: bool = False, **kwargs: ty.Any) -> None:
+        """Same as `CTkButton.configure()`, where `command` is the change callback."""
+        if "command" in kwargs:
+            self._on_change = kwargs.pop("command") or (lambda value: None)
+        if "options" in kwargs:
+            self.options = kwargs.pop("options")
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def get(self) -> str:
+        """Current value."""
+        value: str = self.variable.get()
+        return value
+
+    def set(self, value: str) -> None:
+        """Show a value, without calling `command`."""
+        self.variable.set(value)
+
+    def select(self, value: str) -> None:
+        """Set a value picked by the user, and call `command`."""
+        self.set(value)
+        self._on_change(value)
+
+    def open(self) -> None:
+        """Open the popup listing the values."""
+        DropdownPopup.of(self).open(self)
+
+
+class DropdownPopup(ctk.CTkToplevel):
+    """Borderless window listing the values of a `FilterDropdown`.
+
+    There is one popup per window, created on first use, see `of()`. Opening it for a
+    dropdown only swaps the values of its `VirtualList`. It closes on `Escape`, when it
+    loses focus, or once a value is picked.
+    """
+
+    _ATTR = "_skypy_dropdown_popup"
+
+    def __init__(
+        self,
+        master: ty.Any,
+        visible_rows: int = DROPDOWN_VISIBLE_ROWS,
+        **kwargs: ty.Any,
+    ) -> None:
+        """Args:
+        master (Any):
+            Parent window.
+
+        visible_rows (int):
+            Number of values shown at once.
+
+        **kwargs (Any):
+            Additional keyword arguments to pass to the parent class.
+        """
+        super().__init__(master, **kwargs)
+        self.withdraw()
+        self.overrideredirect(True)
+        self.target: FilterDropdown | None = None
+        self.list = VirtualList(
+            self,
+            search=lambda query: [],
+            command=self._on_select,
+            visible_rows=visible_rows,
+            placeholder_text="Type to filter...",
+        )
+        self.list.pack(fill="both", expand=True)
+        self.bind("<Escape>", lambda event: self.close())
+        self.list.search_entry.bind("<Escape>", lambda event: self.close())
+        self.bind(
+            "<FocusOut>",
+            lambda event: self.after(DROPDOWN_FOCUS_CHECK_MS, self._check_focus),
+        )
+
+    @classmethod
+    def of(cls, widget: ty.Any) -> "DropdownPopup":
+        """The popup of a widget's window, created if needed."""
+        root = widget.winfo_toplevel()
+        popup: DropdownPopup | None = getattr(root, cls._ATTR, None)
+        if popup is None or not popup.winfo_exists():
+            popup = cls(root)
+            setattr(root, cls._ATTR, popup)
+        return popup
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the popup is shown."""
+        return self.target is not None
+
+    def open(self, target: FilterDropdown) -> None:
+        """Show the values of a dropdown, below it, revealing its current value."""
+        self.target = target
+        self.list.reset(target.options.filter, selected=target.get())
+        width = max(target.winfo_width(), DROPDOWN_MIN_WIDTH)
+        x = target.winfo_rootx()
+        y = target.winfo_rooty() + target.winfo_height()
+        self.geometry(f"{width}x{self.list.winfo_reqheight()}+{x}+{y}")
+        self.deiconify()
+        self.lift()
+        self.list.search_entry.focus_set()
+        logger.trace(f"Opened dropdown with {len(target.options)} values.")
+
+    def close(self) -> None:
+        """Hide the popup."""
+        self.target = None
+        self.withdraw()
+
+    def _on_select(self, value: str) -> None:
+        """Close the popup, then set the picked value on its dropdown."""
+        target = self.target
+        self.close()
+        if target is not None:
+            target.select(value)
+
+    def _check_focus(self) -> None:
+        """Close the popup if the focus went to another window."""
+        if not self.is_open:
+            return
+        try:
+            focus = self.focus_get()
+        except KeyError:
+            focus = None
+        if focus is None or focus.winfo_toplevel() is not self:
+            self.close()
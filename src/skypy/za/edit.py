@@ -0,0 +1,418 @@
+__all__ = [
+    "Assignment",
+    "TrainerSelector",
+    "EditResult",
+    "parse_assignment",
+    "parse_level_range",
+    "resolve_value",
+    "edit_trdata_array",
+    "apply_assignments",
+]
+
+import re
+import typing as ty
+
+import annotated_types
+import pydantic
+from loguru import logger
+
+from skypy import settings
+from skypy.schemas import (
+    NAME_INDEX_FIELDS,
+    ZAPokemonData,
+    ZATrainerData,
+    ZATrainerDataArray,
+    ZAWazaData,
+)
+
+from .tables import TrainerFrames, field_default, from_frames, to_frames
+
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+
+Operator = ty.Literal["=", "+=", "-=", "*=", "/="]
+
+# Fields holding an ID with an English name, and the `settings` display names
+_ENGLISH_NAMES = {
+    "dev_id": "za_species_names",
+    "item": "za_item_names",
+    "ball_id": "za_item_names",
+    "waza_id": "za_waza_names",
+}
+_ASSIGNMENT = re.compile(r"^\s*(\w+)\s*([-+*/]?=)\s*(.+?)\s*$")
+
+
+class Assignment(ty.NamedTuple):
+    """A field update, e.g. `level*=1.2`."""
+
+    field: str
+    """Attribute name of a trainer, Pokémon or move field."""
+    op: Operator
+    """`=` sets the value, the others update the current value."""
+    value: ty.Any
+    """Resolved value: a bool, a number, or the ID of a name."""
+    text: str = ""
+    """Assignment as written."""
+
+
+class TrainerSelector(ty.NamedTuple):
+    """Which trainers and Pokémon an edit applies to. Empty criteria match everything.
+
+    Trainer fields are edited on the selected trainers. With Pokémon criteria, only
+    trainers with at least one matching Pokémon are selected, and Pokémon and move
+    fields are only edited on the matching Pokémon. Empty slots (no species) are never
+    edited.
+    """
+
+    tr_ids: tuple[str, ...] = ()
+    """Trainer ID globs (`fnmatch` syntax, case-insensitive), any of which must match."""
+    ranks: tuple[int, ...] = ()
+    """ZA ranks, any of which must match."""
+    species: tuple[int, ...] = ()
+    """Species IDs, any of which must match."""
+    level: tuple[int | None, int | None] = (None, None)
+    """Inclusive level range, either bound may be `None`."""
+    slots: tuple[int, ...] = ()
+    """Pokémon slots (1 to 6), any of which must match."""
+
+    @property
+    def filters_pokemon(self) -> bool:
+        """Whether there are Pokémon criteria."""
+        return bool(self.species or self.slots) or self.level != (None, None)
+
+
+class EditResult(ty.NamedTuple):
+    """Outcome of `edit_trdata_array()`."""
+
+    zatrdata: ZATrainerDataArray
+    """The edited trainer data."""
+    trainers: int
+    """Number of selected trainers."""
+    pokemon: int
+    """Number of selected Pokémon."""
+    changed: dict[str, int]
+    """Number of values changed by each assignment, keyed by its text."""
+
+
+def resolve_value(field: str, text: str) -> ty.Any:
+    """Parse the value of a field.
+
+    Args:
+        field (str):
+            Attribute name.
+
+        text (str):
+            `true`/`false`, a number, an enum name (e.g. `DEV_PIKATYUU`) or an English
+            name (e.g. `Pikachu`), for fields holding such IDs.
+
+    Returns:
+        Any: The value, names resolved to their ID.
+
+    Raises:
+        ValueError: If the text is not a valid value.
+    """
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    for parse in (int, float):
+        try:
+            return parse(text)
+        except ValueError:
+            pass
+    if field in NAME_INDEX_FIELDS:
+        index = getattr(settings, NAME_INDEX_FIELDS[field])
+        if text in index:
+            return index.to_id(text)
+    if field in _ENGLISH_NAMES:
+        names = getattr(settings, _ENGLISH_NAMES[field])
+        if text in names:
+            return names.to_id(text)
+    raise ValueError(f"Invalid value for {field}: {text!r}")
+
+
+def parse_assignment(text: str) -> Assignment:
+    """Parse an assignment such as `level*=1.2`, `ai_expert=true` or `item=Leftovers`.
+
+    Raises:
+        ValueError: If the assignment is malformed, its field unknown, it divides by
+            zero, or it updates a field that is not a number (e.g. `ball_id+=1`).
+    """
+    match = _ASSIGNMENT.match(text)
+    if match is None:
+        raise ValueError(f"Invalid assignment: {text!r}, expected `field=value`.")
+    field, op, value = match.groups()
+    model = _model_of(field)
+    if model is None:
+        raise ValueError(f"Unknown field: {field!r}")
+    resolved = resolve_value(field, value)
+    if op == "=":
+        resolved = _validate(model, field, resolved)
+    elif model.model_fields[field].annotation not in (int, float):
+        # e.g. a `Literal` of IDs: the results would hardly ever be one of them
+        raise ValueError(f"Invalid assignment: {text!r}, {field} is not a number.")
+    elif op == "/=" and not isinstance(resolved, bool) and resolved == 0:
+        raise ValueError(f"Invalid assignment: {text!r}, division by zero.")
+    return Assignment(field, ty.cast(Operator, op), resolved, text)
+
+
+def parse_level_range(text: str) -> tuple[int | None, int | None]:
+    """Parse a level range `MIN:MAX`, either bound optional (e.g. `50:`).
+
+    Raises:
+        ValueError: If the range is malformed.
+    """
+    low, sep, high = text.partition(":")
+    if not sep:
+        return int(low), int(low)
+    return (int(low) if low.strip() else None, int(high) if high.strip() else None)
+
+
+def edit_trdata_array(
+    zatrdata: ZATrainerDataArray,
+    selector: TrainerSelector,
+    assignments: ty.Sequence[Assignment],
+) -> EditResult:
+    """Apply assignments to the selected trainers, vectorized over the whole table.
+
+    The data is converted to Polars data frames (see `ZATrainerTables`), each
+    assignment is one column expression, and the edited data is validated once when
+    converted back.
+
+    Numeric updates of unset fields start from the field default. Integer results are
+    rounded, and results are clipped to the bounds of the field (e.g. levels to
+    `0..100`). Non-finite results (e.g. of `level*=inf`) are rejected.
+
+    Args:
+        zatrdata (ZATrainerDataArray):
+            The trainer data, left untouched.
+
+        selector (TrainerSelector):
+            Which trainers and Pokémon to edit.
+
+        assignments (Sequence[Assignment]):
+            The updates, applied in order.
+
+    Raises:
+        ValueError: If an assignment targets a field that cannot be edited, or has a
+            non-finite result.
+    """
+    frames = to_frames(zatrdata)
+    trainers, pokemon, changed = apply_assignments(frames, selector, assignments)
+    return EditResult(from_frames(frames), trainers, pokemon, changed)
+
+
+def apply_assignments(
+    frames: TrainerFrames,
+    selector: TrainerSelector,
+    assignments: ty.Sequence[Assignment],
+) -> tuple[int, int, dict[str, int]]:
+    """Select rows, then apply assignments to them, updating the tables in place.
+
+    The selected rows are marked in a `_selected` column of each table. See
+    `edit_trdata_array()`.
+
+    Args:
+        frames (TrainerFrames):
+            Tables of the trainer data, see `skypy.za.to_frames()`.
+
+        selector (TrainerSelector):
+            Which trainers and Pokémon to edit.
+
+        assignments (Sequence[Assignment]):
+            The updates, applied in order.
+
+    Returns:
+        tuple[int, int, dict[str, int]]: The number of selected trainers and Pokémon,
+            and the number of values changed by each assignment.
+
+    Raises:
+        ValueError: If an assignment targets a field that cannot be edited, or has a
+            non-finite result.
+    """
+    n_trainers = _select(frames, selector)
+    changed: dict[str, int] = {}
+    for assignment in assignments:
+        model = _model_of(assignment.field)
+        if model is None:
+            raise ValueError(f"Unknown field: {assignment.field!r}")
+        frames[model], count = _assign(frames[model], model, assignment)
+        changed[assignment.text or str(assignment)] = count
+        logger.trace(f"{assignment.text}: {count} value(s) changed.")
+    n_pokemon = int(frames[ZAPokemonData]["_selected"].sum())
+    return n_trainers, n_pokemon, changed
+
+
+def _select(frames: TrainerFrames, selector: TrainerSelector) -> int:
+    """Mark the selected rows of each table in a `_selected` column.
+
+    Returns:
+        int: The number of selected trainers.
+    """
+    import polars as pl
+
+    trainers = frames[ZATrainerData].drop("_selected", strict=False)
+    pokemon = frames[ZAPokemonData].drop("_selected", strict=False)
+    moves = frames[ZAWazaData].drop("_selected", strict=False)
+    trainer_idx = trainers.filter(_trainer_filter(selector))["trainer_idx"]
+    poke_mask = pl.col("trainer_idx").is_in(trainer_idx.implode()) & _pokemon_filter(
+        selector
+    )
+    pokemon = pokemon.with_columns(poke_mask.alias("_selected"))
+    if selector.filters_pokemon:
+        trainer_idx = pokemon.filter("_selected")["trainer_idx"].unique()
+    frames[ZAWazaData] = moves.join(
+        pokemon.select("trainer_idx", "slot", "_selected"),
+        on=["trainer_idx", "slot"],
+        how="left",
+    )
+    frames[ZAPokemonData] = pokemon
+    frames[ZATrainerData] = trainers.with_columns(
+        pl.col("trainer_idx").is_in(trainer_idx.implode()).alias("_selected")
+    )
+    return len(trainer_idx)
+
+
+def _model_of(field: str) -> type[pydantic.BaseModel] | None:
+    """Model owning a scalar field, if any."""
+    for model in (ZATrainerData, ZAPokemonData, ZAWazaData):
+        info = model.model_fields.get(field)
+        if info is not None and not _is_model(info.annotation):
+            return model
+    return None
+
+
+def _validate(model: type[pydantic.BaseModel], field: str, value: ty.Any) -> ty.Any:
+    """Validate a value of a field, as assigning it to a model would.
+
+    Raises:
+        pydantic.ValidationError: If the value is invalid.
+    """
+    instance = model.model_construct()
+    model.__pydantic_validator__.validate_assignment(instance, field, value)
+    return getattr(instance, field)
+
+
+def _is_model(annotation: ty.Any) -> bool:
+    """Whether a field holds a nested model."""
+    return isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel)
+
+
+def _trainer_filter(selector: TrainerSelector) -> "pl.Expr":
+    """Trainer criteria, as an expression over the trainers table."""
+    import polars as pl
+
+    expr = pl.lit(True)
+    if selector.tr_ids:
+        patterns = "|".join(_glob_regex(glob) for glob in selector.tr_ids)
+        expr &= pl.col("tr_id").cast(pl.String).str.contains(f"(?i)^(?:{patterns})$")
+    if selector.ranks:
+        rank = pl.col("za_rank").fill_null(field_default(ZATrainerData, "za_rank"))
+        expr &= rank.is_in(list(selector.ranks))
+    return expr
+
+
+def _pokemon_filter(selector: TrainerSelector) -> "pl.Expr":
+    """Pokémon criteria, as an expression over the Pokémon table."""
+    import polars as pl
+
+    dev_id = pl.col("dev_id").fill_null(field_default(ZAPokemonData, "dev_id"))
+    expr = dev_id != 0
+    if selector.species:
+        expr &= dev_id.is_in(list(selector.species))
+    if selector.slots:
+        expr &= pl.col("slot").is_in(list(selector.slots))
+    low, high = selector.level
+    level = pl.col("level").fill_null(field_default(ZAPokemonData, "level"))
+    if low is not None:
+        expr &= level >= low
+    if high is not None:
+        expr &= level <= high
+    return expr
+
+
+def _glob_regex(glob: str) -> str:
+    """Regular expression of a glob, without anchors.
+
+    `fnmatch.translate()` is not used: Polars regexes support neither its atomic
+    groups nor its end anchor.
+    """
+    parts: list[str] = []
+    i = 0
+    while i < len(glob):
+        char = glob[i]
+        end = glob.find("]", i + 2) if char == "[" else -1
+        if char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        elif end != -1:
+            members = glob[i + 1 : end]
+            negate = members.startswith("!")
+            members = re.escape(members[1:] if negate else members).replace(r"\-", "-")
+            parts.append(f"[{'^' if negate else ''}{members}]")
+            i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
+
+
+def _bounds(model: type[pydantic.BaseModel], field: str) -> tuple[ty.Any, ty.Any]:
+    """Lower and upper bounds of a field, `None` if unbounded."""
+    low = high = None
+    for constraint in model.model_fields[field].metadata:
+        if isinstance(constraint, annotated_types.Ge):
+            low = constraint.ge
+        elif isinstance(constraint, annotated_types.Le):
+            high = constraint.le
+    return low, high
+
+
+def _assign(
+    df: "pl.DataFrame",
+    model: type[pydantic.BaseModel],
+    assignment: Assignment,
+) -> tuple["pl.DataFrame", int]:
+    """Apply an assignment to the selected rows of a table.
+
+    Returns:
+        tuple[pl.DataFrame, int]: The table, and the number of values changed.
+    """
+    import polars as pl
+
+    field, op, value = assignment.field, assignment.op, assignment.value
+    column = pl.col(field)
+    dtype = df.schema[field]
+    if isinstance(dtype, pl.Struct | pl.List):
+        raise ValueError(f"Cannot assign {field!r}, it is not a scalar field.")
+    if op == "=":
+        new = pl.lit(value)
+    else:
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            raise ValueError(f"{assignment.text}: {op} needs a number.")
+        current = column.fill_null(field_default(model, field))
+        new = {
+            "+=": current + value,
+            "-=": current - value,
+            "*=": current * value,
+            "/=": current / value,
+        }[op]
+    selected = pl.col("_selected").fill_null(False)
+    if dtype.is_numeric():
+        # Checked before clipping, which would turn infinities into the bounds
+        non_finite = df.select((selected & ~new.cast(pl.Float64).is_finite()).sum())
+        if non_finite.item():
+            raise ValueError(
+                f"{assignment.text}: {non_finite.item()} result(s) are not finite."
+            )
+    if dtype.is_integer():
+        new = new.round(0)
+    if dtype.is_numeric():
+        low, high = _bounds(model, field)
+        if low is not None or high is not None:
+            new = new.clip(low, high)
+    new = new.cast(dtype, strict=True)
+    result = df.with_columns(pl.when(selected).then(new).otherwise(column).alias(field))
+    count = (
+        result[field].ne_missing(df[field]) & df["_selected"].fill_null(False)
+    ).sum()
+    return result, int(count)
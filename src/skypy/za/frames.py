@@ -1,4 +1,11 @@
-__all__ = ["FieldFrame", "CheckboxFrame", "PkmnFrame", "WazaFrame", "TrainerFrame"]
+__all__ = [
+    "FieldFrame",
+    "CheckboxFrame",
+    "PkmnFrame",
+    "PkmnSlot",
+    "WazaFrame",
+    "TrainerFrame",
+]
 
 
 import typing as ty
@@ -8,6 +15,11 @@ import pydantic
 
 from skypy.schemas import ZAPokemonData, ZATrainerData, ZAWazaData
 
+from .dropdown import FilterDropdown
+from .legality import LegalMoves
+
+ILLEGAL_MOVE_COLOR = "#E05A5A"
+
 CFG = pydantic.ConfigDict(
     extra="forbid",
     arbitrary_types_allowed=True,
@@ -44,7 +56,7 @@ class DropdownFrame(pydantic.BaseModel):
 
     field_frame: ctk.CTkFrame
     label: ctk.CTkLabel
-    option_menu: ctk.CTkOptionMenu
+    option_menu: ctk.CTkOptionMenu | FilterDropdown
 
 
 class WazaFrame(pydantic.BaseModel):
@@ -55,10 +67,11 @@ class WazaFrame(pydantic.BaseModel):
     frame: ctk.CTkFrame
     name_label: ctk.CTkLabel
     waza_variable: ctk.StringVar
-    option_menu: ctk.CTkOptionMenu
+    option_menu: ctk.CTkOptionMenu | FilterDropdown
     plus_var: ctk.BooleanVar
     plus_checkbox: ctk.CTkCheckBox
     waza_ref: ZAWazaData
+    _text_color: ty.Any = pydantic.PrivateAttr(None)
 
     @pydantic.model_validator(mode="after")
     def pack(self) -> ty.Self:
@@ -67,8 +80,14 @@ class WazaFrame(pydantic.BaseModel):
         self.name_label.pack(side="left", padx=5)
         self.option_menu.pack(side="left", fill="x", expand=True, padx=5)
         self.plus_checkbox.pack(side="left", padx=5)
+        self._text_color = self.option_menu.cget("text_color")
         return self
 
+    def flag(self, legal: bool) -> None:
+        """Show whether the Pokemon can learn the move."""
+        color = self._text_color if legal else ILLEGAL_MOVE_COLOR
+        self.option_menu.configure(text_color=color)
+
 
 class PkmnFrame(pydantic.BaseModel):
     """Pokemon frame."""
@@ -76,7 +95,6 @@ class PkmnFrame(pydantic.BaseModel):
     model_config = CFG
 
     frame: ctk.CTkFrame
-    title: ctk.CTkLabel
     dev_id_field: DropdownFrame
     item_field: DropdownFrame
     level_field: FieldFrame
@@ -87,6 +105,7 @@ class PkmnFrame(pydantic.BaseModel):
     waza_label: ctk.CTkLabel
     waza_frames: list[WazaFrame]
     pokemon_ref: ZAPokemonData
+    legal_moves: LegalMoves | None = None
 
     @pydantic.model_validator(mode="after")
     def validate(self) -> ty.Self:
@@ -94,17 +113,25 @@ class PkmnFrame(pydantic.BaseModel):
         assert len(self.waza_frames) == 4
         return self
 
+    def flag_illegal_moves(self) -> None:
+        """Flag the moves the Pokemon cannot learn, if `legal_moves` is set."""
+        if self.legal_moves is None:
+            return
+        illegal = self.legal_moves.illegal_moves(self.pokemon_ref)
+        for i, waza_frame in enumerate(self.waza_frames, start=1):
+            waza_frame.flag(i not in illegal)
+
     def update_pokemon_data(self, pokemon: ZAPokemonData) -> None:
         """Update the pokemon data."""
         # Update the mutable reference so closures see the new Pokemon
         self.pokemon_ref = pokemon
 
-        self.dev_id_field.option_menu.set(pokemon.dev_id_english)
-        self.item_field.option_menu.set(pokemon.item_english)
+        self.dev_id_field.option_menu.set(pokemon.dev_id_label)
+        self.item_field.option_menu.set(pokemon.item_label)
         self.level_field.var.set(str(pokemon.level))
         self.form_id_field.var.set(str(pokemon.form_id))
         self.sex_field.option_menu.set(str(pokemon.sex))
-        self.ball_id_field.option_menu.set(pokemon.ball_id_english)
+        self.ball_id_field.option_menu.set(pokemon.ball_id_label)
         self.scale_value_field.var.set(str(pokemon.scale_value))
         for waza_frame, waza in zip(
             self.waza_frames,
@@ -116,8 +143,83 @@ class PkmnFrame(pydantic.BaseModel):
             ),
         ):
             waza_frame.waza_ref = waza
-            waza_frame.option_menu.set(waza.waza_id_english)
+            waza_frame.option_menu.set(waza.waza_id_label)
             waza_frame.plus_var.set(waza.is_plus_waza)
+        self.flag_illegal_moves()
+
+
+class PkmnSlot(pydantic.BaseModel):
+    """Collapsible Pokemon slot, building its `PkmnFrame` on first expand.
+
+    The slot itself is only a frame and a header button. Its widgets are built the
+    first time it is expanded (or its `fields` are accessed), then kept and reused for
+    every trainer: selecting another trainer only updates them.
+    """
+
+    model_config = CFG
+
+    index: int
+    frame: ctk.CTkFrame
+    header: ctk.CTkButton
+    pokemon_ref: ZAPokemonData
+    build: ty.Callable[[ctk.CTkFrame, ZAPokemonData], PkmnFrame]
+    expanded: bool = False
+    _content: PkmnFrame | None = pydantic.PrivateAttr(None)
+
+    @pydantic.model_validator(mode="after")
+    def pack(self) -> ty.Self:
+        """Post init."""
+        self.header.configure(command=self.toggle)
+        self.refresh_header()
+        return self
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the widgets of the slot exist."""
+        return self._content is not None
+
+    @property
+    def fields(self) -> PkmnFrame:
+        """Widgets of the slot, built if needed (without expanding it)."""
+        if self._content is None:
+            self._content = self.build(self.frame, self.pokemon_ref)
+        return self._content
+
+    def expand(self) -> None:
+        """Show the widgets of the slot."""
+        self.fields.frame.pack(fill="x", padx=5, pady=(0, 5))
+        self.expanded = True
+        self.refresh_header()
+
+    def collapse(self) -> None:
+        """Hide the widgets of the slot."""
+        if self._content is not None:
+            self._content.frame.pack_forget()
+        self.expanded = False
+        self.refresh_header()
+
+    def toggle(self) -> None:
+        """Expand or collapse the slot."""
+        if self.expanded:
+            self.collapse()
+        else:
+            self.expand()
+
+    def refresh_header(self) -> None:
+        """Summarize the Pokemon in the header."""
+        arrow = "▾" if self.expanded else "▸"
+        pokemon = self.pokemon_ref
+        summary = "(empty)"
+        if pokemon.dev_id:
+            summary = f"{pokemon.dev_id_label}  Lv. {pokemon.level}"
+        self.header.configure(text=f"{arrow} Pokemon {self.index}: {summary}")
+
+    def update_pokemon_data(self, pokemon: ZAPokemonData) -> None:
+        """Update the pokemon data. Widgets not built yet are left alone."""
+        self.pokemon_ref = pokemon
+        if self._content is not None:
+            self._content.update_pokemon_data(pokemon)
+        self.refresh_header()
 
 
 class TrainerFrame(pydantic.BaseModel):
@@ -146,14 +248,14 @@ class TrainerFrame(pydantic.BaseModel):
     view_range_field: FieldFrame
     hearing_range_field: FieldFrame
     pokemon_label: ctk.CTkLabel
-    pokemon_fields: list[PkmnFrame]
+    pokemon_slots: list[PkmnSlot]
     trainer_ref: ZATrainerData
 
     @pydantic.model_validator(mode="after")
     def validate(self) -> ty.Self:
         """Post init."""
         # Validations
-        assert len(self.pokemon_fields) == 6
+        assert len(self.pokemon_slots) == 6
         return self
 
     def update_trainer_data(self, trainer: ZATrainerData) -> None:
@@ -177,8 +279,8 @@ class TrainerFrame(pydantic.BaseModel):
         self.view_vertical_angle_field.var.set(str(trainer.view_vertical_angle))
         self.view_range_field.var.set(str(trainer.view_range))
         self.hearing_range_field.var.set(str(trainer.hearing_range))
-        for pokemon_field, poke in zip(
-            self.pokemon_fields,
+        for pokemon_slot, poke in zip(
+            self.pokemon_slots,
             (
                 trainer.poke_1,
                 trainer.poke_2,
@@ -188,4 +290,4 @@ class TrainerFrame(pydantic.BaseModel):
                 trainer.poke_6,
             ),
         ):
-            pokemon_field.update_pokemon_data(poke)
+            pokemon_slot.update_pokemon_data(poke)
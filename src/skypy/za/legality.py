@@ -0,0 +1,191 @@
+__all__ = ["IllegalMove", "LegalMoves", "load_legal_moves", "find_illegal_moves"]
+
+import os
+import typing as ty
+
+from loguru import logger
+
+from skypy import settings
+from skypy._settings import lookup_tables
+from skypy.schemas import (
+    PERSONAL_ARRAY_FILE,
+    ZAPokemonData,
+    ZATrainerDataArray,
+    load_personal_array,
+)
+
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+
+_POKE_SLOTS = tuple(f"poke_{i}" for i in range(1, 7))
+_WAZA_SLOTS = tuple(f"waza_{i}" for i in range(1, 5))
+
+
+class IllegalMove(ty.NamedTuple):
+    """A move of a trainer's Pokémon that its species form cannot learn."""
+
+    tr_id: str
+    """ID of the trainer."""
+    slot: int
+    """Slot of the Pokémon, from 1 to 6."""
+    waza_slot: int
+    """Slot of the move, from 1 to 4."""
+    dev_id: int
+    """Species of the Pokémon."""
+    form_id: int
+    """Form of the Pokémon."""
+    waza_id: int
+    """The move."""
+
+
+class LegalMoves:
+    """Index of the moves each species form can learn, by level up, machine, egg or
+    reminder (see `skypy.schemas.ZAPersonalTables.learnset`).
+
+    The moves of a species form are a bitset (an `int`, bit `waza_id` set for each
+    legal move), so checking a move is a dictionary lookup and a bit test.
+
+    - Forms missing from the index fall back to the base form (`form_id` 0).
+    - Species missing from the index are not checked: all their moves are legal.
+    - The empty move (`waza_id` 0) is always legal.
+    """
+
+    def __init__(self, bitsets: ty.Mapping[tuple[int, int], int]) -> None:
+        """Args:
+        bitsets (Mapping[tuple[int, int], int]):
+            Bitset of the legal moves, keyed by `(dev_id, form_id)`.
+        """
+        self._bitsets = dict(bitsets)
+        self._species = {dev_id for dev_id, _ in self._bitsets}
+
+    def __len__(self) -> int:
+        """Number of species forms."""
+        return len(self._bitsets)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a species form, as `(dev_id, form_id)`, is in the index."""
+        return key in self._bitsets
+
+    @classmethod
+    def from_learnset(cls, learnset: "pl.DataFrame") -> "LegalMoves":
+        """Build the index from a learnset table, with `dev_id`, `form_id` and
+        `waza_id` columns.
+        """
+        import numpy as np
+        import polars as pl
+
+        pairs = learnset.select("dev_id", "form_id", "waza_id").unique()
+        keys = (
+            pairs.select("dev_id", "form_id")
+            .unique(maintain_order=True)
+            .with_row_index("row")
+        )
+        rows = pairs.join(keys, on=["dev_id", "form_id"])
+        waza_ids = rows.get_column("waza_id").cast(pl.Int64).to_numpy()
+        n_moves = int(waza_ids.max(initial=0)) + 1
+        # One row of bits per species form, packed to bytes then read as an `int`
+        bits = np.zeros((keys.height, n_moves), dtype=bool)
+        bits[rows.get_column("row").to_numpy(), waza_ids] = True
+        packed = np.packbits(bits, axis=1, bitorder="little")
+        return cls(
+            {
+                (dev_id, form_id): int.from_bytes(packed[row].tobytes(), "little")
+                for row, dev_id, form_id in keys.iter_rows()
+            }
+        )
+
+    def bitset(self, dev_id: int, form_id: int = 0) -> int | None:
+        """Bitset of the legal moves of a species form, `None` if the species is not
+        in the index.
+        """
+        bits = self._bitsets.get((dev_id, form_id))
+        if bits is None:
+            bits = self._bitsets.get((dev_id, 0))
+        return bits
+
+    def moves(self, dev_id: int, form_id: int = 0) -> list[int]:
+        """Legal moves of a species form, sorted. Empty if the species is not in the
+        index.
+        """
+        bits = self.bitset(dev_id, form_id) or 0
+        return [i for i in range(bits.bit_length()) if bits >> i & 1]
+
+    def is_legal(self, dev_id: int, form_id: int, waza_id: int) -> bool:
+        """Whether a species form can learn a move."""
+        if not waza_id:
+            return True
+        bits = self.bitset(dev_id, form_id)
+        if bits is None:
+            return dev_id not in self._species
+        return bool(bits >> waza_id & 1)
+
+    def illegal_moves(self, pokemon: ZAPokemonData) -> list[int]:
+        """Slots (1 to 4) of the moves of a Pokémon that its species form cannot
+        learn.
+        """
+        return [
+            i
+            for i, name in enumerate(_WAZA_SLOTS, start=1)
+            if not self.is_legal(
+                pokemon.dev_id, pokemon.form_id, getattr(pokemon, name).waza_id
+            )
+        ]
+
+
+def load_legal_moves(path: str | None = None) -> LegalMoves:
+    """Load the index of legal moves from the personal table, cached until the file
+    changes. See `skypy.schemas.load_personal_array()`.
+
+    Args:
+        path (str, optional):
+            Path of the personal table. Defaults to `personal_array.txt` in
+            `settings.files.za_raw_assets`.
+    """
+    if path is None:
+        path = os.path.join(settings.files.za_raw_assets, PERSONAL_ARRAY_FILE)
+
+    def _load(filename: str) -> LegalMoves:
+        legal = LegalMoves.from_learnset(load_personal_array(filename).learnset)
+        logger.trace(f"Indexed the legal moves of {len(legal)} species form(s).")
+        return legal
+
+    return lookup_tables.get(path, "legal_moves", _load)
+
+
+def find_illegal_moves(
+    zatrdata: ZATrainerDataArray,
+    legal: LegalMoves | None = None,
+) -> list[IllegalMove]:
+    """Find the moves of the trainers' Pokémon that their species form cannot learn.
+
+    Args:
+        zatrdata (ZATrainerDataArray):
+            The trainer data.
+
+        legal (LegalMoves, optional):
+            The index of legal moves. Defaults to `load_legal_moves()`.
+
+    Returns:
+        list[IllegalMove]: The illegal moves, in trainer, Pokémon and move order.
+    """
+    if legal is None:
+        legal = load_legal_moves()
+    found: list[IllegalMove] = []
+    for trainer in zatrdata.values:
+        for slot, name in enumerate(_POKE_SLOTS, start=1):
+            pokemon: ZAPokemonData = getattr(trainer, name)
+            if not pokemon.dev_id:
+                continue
+            for waza_slot in legal.illegal_moves(pokemon):
+                waza = getattr(pokemon, _WAZA_SLOTS[waza_slot - 1])
+                found.append(
+                    IllegalMove(
+                        tr_id=trainer.tr_id,
+                        slot=slot,
+                        waza_slot=waza_slot,
+                        dev_id=pokemon.dev_id,
+                        form_id=pokemon.form_id,
+                        waza_id=waza.waza_id,
+                    )
+                )
+    return found
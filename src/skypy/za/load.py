@@ -1,12 +1,20 @@
-__all__ = ["load_trainer_data"]
+__all__ = ["load_trainer_data", "read_trainer_data"]
 
 import json
 import os
+import typing as ty
 
 from loguru import logger
 
 from skypy import settings
-from skypy.schemas import ZATrainerDataArray
+from skypy.schemas import (
+    ZATrainerDataArray,
+    ZATrainerDataReader,
+    construct_trdata_array,
+    lazy_trdata_array,
+    normalize_trdata_record,
+    validate_in_background,
+)
 
 
 def load_trainer_data(
@@ -14,8 +22,39 @@ def load_trainer_data(
     input_dir: str = os.path.dirname(settings.files.file_trainer_data),
     output_dir: str | None = None,
     ignore_output_dir: bool = False,
+    trusted: bool = False,
+    background_validation: bool = False,
+    lazy: bool = False,
 ) -> ZATrainerDataArray:
-    """Load trainer data from a JSON file."""
+    """Load trainer data from a JSON file, or from a `trdata_array.bin` binary.
+
+    Args:
+        file_name (str):
+            Name of the file.
+
+        input_dir (str):
+            Directory of the file.
+
+        output_dir (str, optional):
+            Output directory. If it holds a file with the same name, that file is loaded
+            instead.
+
+        ignore_output_dir (bool):
+            Whether to ignore the output directory.
+
+        trusted (bool):
+            Whether the file comes from a trusted source (the assets shipped with this
+            package, or a file saved by this tool), so validation can be skipped.
+            See `skypy.schemas.construct_trdata_array()`.
+
+        background_validation (bool):
+            With `trusted`, whether to still validate the data, in a background thread.
+            Errors are logged.
+
+        lazy (bool):
+            Whether to build each trainer only when it is first accessed, for JSON
+            files. See `skypy.schemas.lazy_trdata_array()`.
+    """
     logger.trace("Loading trainer data...")
 
     # If output folder exists, use it
@@ -34,9 +73,34 @@ def load_trainer_data(
     logger.trace(f"Joining {dir_path} and {file_name}")
     path = os.path.join(dir_path, file_name)
     logger.info(f"Loading data from {path}...")
-    with open(path, encoding="utf-8") as f:
-        trdata: dict = json.load(f)
-    assert isinstance(trdata, dict), f"Expected dict, got {type(trdata)}"
-    trainers: ZATrainerDataArray = ZATrainerDataArray(**trdata)
+    is_binary = path.endswith(".bin")
+    trdata = read_trainer_data(path)
+    if lazy and not is_binary:
+        trainers = lazy_trdata_array(trdata, trusted=trusted)
+    elif trusted:
+        trainers = construct_trdata_array(trdata)
+    else:
+        trainers = ZATrainerDataArray.model_validate(trdata)
+    if trusted and background_validation:
+        validate_in_background(trdata, source=path)
     logger.trace(f"Loaded trainer data from {path}.")
     return trainers
+
+
+def read_trainer_data(path: str) -> dict[str, ty.Any]:
+    """Read the trainer data of a JSON file, or of a `trdata_array.bin` binary, as it
+    is, without building the models.
+
+    `flatc --json` output is normalized to the keys of `ZATrainerDataArray`.
+    """
+    if path.endswith(".bin"):
+        with ZATrainerDataReader(path) as reader:
+            trdata = reader.root.to_dict()
+    else:
+        with open(path, encoding="utf-8") as f:
+            trdata = json.load(f)
+    assert isinstance(trdata, dict), f"Expected dict, got {type(trdata)}"
+    if "values" not in trdata and "Table" in trdata:
+        # `flatc --json` output: schema names as keys
+        trdata = {"values": [normalize_trdata_record(r) for r in trdata["Table"]]}
+    return trdata
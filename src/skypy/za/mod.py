@@ -1,35 +1,269 @@
-__all__ = ["create_trdata_mod", "apply_trdata_mod"]
+__all__ = [
+    "ModRule",
+    "ModRecipe",
+    "RuleReport",
+    "ModReport",
+    "parse_mod_recipe",
+    "load_mod_recipe",
+    "create_trdata_mod",
+    "apply_trdata_mod",
+]
+
+import os
+import time
+import typing as ty
 
 from loguru import logger
 
+from skypy import settings
 from skypy.schemas import ZATrainerDataArray
 
+from .edit import (
+    Assignment,
+    TrainerSelector,
+    apply_assignments,
+    parse_assignment,
+    parse_level_range,
+    resolve_value,
+)
+from .tables import from_frames, to_frames
+
+_RULE_KEYS = frozenset(
+    {"name", "trainers", "ranks", "species", "level", "slots", "set"}
+)
+
+
+class ModRule(ty.NamedTuple):
+    """A rule of a mod recipe: assignments, and the trainers they apply to."""
+
+    name: str
+    """Name shown in reports."""
+    selector: TrainerSelector
+    """Which trainers and Pokémon the rule edits."""
+    assignments: tuple[Assignment, ...]
+    """The updates, applied in order."""
+
+
+class ModRecipe(ty.NamedTuple):
+    """Ordered rules, applied one after the other."""
+
+    name: str
+    """Name shown in reports."""
+    rules: tuple[ModRule, ...]
+    """The rules. Each rule selects trainers from the data edited by the previous ones."""
+
+
+class RuleReport(ty.NamedTuple):
+    """What a rule did."""
+
+    name: str
+    """Name of the rule."""
+    trainers: int
+    """Number of selected trainers."""
+    pokemon: int
+    """Number of selected Pokémon."""
+    changed: dict[str, int]
+    """Number of values changed by each assignment, keyed by its text."""
+    seconds: float
+    """Time spent on the rule."""
+
+
+class ModReport(ty.NamedTuple):
+    """Outcome of `apply_trdata_mod()`."""
+
+    zatrdata: ZATrainerDataArray
+    """The modded trainer data."""
+    rules: list[RuleReport]
+    """What each rule did, in order."""
+    seconds: float
+    """Total time, including the conversions from and to the trainer data."""
+
+    def summary(self) -> str:
+        """Human-readable report, one line per rule and assignment."""
+        lines: list[str] = []
+        for rule in self.rules:
+            lines.append(
+                f"{rule.name}: {rule.trainers} trainer(s), {rule.pokemon} Pokémon "
+                f"({rule.seconds * 1000:.1f} ms)"
+            )
+            lines.extend(
+                f"  {t}: {n} value(s) changed" for t, n in rule.changed.items()
+            )
+        lines.append(f"Total: {self.seconds:.3f}s")
+        return "\n".join(lines)
+
+
+def parse_mod_recipe(data: ty.Mapping[str, ty.Any], name: str = "") -> ModRecipe:
+    """Build a recipe from its YAML/TOML data.
+
+    A recipe has a `name` and a list of `rules`. A rule has a `name`, the criteria
+    `trainers` (ID globs), `ranks`, `species` (names or IDs), `level` (`"MIN:MAX"`) and
+    `slots` (1 to 6), each a value or a list, and the assignments to `set`, either as a
+    list such as `["level*=1.2", "ai_expert=true"]` or as a mapping of fields to values.
+
+    Args:
+        data (Mapping[str, Any]):
+            The recipe data.
+
+        name (str):
+            Name of the recipe, if it has no `name`.
+
+    Raises:
+        ValueError: If the recipe is invalid.
+    """
+    rules = data.get("rules")
+    if not isinstance(rules, list):
+        raise ValueError("A recipe needs a list of `rules`.")
+    return ModRecipe(
+        name=str(data.get("name", name)),
+        rules=tuple(_parse_rule(rule, i) for i, rule in enumerate(rules, start=1)),
+    )
+
+
+def load_mod_recipe(path: str) -> ModRecipe:
+    """Load a recipe from a YAML (`.yaml`, `.yml`) or TOML (`.toml`) file.
+
+    Raises:
+        ValueError: If the file type is not supported, or the recipe is invalid.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in (".yaml", ".yml", ".toml"):
+        raise ValueError(f"Unsupported recipe file type: {path}")
+    with open(path, encoding="utf-8") as f:
+        if ext == ".toml":
+            import toml  # type: ignore[import-untyped]
+
+            data = toml.load(f)
+        else:
+            import yaml  # type: ignore[import-untyped]
 
-def create_trdata_mod(zatrdata: ZATrainerDataArray, path: str) -> None:
+            data = yaml.safe_load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid recipe: {path}")
+    name = os.path.splitext(os.path.basename(path))[0]
+    logger.trace(f"Loaded recipe {name!r} from {path}.")
+    return parse_mod_recipe(data, name=name)
+
+
+def create_trdata_mod(
+    zatrdata: ZATrainerDataArray,
+    path: str,
+    recipe: ModRecipe | str | None = None,
+    create_binaries: bool = False,
+) -> ModReport:
     """Create the `trdata` mod.
 
     Args:
         zatrdata (ZATrainerDataArray):
-            The `trdata` data to create the mod for.
+            The `trdata` data to create the mod for, left untouched.
 
         path (str):
             The path to save the mod to.
+
+        recipe (ModRecipe | str, optional):
+            The recipe, or the path of its file. See `apply_trdata_mod()`.
+
+        create_binaries (bool):
+            Whether to also write the binary next to the JSON file.
+
+    Returns:
+        ModReport: The modded data, and what each rule did.
     """
-    apply_trdata_mod(zatrdata)
+    report = apply_trdata_mod(zatrdata, recipe)
     # Finally
     logger.trace(f"Dumping data to {path}...")
-    zatrdata.dump(path)
+    report.zatrdata.dump(path, create_binaries=create_binaries)
     logger.trace(f"Data dumped to {path}.")
+    return report
 
 
-def apply_trdata_mod(zatrdata: ZATrainerDataArray) -> None:
-    """Apply the `trdata` mod."""
-    logger.trace("Applying `trdata` mod...")
+def apply_trdata_mod(
+    zatrdata: ZATrainerDataArray,
+    recipe: ModRecipe | str | None = None,
+) -> ModReport:
+    """Apply the `trdata` mod.
 
-    # Edit trainer
-    name = "00_test_data"
-    trainer = zatrdata.get_trainer(name)
-    trainer.poke_1.level = 100
-    zatrdata.set_trainer(name, trainer)
+    The data is converted to tables once, the rules are applied to them in order, each
+    assignment as one vectorized column expression (see `skypy.za.edit`), and the
+    result is validated once, when converted back.
+
+    Args:
+        zatrdata (ZATrainerDataArray):
+            The `trdata` data, left untouched.
+
+        recipe (ModRecipe | str, optional):
+            The recipe, or the path of its file. Defaults to the recipe shipped with
+            this package, `settings.files.file_trainer_data_mod`.
+
+    Returns:
+        ModReport: The modded data, and what each rule did.
+    """
+    if recipe is None:
+        recipe = settings.files.file_trainer_data_mod
+    if isinstance(recipe, str):
+        recipe = load_mod_recipe(recipe)
+    logger.trace(f"Applying `trdata` mod {recipe.name!r}...")
+
+    start = time.perf_counter()
+    frames = to_frames(zatrdata)
+    reports: list[RuleReport] = []
+    for rule in recipe.rules:
+        rule_start = time.perf_counter()
+        trainers, pokemon, changed = apply_assignments(
+            frames, rule.selector, rule.assignments
+        )
+        seconds = time.perf_counter() - rule_start
+        reports.append(RuleReport(rule.name, trainers, pokemon, changed, seconds))
+        logger.debug(f"Rule {rule.name!r}: {trainers} trainer(s) in {seconds:.3f}s")
+    modded = from_frames(frames)
+    report = ModReport(modded, reports, time.perf_counter() - start)
 
     logger.trace("`trdata` mod applied.")
+    return report
+
+
+def _parse_rule(data: ty.Any, index: int) -> ModRule:
+    """Build the `index`-th rule of a recipe."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Rule {index} is not a mapping.")
+    name = str(data.get("name", f"Rule {index}"))
+    unknown = set(data) - _RULE_KEYS
+    if unknown:
+        raise ValueError(f"{name}: unknown key(s) {sorted(unknown)}.")
+    updates = data.get("set")
+    if isinstance(updates, dict):
+        updates = [f"{field}={value}" for field, value in updates.items()]
+    updates = _as_tuple(updates)
+    if not updates:
+        raise ValueError(f"{name}: nothing to `set`.")
+    try:
+        level = data.get("level")
+        if isinstance(level, list | tuple):
+            low, high = level
+            level_range = (low, high)
+        elif level is not None:
+            level_range = parse_level_range(str(level))
+        else:
+            level_range = (None, None)
+        selector = TrainerSelector(
+            tr_ids=tuple(str(glob) for glob in _as_tuple(data.get("trainers"))),
+            ranks=tuple(int(rank) for rank in _as_tuple(data.get("ranks"))),
+            species=tuple(
+                resolve_value("dev_id", str(s)) for s in _as_tuple(data.get("species"))
+            ),
+            level=level_range,
+            slots=tuple(int(slot) for slot in _as_tuple(data.get("slots"))),
+        )
+        assignments = tuple(parse_assignment(str(text)) for text in updates)
+    except ValueError as ex:
+        raise ValueError(f"{name}: {ex}") from ex
+    return ModRule(name, selector, assignments)
+
+
+def _as_tuple(value: ty.Any) -> tuple[ty.Any, ...]:
+    """A value as a tuple: `None` is empty, a scalar is a single value."""
+    if value is None:
+        return ()
+    if isinstance(value, list | tuple):
+        return tuple(value)
+    return (value,)
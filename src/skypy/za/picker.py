@@ -0,0 +1,297 @@
+__all__ = ["VirtualList", "TrainerPicker"]
+
+import tkinter as tk
+import typing as ty
+
+import customtkinter as ctk
+from loguru import logger
+
+from .search import TrainerSearchIndex
+
+PICKER_VISIBLE_ROWS = 6
+PICKER_ROW_HEIGHT = 24
+
+
+class VirtualList(ctk.CTkFrame):
+    """Searchable list, rendering only its visible rows.
+
+    Typing in the search entry filters the values with `search`. The list is
+    virtualized: only `visible_rows` row widgets exist, and scrolling relabels them
+    with the results at the current offset, so its cost does not depend on the number
+    of values.
+
+    Keys: `Up`/`Down` move the highlight, `Return` selects the highlighted value.
+    """
+
+    def __init__(
+        self,
+        master: ty.Any,
+        search: ty.Callable[[str], list[str]],
+        command: ty.Callable[[str], None],
+        label: ty.Callable[[str], str] = str,
+        visible_rows: int = PICKER_VISIBLE_ROWS,
+        placeholder_text: str = "Search...",
+        **kwargs: ty.Any,
+    ) -> None:
+        """Args:
+        master (Any):
+            Parent widget.
+
+        search (Callable[[str], list[str]]):
+            Returns the values matching a query, best first. An empty query returns
+            all values.
+
+        command (Callable[[str], None]):
+            Called with the value when a value is selected.
+
+        label (Callable[[str], str]):
+            Text shown for a value.
+
+        visible_rows (int):
+            Number of rows shown at once.
+
+        placeholder_text (str):
+            Placeholder of the search entry.
+
+        **kwargs (Any):
+            Additional keyword arguments to pass to the parent class.
+        """
+        super().__init__(master, **kwargs)
+        self.search_func = search
+        self.label_func = label
+        self.command = command
+        self.visible_rows = visible_rows
+        self.results: list[str] = search("")
+        self.total = len(self.results)
+        self.offset = 0
+        self.highlighted = 0
+        self._selected = self.results[0] if self.results else ""
+
+        self.search_var = ctk.StringVar(value="")
+        self.search_entry = ctk.CTkEntry(
+            self,
+            textvariable=self.search_var,
+            placeholder_text=placeholder_text,
+        )
+        self.search_entry.pack(fill="x", padx=5, pady=(5, 2))
+        self.count_label = ctk.CTkLabel(self, text="", anchor="w")
+        self.count_label.pack(fill="x", padx=5)
+
+        list_frame = ctk.CTkFrame(self, fg_color="transparent")
+        list_frame.pack(fill="x", padx=5, pady=(0, 5))
+        rows_frame = ctk.CTkFrame(list_frame, fg_color="transparent")
+        rows_frame.pack(side="left", fill="x", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(
+            list_frame,
+            command=self._on_scrollbar,
+            height=visible_rows * PICKER_ROW_HEIGHT,
+        )
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.rows: list[ctk.CTkButton] = []
+        self._text_color = ctk.ThemeManager.theme["CTkButton"]["text_color"]
+        for k in range(visible_rows):
+            row = ctk.CTkButton(
+                rows_frame,
+                text="",
+                anchor="w",
+                height=PICKER_ROW_HEIGHT,
+                fg_color="transparent",
+                command=lambda k=k: self._on_row_click(k),  # type: ignore[misc]
+            )
+            row.pack(fill="x")
+            row.bind("<MouseWheel>", self._on_mousewheel)
+            self.rows.append(row)
+
+        self.search_var.trace_add(
+            "write", lambda *_: self.search(self.search_var.get())
+        )
+        self.search_entry.bind("<Down>", lambda event: self.move(1))
+        self.search_entry.bind("<Up>", lambda event: self.move(-1))
+        self.search_entry.bind("<Return>", lambda event: self.select_highlighted())
+        self._render()
+
+    def get(self) -> str:
+        """The selected value."""
+        return self._selected
+
+    def reset(
+        self,
+        search: ty.Callable[[str], list[str]],
+        label: ty.Callable[[str], str] = str,
+        selected: str = "",
+    ) -> None:
+        """Show other values: clear the query, and reveal the selected value.
+
+        Args:
+            search (Callable[[str], list[str]]):
+                See `VirtualList`.
+
+            label (Callable[[str], str]):
+                See `VirtualList`.
+
+            selected (str):
+                Value to mark as selected.
+        """
+        self.search_func = search
+        self.label_func = label
+        self._selected = selected
+        if self.search_var.get():
+            self.search_var.set("")
+        self.results = search("")
+        self.total = len(self.results)
+        self.reveal(selected)
+
+    def reveal(self, value: str) -> None:
+        """Highlight a value and scroll to it, if it is among the results."""
+        try:
+            self.highlighted = self.results.index(value)
+        except ValueError:
+            self.highlighted = 0
+        self.scroll_to(self.highlighted - self.visible_rows // 2, force=True)
+
+    def search(self, query: str) -> list[str]:
+        """Filter the list, highlighting the best match.
+
+        Args:
+            query (str):
+                Search query.
+
+        Returns:
+            list[str]: Matching values.
+        """
+        self.results = self.search_func(query)
+        self.offset = 0
+        self.highlighted = 0
+        self._render()
+        logger.trace(f"Search {query!r}: {len(self.results)} result(s).")
+        return self.results
+
+    def scroll_to(self, offset: int, force: bool = False) -> None:
+        """Show the results from this position on."""
+        last = max(len(self.results) - self.visible_rows, 0)
+        offset = min(max(offset, 0), last)
+        if force or offset != self.offset:
+            self.offset = offset
+            self._render()
+
+    def move(self, step: int) -> None:
+        """Move the highlight, scrolling to keep it visible."""
+        if not self.results:
+            return
+        self.highlighted = min(max(self.highlighted + step, 0), len(self.results) - 1)
+        if self.highlighted < self.offset:
+            self.offset = self.highlighted
+        elif self.highlighted >= self.offset + self.visible_rows:
+            self.offset = self.highlighted - self.visible_rows + 1
+        self._render()
+
+    def select(self, value: str) -> None:
+        """Select a value, and notify `command`."""
+        self._selected = value
+        self._render()
+        self.command(value)
+
+    def select_highlighted(self) -> None:
+        """Select the highlighted value, if any."""
+        if self.results:
+            self.select(self.results[self.highlighted])
+
+    def count_text(self) -> str:
+        """Text of the result count label."""
+        if not self.results:
+            return "No match"
+        return f"{len(self.results)} of {self.total}"
+
+    def _on_row_click(self, k: int) -> None:
+        """Select the value shown in row `k`."""
+        i = self.offset + k
+        if i < len(self.results):
+            self.highlighted = i
+            self.select(self.results[i])
+
+    def _on_scrollbar(self, *args: ty.Any) -> None:
+        """Scroll from the scrollbar (`moveto` fraction or `scroll` steps)."""
+        if args and args[0] == "moveto":
+            self.scroll_to(round(float(args[1]) * len(self.results)))
+        elif args and args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self.scroll_to(self.offset + int(args[1]) * step)
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        """Scroll the list with the mouse wheel, without scrolling the page."""
+        self.scroll_to(self.offset + (-1 if event.delta > 0 else 1))
+        return "break"
+
+    def _render(self) -> None:
+        """Label the row widgets with the visible results."""
+        for k, row in enumerate(self.rows):
+            i = self.offset + k
+            if i < len(self.results):
+                value = self.results[i]
+                highlighted = i == self.highlighted
+                selected = value == self._selected
+                row.configure(
+                    text=self.label_func(value),
+                    state="normal",
+                    fg_color=("gray75", "gray30") if highlighted else "transparent",
+                    text_color="orange" if selected else self._text_color,
+                )
+            else:
+                row.configure(text="", state="disabled", fg_color="transparent")
+        total = len(self.results)
+        if total:
+            end = min(self.offset + self.visible_rows, total)
+            self.scrollbar.set(self.offset / total, end / total)
+        else:
+            self.scrollbar.set(0, 1)
+        self.count_label.configure(text=self.count_text())
+
+
+class TrainerPicker(VirtualList):
+    """Searchable trainer list, see `TrainerSearchIndex` for how trainers match.
+
+    The index catches up with edited trainers whenever the search entry gets focus.
+    """
+
+    def __init__(
+        self,
+        master: ty.Any,
+        index: TrainerSearchIndex,
+        command: ty.Callable[[str], None],
+        visible_rows: int = PICKER_VISIBLE_ROWS,
+        **kwargs: ty.Any,
+    ) -> None:
+        """Args:
+        master (Any):
+            Parent widget.
+
+        index (TrainerSearchIndex):
+            Search index of the trainers.
+
+        command (Callable[[str], None]):
+            Called with the trainer ID when a trainer is selected.
+
+        visible_rows (int):
+            Number of rows shown at once.
+
+        **kwargs (Any):
+            Additional keyword arguments to pass to the parent class.
+        """
+        self.index = index
+        super().__init__(
+            master,
+            search=index.search,
+            command=command,
+            label=index.label,
+            visible_rows=visible_rows,
+            placeholder_text="Search trainer, species, item or rank...",
+            **kwargs,
+        )
+        self.search_entry.bind("<FocusIn>", lambda event: self.index.sync())
+
+    def count_text(self) -> str:
+        """Text of the result count label."""
+        if not self.results:
+            return "No trainer found"
+        return f"{len(self.results)} of {len(self.index)} trainers"
@@ -0,0 +1,160 @@
+__all__ = ["TRAINER_VIEWS", "RAW_VIEWS", "connect", "query"]
+
+import typing as ty
+
+import pydantic
+from loguru import logger
+
+from skypy import settings
+from skypy.schemas import (
+    ZAItemArray,
+    ZAPersonalWazaArray,
+    ZAPokemonData,
+    ZATokuseiArray,
+    ZATrainerData,
+    ZATrainerDataArray,
+    ZAWazaArray,
+    ZAWazaData,
+    ZAWazaParamArray,
+    load_personal_array,
+)
+
+from .tables import to_frames, with_defaults
+
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import duckdb
+    import polars as pl
+
+TRAINER_VIEWS: dict[str, type[pydantic.BaseModel]] = {
+    "trainers": ZATrainerData,
+    "pokemon": ZAPokemonData,
+    "moves": ZAWazaData,
+}
+"""Views of the trainer data, and the model of their rows.
+
+`trainers` has one row per trainer, `pokemon` one row per non-empty Pokémon (with its
+`slot`, 1 to 6) and `moves` one row per non-empty move (with its `waza_slot`, 1 to 4).
+All of them have the `trainer_idx` and `tr_id` of the trainer. Unset fields hold their
+default.
+"""
+
+
+def _names(names: ty.Any) -> "pl.DataFrame":
+    """Table of the display labels of a `DisplayNames`, by ID."""
+    import polars as pl
+
+    labels: tuple[str, ...] = names.labels
+    return pl.DataFrame(
+        {"id": range(len(labels)), "name": labels},
+        schema={"id": pl.Int64, "name": pl.String},
+    )
+
+
+RAW_VIEWS: dict[str, ty.Callable[[], "pl.DataFrame"]] = {
+    "waza": lambda: ZAWazaArray.load().to_polars(),
+    "personal_waza": lambda: ZAPersonalWazaArray.load().to_polars(),
+    "waza_params": lambda: ZAWazaParamArray.load().to_polars(),
+    "items": lambda: ZAItemArray.load().to_polars(),
+    "abilities": lambda: ZATokuseiArray.load().to_polars(),
+    "species": lambda: load_personal_array().species,
+    "evolutions": lambda: load_personal_array().evolutions,
+    "learnset": lambda: load_personal_array().learnset,
+    "species_names": lambda: _names(settings.za_species_names),
+    "waza_names": lambda: _names(settings.za_waza_names),
+    "item_names": lambda: _names(settings.za_item_names),
+}
+"""Views of the game data in `settings.files.za_raw_assets`, and how to load them.
+
+See `skypy.schemas.ZARawTable` and `skypy.schemas.load_personal_array()`. The
+`*_names` views map IDs to their display label.
+"""
+
+
+def connect(
+    zatrdata: ZATrainerDataArray | None = None,
+    raw: bool = True,
+    con: "duckdb.DuckDBPyConnection | None" = None,
+) -> "duckdb.DuckDBPyConnection":
+    """Open a DuckDB connection with the trainer data and the game data as views.
+
+    The tables are registered as Arrow tables, so DuckDB scans them in place rather than
+    copying them. See `TRAINER_VIEWS` and `RAW_VIEWS` for the names of the views.
+
+    Args:
+        zatrdata (ZATrainerDataArray, optional):
+            The trainer data. If `None`, only the game data is registered.
+
+        raw (bool):
+            Whether to register the game data.
+
+        con (duckdb.DuckDBPyConnection, optional):
+            Connection to register the views in. Defaults to a new in-memory database.
+
+    Example:
+        >>> con = connect(load_trainer_data())
+        >>> con.sql("SELECT za_rank, avg(level) FROM trainers JOIN pokemon "
+        ...         "USING (trainer_idx) GROUP BY za_rank ORDER BY za_rank").pl()
+    """
+    import duckdb
+    import polars as pl
+
+    if con is None:
+        con = duckdb.connect()
+    views: dict[str, pl.DataFrame] = {}
+    if zatrdata is not None:
+        frames = to_frames(zatrdata)
+        for name, model in TRAINER_VIEWS.items():
+            frame = with_defaults(frames[model], model).with_columns(
+                pl.col("tr_id").cast(pl.String)
+            )
+            if model is ZAPokemonData:
+                frame = frame.filter(pl.col("dev_id") != 0)
+            elif model is ZAWazaData:
+                frame = frame.filter(pl.col("waza_id") != 0)
+            views[name] = frame
+    if raw:
+        views.update((name, load()) for name, load in RAW_VIEWS.items())
+    for name, frame in views.items():
+        con.register(name, frame.to_arrow())
+    logger.trace(f"Registered {len(views)} view(s): {list(views)}")
+    return con
+
+
+def query(
+    sql: str,
+    zatrdata: ZATrainerDataArray | None = None,
+    raw: bool = True,
+    params: ty.Sequence[ty.Any] | ty.Mapping[str, ty.Any] | None = None,
+) -> "pl.DataFrame":
+    """Run a SQL query over the trainer data and the game data. See `connect()`.
+
+    Args:
+        sql (str):
+            The query, e.g. `SELECT tr_id FROM moves JOIN waza_names ON waza_id = id
+            WHERE name = ?`.
+
+        zatrdata (ZATrainerDataArray, optional):
+            The trainer data. If `None`, only the game data can be queried.
+
+        raw (bool):
+            Whether the game data can be queried.
+
+        params (Sequence | Mapping, optional):
+            Values of the parameters of the query (`?`, `$1` or `$name`).
+
+    Returns:
+        pl.DataFrame: The result of the query, empty if the statement returns no rows
+            (e.g. `SET`).
+
+    Raises:
+        duckdb.Error: If the query is invalid.
+    """
+    import polars as pl
+
+    con = connect(zatrdata, raw=raw)
+    try:
+        relation = con.sql(sql, params=params)
+        # Statements that are not queries (e.g. `SET`) have no result
+        return pl.DataFrame() if relation is None else relation.pl()
+    finally:
+        con.close()
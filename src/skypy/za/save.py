@@ -0,0 +1,172 @@
+__all__ = ["SaveJob", "SaveEvent", "SaveWorker", "save_snapshot"]
+
+import functools
+import os
+import queue
+import threading
+import typing as ty
+
+from loguru import logger
+
+from skypy.schemas import (
+    ZATrainerDataSnapshot,
+    check_bfbs_layout,
+    construct_trdata_array,
+    encode_trdata_array,
+    resolve_bfbs_file,
+)
+
+
+class SaveJob(ty.NamedTuple):
+    """A save request: a snapshot of the trainer data, and where to write it."""
+
+    snapshot: ZATrainerDataSnapshot
+    """State of the trainer data when the save was requested."""
+    path: str
+    """Path of the JSON file."""
+    create_binaries: bool = True
+    """Whether to also write the FlatBuffers binary, next to the JSON file."""
+    bfbs_file: str | None = None
+    """Binary schema to check the layout of the binary against, see
+    `skypy.schemas.resolve_bfbs_file()`.
+    """
+
+
+class SaveEvent(ty.NamedTuple):
+    """Progress or outcome of a save job, reported by `SaveWorker`."""
+
+    kind: ty.Literal["progress", "done", "error"]
+    job: SaveJob
+    message: str = ""
+    error: BaseException | None = None
+
+
+def save_snapshot(
+    job: SaveJob,
+    progress: ty.Callable[[str], None] | None = None,
+) -> None:
+    """Write a snapshot of the trainer data to disk.
+
+    Files are written to a temporary file first, then moved in place, so a file is
+    never left half-written.
+
+    Args:
+        job (SaveJob):
+            What to save, and where.
+
+        progress (Callable[[str], None], optional):
+            Called with a message before each step.
+    """
+    progress = progress or (lambda message: None)
+    bfbs_file = resolve_bfbs_file(job.bfbs_file) if job.create_binaries else None
+    if bfbs_file is not None:
+        progress(f"Checking {bfbs_file}...")
+        check_bfbs_layout(bfbs_file)
+    progress(f"Writing {job.path}...")
+    _write_atomic(job.path, job.snapshot.to_json().encode("utf-8"))
+    logger.trace(f"Dumped data to {job.path}.")
+    if job.create_binaries:
+        path = f"{os.path.splitext(job.path)[0]}.bin"
+        progress(f"Writing {path}...")
+        zatrdata = construct_trdata_array({"values": job.snapshot.records})
+        _write_atomic(path, encode_trdata_array(zatrdata))
+        logger.trace(f"Created binary {path}.")
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write a file through a temporary file in the same directory."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class SaveWorker:
+    """Saves trainer data on a background thread, one job at a time.
+
+    Jobs submitted while a save is running are coalesced: only the latest one is kept,
+    and it runs when the current save is done. Progress and outcomes are put in
+    `events`, to be consumed from the GUI thread (e.g. polled with `after()`), since
+    Tk must not be called from the worker thread.
+    """
+
+    def __init__(
+        self,
+        save: ty.Callable[[SaveJob, ty.Callable[[str], None]], None] = save_snapshot,
+    ) -> None:
+        """Args:
+        save (Callable[[SaveJob, Callable[[str], None]], None]):
+            Function writing a job, given a progress callback.
+            Defaults to `save_snapshot()`.
+        """
+        self.events: queue.Queue[SaveEvent] = queue.Queue()
+        self._save = save
+        self._lock = threading.Lock()
+        self._pending: SaveJob | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def busy(self) -> bool:
+        """Whether a save is running or pending."""
+        with self._lock:
+            return self._thread is not None
+
+    def submit(self, job: SaveJob) -> bool:
+        """Queue a save job, starting the worker thread if needed.
+
+        Args:
+            job (SaveJob):
+                The job.
+
+        Returns:
+            bool: Whether the job replaced a pending one, which is then dropped.
+        """
+        with self._lock:
+            coalesced = self._pending is not None
+            self._pending = job
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="skypy-save", daemon=False
+                )
+                self._thread.start()
+        if coalesced:
+            logger.trace(f"Save to {job.path} replaces the pending one.")
+        return coalesced
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait for the running and pending saves to finish.
+
+        Args:
+            timeout (float, optional):
+                Maximum time to wait, in seconds.
+
+        Returns:
+            bool: Whether all saves are finished.
+        """
+        with self._lock:
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return not self.busy
+
+    def _put_progress(self, job: SaveJob, message: str) -> None:
+        """Report the progress of a job."""
+        self.events.put(SaveEvent("progress", job, message))
+
+    def _run(self) -> None:
+        """Run jobs until none is pending."""
+        while True:
+            with self._lock:
+                job = self._pending
+                self._pending = None
+                if job is None:
+                    self._thread = None
+                    return
+
+            try:
+                self._save(job, functools.partial(self._put_progress, job))
+            except Exception as e:
+                logger.error(f"Failed to save {job.path}: {e}")
+                self.events.put(SaveEvent("error", job, str(e), e))
+            else:
+                self.events.put(SaveEvent("done", job, f"Saved to {job.path}"))
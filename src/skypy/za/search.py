@@ -0,0 +1,318 @@
+__all__ = ["TrainerSearchIndex", "TrainerSearchEntry", "OptionList"]
+
+import re
+import typing as ty
+
+from skypy import settings
+from skypy.schemas import (
+    LazyTrainerList,
+    ZAPokemonData,
+    ZATrainerData,
+    ZATrainerDataArray,
+)
+
+# How a query token matched, best first
+MATCH_PREFIX = 0
+MATCH_SUBSTRING = 1
+MATCH_TERM = 2
+MATCH_FUZZY = 3
+
+
+def _alias(model: type[ty.Any], name: str) -> str:
+    """Alias of a field, as used in the dumped records."""
+    alias: str = model.model_fields[name].alias or name
+    return alias
+
+
+_POKE_KEYS = tuple(
+    (name, _alias(ZATrainerData, name)) for name in (f"poke_{i}" for i in range(1, 7))
+)
+_TR_ID_KEY = _alias(ZATrainerData, "tr_id")
+_ZA_RANK_KEY = _alias(ZATrainerData, "za_rank")
+_DEV_ID_KEY = _alias(ZAPokemonData, "dev_id")
+_ITEM_KEY = _alias(ZAPokemonData, "item")
+
+
+class TrainerSearchEntry(ty.NamedTuple):
+    """Searchable terms of a trainer."""
+
+    tr_id: str
+    """Trainer ID."""
+    species: tuple[str, ...]
+    """English names of its Pokémon."""
+    items: tuple[str, ...]
+    """English names of the items its Pokémon hold."""
+    rank: str
+    """ZA rank name, empty if unset."""
+    key: str
+    """Lowercase trainer ID, matched by prefix, substring and fuzzy search."""
+    terms: str
+    """Lowercase species, items and rank, matched by substring."""
+
+    @property
+    def label(self) -> str:
+        """Text shown for the trainer in lists."""
+        if not self.species:
+            return self.tr_id
+        return f"{self.tr_id}  ({', '.join(self.species)})"
+
+
+class TrainerSearchIndex:
+    """Incremental search over trainer IDs, species, ranks and held items.
+
+    Every query token must match, either as a prefix of the trainer ID, as a
+    substring of the trainer ID, as a substring of a species, item or rank name, or as
+    a subsequence of the trainer ID (fuzzy), in that order of preference. Results are
+    sorted by how well they match, then by position in the table.
+
+    Typing a query that extends the previous one only searches the previous results.
+    Lazy trainers are indexed from their raw records, without materializing them.
+    """
+
+    def __init__(self, zatrdata: ZATrainerDataArray) -> None:
+        """Args:
+        zatrdata (ZATrainerDataArray):
+            The trainer data to index.
+        """
+        self.zatrdata = zatrdata
+        self.entries: list[TrainerSearchEntry] = []
+        self._positions: dict[str, int] = {}
+        self._last: tuple[tuple[str, ...], list[int]] | None = None
+        self.rebuild()
+
+    def __len__(self) -> int:
+        """Number of indexed trainers."""
+        return len(self.entries)
+
+    def rebuild(self) -> None:
+        """Index all trainers again."""
+        values = self.zatrdata.values
+        if isinstance(values, LazyTrainerList):
+            self.entries = [
+                _entry_from_record(record)
+                for record in self.zatrdata.snapshot().records
+            ]
+        else:
+            self.entries = [_entry_from_trainer(trainer) for trainer in values]
+        self._positions = {}
+        for i, entry in enumerate(self.entries):
+            self._positions.setdefault(entry.tr_id, i)
+        self._last = None
+
+    def refresh(self, positions: ty.Iterable[int]) -> None:
+        """Index some trainers again, e.g. after they were edited."""
+        values = self.zatrdata.values
+        for i in positions:
+            old = self.entries[i]
+            self.entries[i] = _entry_from_trainer(values[i])
+            if old.tr_id != self.entries[i].tr_id:
+                if self._positions.get(old.tr_id) == i:
+                    del self._positions[old.tr_id]
+                self._positions.setdefault(self.entries[i].tr_id, i)
+        self._last = None
+
+    def sync(self) -> None:
+        """Catch up with edits of the trainer data.
+
+        For lazy data, only the materialized trainers are indexed again: the others
+        cannot have been edited. Whether they were saved since does not matter (see
+        `LazyTrainerList.is_materialized()`). Otherwise, or if trainers were added or
+        removed, everything is indexed again.
+        """
+        values = self.zatrdata.values
+        if isinstance(values, LazyTrainerList) and len(values) == len(self.entries):
+            self.refresh(i for i in range(len(values)) if values.is_materialized(i))
+        else:
+            self.rebuild()
+
+    def search(self, query: str, limit: int | None = None) -> list[str]:
+        """Search trainers.
+
+        Args:
+            query (str):
+                Space-separated tokens, case-insensitive. An empty query returns all
+                trainers, in table order.
+
+            limit (int, optional):
+                Maximum number of results.
+
+        Returns:
+            list[str]: Matching trainer IDs, best matches first.
+        """
+        return [self.entries[i].tr_id for i in self.search_positions(query, limit)]
+
+    def search_positions(self, query: str, limit: int | None = None) -> list[int]:
+        """Same as `search()`, returning positions in the table."""
+        tokens = tuple(query.lower().split())
+        if not tokens:
+            positions = list(range(len(self.entries)))
+            return positions[:limit]
+        candidates: ty.Iterable[int] = range(len(self.entries))
+        if self._last is not None and _narrows(self._last[0], tokens):
+            candidates = self._last[1]
+        patterns = [_fuzzy_pattern(token) for token in tokens]
+        scored: list[tuple[int, int]] = []
+        for i in candidates:
+            score = _score(self.entries[i], tokens, patterns)
+            if score is not None:
+                scored.append((score, i))
+        scored.sort()
+        positions = [i for _, i in scored]
+        self._last = (tokens, sorted(positions))
+        return positions[:limit]
+
+    def label(self, trid: str) -> str:
+        """Text shown for a trainer in lists."""
+        i = self._positions.get(trid)
+        return trid if i is None else self.entries[i].label
+
+
+class OptionList:
+    """Values of a dropdown, built once and shared by all dropdowns of a table.
+
+    Values are deduplicated, keeping their first occurrence. Their lowercase copies are
+    kept too, so filtering does not lowercase the whole table on each keystroke.
+    """
+
+    def __init__(self, values: ty.Iterable[str]) -> None:
+        """Args:
+        values (Iterable[str]):
+            The values, in display order.
+        """
+        self.values: tuple[str, ...] = tuple(dict.fromkeys(values))
+        self._lower = tuple(value.lower() for value in self.values)
+        self._last: tuple[str, list[int]] | None = None
+
+    def __len__(self) -> int:
+        """Number of values."""
+        return len(self.values)
+
+    def __contains__(self, value: object) -> bool:
+        """Whether a value is an option."""
+        return value in self.values
+
+    def filter(self, query: str) -> list[str]:
+        """Values containing the query, case-insensitive.
+
+        Values starting with the query come first, then the other matches, each in
+        display order. Typing a query that extends the previous one only filters the
+        previous matches.
+
+        Args:
+            query (str):
+                Text to look for. An empty query returns all values.
+
+        Returns:
+            list[str]: Matching values.
+        """
+        q = query.strip().lower()
+        if not q:
+            return list(self.values)
+        candidates: ty.Iterable[int] = range(len(self.values))
+        if self._last is not None and self._last[0] in q:
+            candidates = self._last[1]
+        prefix: list[int] = []
+        substring: list[int] = []
+        for i in candidates:
+            lower = self._lower[i]
+            if lower.startswith(q):
+                prefix.append(i)
+            elif q in lower:
+                substring.append(i)
+        self._last = (q, sorted(prefix + substring))
+        return [self.values[i] for i in prefix + substring]
+
+
+def _narrows(old: tuple[str, ...], new: tuple[str, ...]) -> bool:
+    """Whether results for `new` are a subset of results for `old`."""
+    return len(new) >= len(old) and all(o in n for o, n in zip(old, new))
+
+
+def _fuzzy_pattern(token: str) -> re.Pattern[str]:
+    """Pattern matching the characters of a token in order, with gaps."""
+    return re.compile(".*?".join(re.escape(c) for c in token))
+
+
+def _score(
+    entry: TrainerSearchEntry,
+    tokens: tuple[str, ...],
+    patterns: list[re.Pattern[str]],
+) -> int | None:
+    """Score of an entry (lower is better), or `None` if a token does not match."""
+    total = 0
+    for token, pattern in zip(tokens, patterns):
+        if entry.key.startswith(token):
+            total += MATCH_PREFIX
+        elif token in entry.key:
+            total += MATCH_SUBSTRING
+        elif token in entry.terms:
+            total += MATCH_TERM
+        elif len(token) > 1 and pattern.search(entry.key):
+            total += MATCH_FUZZY
+        else:
+            return None
+    return total
+
+
+def _make_entry(
+    trid: str,
+    species: list[str],
+    items: list[str],
+    rank: str,
+) -> TrainerSearchEntry:
+    """Build an entry, with its lowercase search keys."""
+    terms = " ".join([*species, *items, rank]).lower()
+    return TrainerSearchEntry(
+        trid, tuple(species), tuple(items), rank, trid.lower(), terms
+    )
+
+
+def _english(table: ty.Sequence[str], value: int | str, index: ty.Any) -> str | None:
+    """English name of an ID (or of an enum name), `None` for empty slots."""
+    i: int = index.to_id(value) if isinstance(value, str) else value
+    if not 0 < i < len(table):
+        return None
+    return table[i]
+
+
+def _entry_from_record(record: dict[str, ty.Any]) -> TrainerSearchEntry:
+    """Entry of a trainer, from its raw record (by alias or by name)."""
+    species: list[str] = []
+    items: list[str] = []
+    for name, alias in _POKE_KEYS:
+        poke = record.get(alias, record.get(name))
+        if not poke:
+            continue
+        dev_id = poke.get(_DEV_ID_KEY, poke.get("dev_id", 0))
+        item = poke.get(_ITEM_KEY, poke.get("item", 0))
+        for value, table, index, out in (
+            (dev_id, settings.za_species_table, settings.za_species_index, species),
+            (item, settings.za_items_table, settings.za_item_index, items),
+        ):
+            english = _english(table, value, index)
+            if english is not None:
+                out.append(english)
+    rank = record.get(_ZA_RANK_KEY, record.get("za_rank", ""))
+    if isinstance(rank, int):
+        rank = str(settings.za_rank_index.name_or_id(rank))
+    trid = record[_TR_ID_KEY] if _TR_ID_KEY in record else record["tr_id"]
+    return _make_entry(trid, species, items, rank)
+
+
+def _entry_from_trainer(trainer: ZATrainerData) -> TrainerSearchEntry:
+    """Entry of a trainer, from its model."""
+    pokemon = [getattr(trainer, name) for name, _ in _POKE_KEYS]
+    species = [
+        name
+        for poke in pokemon
+        if (name := _english(settings.za_species_table, poke.dev_id, None))
+    ]
+    items = [
+        name
+        for poke in pokemon
+        if (name := _english(settings.za_items_table, poke.item, None))
+    ]
+    rank = ""
+    if "za_rank" in trainer.model_fields_set:
+        rank = str(settings.za_rank_index.name_or_id(trainer.za_rank))
+    return _make_entry(trainer.tr_id, species, items, rank)
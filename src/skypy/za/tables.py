@@ -0,0 +1,71 @@
+__all__ = [
+    "TrainerFrames",
+    "to_frames",
+    "from_frames",
+    "field_default",
+    "with_defaults",
+]
+
+import typing as ty
+
+import pydantic
+
+from skypy.schemas import ZAPokemonData, ZATrainerData, ZATrainerDataArray, ZAWazaData
+
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+
+type TrainerFrames = dict[type[pydantic.BaseModel], pl.DataFrame]
+"""Tables of the trainer data, keyed by the model of their rows. See `to_frames()`."""
+
+
+def to_frames(zatrdata: ZATrainerDataArray) -> TrainerFrames:
+    """Tables of the trainer data, keyed by the model of their rows.
+
+    See `ZATrainerDataArray.to_polars()`: the rows are keyed by `trainer_idx` (and
+    `slot`, `waza_slot`), and unset fields are null. The tables can be edited in place,
+    e.g. by `skypy.za.apply_assignments()`, then converted back with `from_frames()`.
+    """
+    trainers, pokemon, moves = zatrdata.to_polars()
+    return {ZATrainerData: trainers, ZAPokemonData: pokemon, ZAWazaData: moves}
+
+
+def from_frames(frames: TrainerFrames) -> ZATrainerDataArray:
+    """Trainer data of the tables of `to_frames()`, validated.
+
+    The `_selected` column added by `skypy.za.apply_assignments()` is dropped.
+
+    Raises:
+        pydantic.ValidationError: If a value is invalid.
+    """
+    return ZATrainerDataArray.from_polars(
+        *(frames[model].drop("_selected", strict=False) for model in frames)
+    )
+
+
+def field_default(model: type[pydantic.BaseModel], field: str) -> ty.Any:
+    """Default value of a field."""
+    return model.model_fields[field].default
+
+
+def with_defaults(
+    frame: "pl.DataFrame",
+    model: type[pydantic.BaseModel],
+) -> "pl.DataFrame":
+    """Fill the unset (null) scalar fields with their default, and cast integers to
+    `Int64` (hashes excepted), so they can be joined across tables.
+    """
+    import polars as pl
+
+    filled: list[pl.Expr] = []
+    for name, dtype in frame.schema.items():
+        if name == "tr_id" or not dtype.is_numeric() and dtype != pl.Boolean:
+            continue
+        column = pl.col(name)
+        field = model.model_fields.get(name)
+        if field is not None and not field.is_required():
+            column = column.fill_null(field_default(model, name))
+        if dtype.is_integer() and dtype != pl.UInt64:
+            column = column.cast(pl.Int64)
+        filled.append(column)
+    return frame.with_columns(filled)
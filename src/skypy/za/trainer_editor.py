@@ -2,6 +2,7 @@ __all__ = ["FieldFrame", "ZATrainerEditor"]
 
 import functools
 import os
+import queue
 import sys
 import tkinter as tk
 import typing as ty
@@ -12,21 +13,37 @@ from loguru import logger
 from skypy import settings
 from skypy.schemas import ZAPokemonData, ZATrainerData, ZATrainerDataArray, ZAWazaData
 from skypy.types.za import Sex, ZABallID
+from skypy.utils.profiling import StartupProfiler
 
+from .dropdown import FilterDropdown
 from .frames import (
     CheckboxFrame,
     DropdownFrame,
     FieldFrame,
     PkmnFrame,
+    PkmnSlot,
     TrainerFrame,
     WazaFrame,
 )
+from .legality import LegalMoves, load_legal_moves
 from .load import load_trainer_data
-
-WAZAS = sorted(settings.za_waza_table)
-ITEMS = sorted(settings.za_items_table)
-SPECIES = sorted(settings.za_species_table)
+from .picker import TrainerPicker
+from .save import SaveEvent, SaveJob, SaveWorker
+from .search import OptionList, TrainerSearchIndex
+from .updates import UpdateDispatcher
+
+# Display labels are unique, see `DisplayNames`
+WAZAS = sorted(settings.za_waza_names.labels)
+ITEMS = sorted(settings.za_item_names.labels)
+SPECIES = sorted(settings.za_species_names.labels)
+# Shared by all dropdowns of a table, see `FilterDropdown`
+WAZA_OPTIONS = OptionList(WAZAS)
+ITEM_OPTIONS = OptionList(ITEMS)
+SPECIES_OPTIONS = OptionList(SPECIES)
 RANKS = sorted(settings.za_rank_mappings.keys())
+DIRTY_STATUS_MAX_TRAINERS = 3
+SAVE_POLL_MS = 50
+SAVE_DESTROY_TIMEOUT_S = 30.0
 
 
 def _get_app_directory() -> str:
@@ -46,16 +63,6 @@ def _get_app_directory() -> str:
     return os.getcwd()
 
 
-@logger.catch((ValueError, TypeError), reraise=False)
-def _set_attr(obj: ty.Any, attr: str, value: str, dtype: type = str) -> None:
-    """Helper to safely set attributes with type conversion."""
-    if dtype is bool:
-        val = value.lower() == "true"
-    else:
-        val = dtype(value)
-    setattr(obj, attr, val)
-
-
 class ZATrainerEditor(ctk.CTk):
     """ZA Trainer Editor."""
 
@@ -70,6 +77,7 @@ class ZATrainerEditor(ctk.CTk):
         title: str = "ZA Trainer Editor",
         ignore_output_dir: bool = False,
         visible: bool = True,
+        profiler: StartupProfiler | None = None,
         **kwargs: ty.Any,
     ) -> None:
         """Init.
@@ -88,8 +96,9 @@ class ZATrainerEditor(ctk.CTk):
                 Directory to save trainer data to.
 
             bfbs_file (str):
-                BFBS file to load trainer data from.
-                Default is `"trdata_array.bfbs"`.
+                The game's binary schema, to check the layout of the saved binaries
+                against. Default is `settings.files.za_trainers_bfbs_file`, only used
+                if it exists.
 
             file_name (str):
                 File name to load trainer data from.
@@ -106,6 +115,10 @@ class ZATrainerEditor(ctk.CTk):
             visible (bool):
                 Whether to show the window.
 
+            profiler (StartupProfiler, optional):
+                Profiles loading the data, `create_widgets()` and
+                `create_trainer_data()` as separate stages.
+
             **kwargs (Any):
                 Additional keyword arguments to pass to the parent class.
         """
@@ -117,6 +130,7 @@ class ZATrainerEditor(ctk.CTk):
         self.bfbs_file = bfbs_file or settings.files.za_trainers_bfbs_file
         self.file_name = file_name
         self.ignore_output_dir = ignore_output_dir
+        self.profiler = profiler or StartupProfiler(enabled=False)
 
         # Private
         self._output_dir_var = ctk.StringVar(value=self.output_dir)
@@ -128,16 +142,32 @@ class ZATrainerEditor(ctk.CTk):
         self._scale_max = 2.0
         self._scale_step = 0.1
 
+        # Field edits are applied to the models in debounced batches, and the unsaved
+        # changes are shown in the status bar after each batch and each save
+        self._dirty_status = ""
+        self.updates = UpdateDispatcher(
+            self.after,
+            self.after_cancel,
+            on_apply=self._on_updates_applied,
+        )
+
         # Set up UI
         self.title(self.app_title)
         self.geometry(f"{width}x{height}")
-        logger.info(f"Loading {type(self.trdata)} data...")
-        self.create_widgets()
-        self.trainer_frame = self.create_trainer_data()
+        with self.profiler.stage("load_trainer_data"):
+            trdata = self.trdata
+        logger.info(f"Loaded {len(trdata.values)} trainer(s).")
+        with self.profiler.stage("create_widgets"):
+            self.create_widgets()
+        with self.profiler.stage("create_trainer_data"):
+            self.trainer_frame = self.create_trainer_data()
 
         # Bind zoom keyboard shortcuts
         self._bind_zoom_shortcuts()
 
+        # Saves run on a worker thread, see `save_trainer_data()`
+        self._save_job: str | None = None
+
         # Hide window if not visible
         if not visible:
             self.withdraw()
@@ -151,8 +181,22 @@ class ZATrainerEditor(ctk.CTk):
             input_dir=self.input_dir,
             output_dir=self.output_dir,
             ignore_output_dir=self.ignore_output_dir,
+            trusted=True,
+            background_validation=True,
+            lazy=True,
         )
 
+    @functools.cached_property
+    def legal_moves(self) -> LegalMoves | None:
+        """Moves each species form can learn, to flag the others. Loaded when the first
+        Pokemon slot is built, `None` if the personal table cannot be read.
+        """
+        try:
+            return load_legal_moves()
+        except OSError as ex:
+            logger.warning(f"Illegal moves will not be flagged: {ex}")
+            return None
+
     @functools.cached_property
     def top_frame(self) -> ctk.CTkFrame:
         """Top frame."""
@@ -200,20 +244,20 @@ class ZATrainerEditor(ctk.CTk):
         return trainer_combobox_label
 
     @functools.cached_property
-    def trainer_combobox(self) -> ctk.CTkComboBox:
-        """Trainer combobox."""
-        trainer_combobox = ctk.CTkComboBox(
+    def trainer_index(self) -> TrainerSearchIndex:
+        """Search index of the trainers."""
+        return TrainerSearchIndex(self.trdata)
+
+    @functools.cached_property
+    def trainer_picker(self) -> TrainerPicker:
+        """Searchable trainer list."""
+        trainer_picker = TrainerPicker(
             self.top_frame,
-            values=[trainer.tr_id for trainer in self.trdata.values],
+            index=self.trainer_index,
             command=self.on_trainer_selected,
         )
-        trainer_combobox.pack(side="left", padx=10, fill="x", expand=True)
-        # Bind Enter key to trigger selection when typing
-        trainer_combobox.bind(
-            "<Return>",
-            lambda event: self.on_trainer_selected(trainer_combobox.get()),
-        )
-        return trainer_combobox
+        trainer_picker.pack(side="left", padx=10, fill="x", expand=True)
+        return trainer_picker
 
     @functools.cached_property
     def save_button(self) -> ctk.CTkButton:
@@ -351,9 +395,9 @@ class ZATrainerEditor(ctk.CTk):
         """Create the trainer combobox label."""
         return self.trainer_combobox_label
 
-    def create_trainer_combobox(self) -> ctk.CTkComboBox:
-        """Create the trainer combobox."""
-        return self.trainer_combobox
+    def create_trainer_picker(self) -> TrainerPicker:
+        """Create the trainer picker."""
+        return self.trainer_picker
 
     def create_save_button(self) -> ctk.CTkButton:
         """Create the save button."""
@@ -385,7 +429,7 @@ class ZATrainerEditor(ctk.CTk):
         """Create UI widgets."""
         logger.trace(f"Creating widgets ({type(self)}): {self}")
 
-        # Top frame for combobox
+        # Top frame for the trainer picker
         self.create_top_frame()
 
         # Create output directory input
@@ -394,8 +438,8 @@ class ZATrainerEditor(ctk.CTk):
         # Create BFBS file input
         self.create_bfbs_file_input()
 
-        # Create a label for the combobox
-        self.create_trainer_combobox()
+        # Create the searchable trainer list
+        self.create_trainer_picker()
 
         # Create scrollable frame for trainer data
         self.create_data_frame()
@@ -593,13 +637,14 @@ class ZATrainerEditor(ctk.CTk):
         )
         pokemon_label.pack(pady=(20, 5), anchor="w")
 
-        pokemon_fields: list[PkmnFrame] = [
-            self._create_pokemon_field(1, trainer.poke_1),
-            self._create_pokemon_field(2, trainer.poke_2),
-            self._create_pokemon_field(3, trainer.poke_3),
-            self._create_pokemon_field(4, trainer.poke_4),
-            self._create_pokemon_field(5, trainer.poke_5),
-            self._create_pokemon_field(6, trainer.poke_6),
+        # Slots build their widgets on first expand, see `PkmnSlot`
+        pokemon_slots: list[PkmnSlot] = [
+            self._create_pokemon_slot(1, trainer.poke_1),
+            self._create_pokemon_slot(2, trainer.poke_2),
+            self._create_pokemon_slot(3, trainer.poke_3),
+            self._create_pokemon_slot(4, trainer.poke_4),
+            self._create_pokemon_slot(5, trainer.poke_5),
+            self._create_pokemon_slot(6, trainer.poke_6),
         ]
 
         logger.trace(f"Displayed trainer data ({type(self)}): {self}")
@@ -625,7 +670,7 @@ class ZATrainerEditor(ctk.CTk):
             view_range_field=view_range_field,
             hearing_range_field=hearing_range_field,
             pokemon_label=pokemon_label,
-            pokemon_fields=pokemon_fields,
+            pokemon_slots=pokemon_slots,
             trainer_ref=trainer,
         )
 
@@ -634,21 +679,36 @@ class ZATrainerEditor(ctk.CTk):
 
         return trainer_frame
 
-    def _create_pokemon_field(
-        self,
-        index: int,
-        pkmn: ZAPokemonData,
-    ) -> PkmnFrame:
-        """Create a pokemon field."""
+    def _create_pokemon_slot(self, index: int, pkmn: ZAPokemonData) -> PkmnSlot:
+        """Create a collapsed pokemon slot. Its fields are built on first expand."""
         # Show all pokemon slots, even if empty
-        poke_frame = ctk.CTkFrame(self.data_frame)
-        poke_frame.pack(fill="x", pady=5, padx=10)
-        poke_title = ctk.CTkLabel(
-            poke_frame,
+        slot_frame = ctk.CTkFrame(self.data_frame)
+        slot_frame.pack(fill="x", pady=5, padx=10)
+        header = ctk.CTkButton(
+            slot_frame,
             text=f"Pokemon {index}",
+            anchor="w",
             font=("Helvetica", 14, "bold"),
+            fg_color="transparent",
+            text_color=ctk.ThemeManager.theme["CTkLabel"]["text_color"],
+        )
+        header.pack(fill="x", padx=5, pady=5)
+        return PkmnSlot(
+            index=index,
+            frame=slot_frame,
+            header=header,
+            pokemon_ref=pkmn,
+            build=self._create_pokemon_field,
         )
-        poke_title.pack(anchor="w", padx=10, pady=5)
+
+    def _create_pokemon_field(
+        self,
+        parent: ctk.CTkFrame,
+        pkmn: ZAPokemonData,
+    ) -> PkmnFrame:
+        """Create a pokemon field. Its frame is packed by its `PkmnSlot`."""
+        logger.trace(f"Building pokemon field: {pkmn.dev_id_label}")
+        poke_frame = ctk.CTkFrame(parent, fg_color="transparent")
 
         # Horizontal layout: Pokemon details on left, Moves on right
         content_frame = ctk.CTkFrame(poke_frame, fg_color="transparent")
@@ -662,16 +722,16 @@ class ZATrainerEditor(ctk.CTk):
         # We'll reconfigure them after creating the frame
         dev_id_field = self._create_dropdown(
             "Dev ID",
-            pkmn.dev_id_english,
-            values=SPECIES,
+            pkmn.dev_id_label,
+            values=SPECIES_OPTIONS,
             setter=lambda v: None,
             parent=details_column,
         )
 
         item_field = self._create_dropdown(
             "Item",
-            pkmn.item_english,
-            values=ITEMS,
+            pkmn.item_label,
+            values=ITEM_OPTIONS,
             setter=lambda v: None,
             parent=details_column,
         )
@@ -708,8 +768,11 @@ class ZATrainerEditor(ctk.CTk):
 
         ball_id_field = self._create_dropdown_inline(
             "Ball",
-            pkmn.ball_id_english,
-            [settings.za_items_table[ball_id] for ball_id in ty.get_args(ZABallID)],
+            pkmn.ball_id_label,
+            [
+                settings.za_item_names.to_label(ball_id)
+                for ball_id in ty.get_args(ZABallID)
+            ],
             setter=lambda v: None,
             parent=extra_row,
         )
@@ -742,7 +805,6 @@ class ZATrainerEditor(ctk.CTk):
         # Create the frame first
         pkmn_frame = PkmnFrame(
             frame=poke_frame,
-            title=poke_title,
             dev_id_field=dev_id_field,
             item_field=item_field,
             level_field=level_field,
@@ -753,53 +815,42 @@ class ZATrainerEditor(ctk.CTk):
             ball_id_field=ball_id_field,
             scale_value_field=scale_value_field,
             pokemon_ref=pkmn,
+            legal_moves=self.legal_moves,
         )
+        pkmn_frame.flag_illegal_moves()
 
         # Now configure setters that use pkmn_frame.pokemon_ref
-        # This ensures changes always go to the currently selected pokemon
+        # This ensures changes always go to the currently selected pokemon. They go
+        # through `updates` right away, so the unsaved changes are shown
         def on_dev_id_change(val: str) -> None:
             """On Dev ID Change."""
             logger.trace(f"On Dev ID Change: {val}")
-            pkmn_frame.pokemon_ref.dev_id = settings.za_species_table.index(val)
+            dev_id = settings.za_species_names.to_id(val)
+            self.updates.push(pkmn_frame.pokemon_ref, "dev_id", dev_id, debounce=False)
             logger.trace(f"New Dev ID: {pkmn_frame.pokemon_ref.dev_id} | {val}")
+            pkmn_frame.flag_illegal_moves()
 
         def on_item_change(val: str) -> None:
             """On Item Change."""
             logger.trace(f"On Item Change: {val}")
-            pkmn_frame.pokemon_ref.item = settings.za_items_table.index(val)
+            item = settings.za_item_names.to_id(val)
+            self.updates.push(pkmn_frame.pokemon_ref, "item", item, debounce=False)
             logger.trace(f"New Item: {pkmn_frame.pokemon_ref.item} | {val}")
 
-        def on_level_change(val: str) -> None:
-            """On Level Change."""
-            logger.trace(f"On Level Change: {val}")
-            pkmn_frame.pokemon_ref.level = int(val)
-            logger.trace(f"New Level: {pkmn_frame.pokemon_ref.level} | {val}")
-
-        def on_form_id_change(val: str) -> None:
-            """On Form ID Change."""
-            logger.trace(f"On Form ID Change: {val}")
-            pkmn_frame.pokemon_ref.form_id = int(val)  # type: ignore
-            logger.trace(f"New Form ID: {pkmn_frame.pokemon_ref.form_id} | {val}")
-
         def on_sex_change(val: str) -> None:
             """On Sex Change."""
             logger.trace(f"On Sex Change: {val}")
-            pkmn_frame.pokemon_ref.sex = int(val)  # type: ignore
+            self.updates.push(pkmn_frame.pokemon_ref, "sex", val, int, debounce=False)
             logger.trace(f"New Sex: {pkmn_frame.pokemon_ref.sex} | {val}")
 
         def on_ball_id_change(val: str) -> None:
             """On Ball ID Change."""
             logger.trace(f"On Ball ID Change: {val}")
-            pkmn_frame.pokemon_ref.ball_id = settings.za_items_table.index(val)  # type: ignore
-            logger.trace(f"New Ball ID: {pkmn_frame.pokemon_ref.ball_id} | {val}")
-
-        def on_scale_value_change(val: str) -> None:
-            """On Scale Value Change."""
-            logger.trace(f"On Scale Value Change: {val}")
-            pkmn_frame.pokemon_ref.scale_value = int(val)
-            logger.trace(
-                f"New Scale Value: {pkmn_frame.pokemon_ref.scale_value} | {val}"
+            ball_id = settings.za_item_names.to_id(val)
+            self.updates.push(
+                pkmn_frame.pokemon_ref, "ball_id", ball_id, debounce=False
             )
+            logger.trace(f"New Ball ID: {pkmn_frame.pokemon_ref.ball_id} | {val}")
 
         # Reconfigure the option menus with proper setters
         dev_id_field.option_menu.configure(command=on_dev_id_change)
@@ -807,16 +858,23 @@ class ZATrainerEditor(ctk.CTk):
         sex_field.option_menu.configure(command=on_sex_change)
         ball_id_field.option_menu.configure(command=on_ball_id_change)
 
-        # For entry fields, add trace callbacks
-        level_field.var.trace_add(
-            "write", lambda *args: on_level_change(level_field.var.get())
-        )
-        form_id_field.var.trace_add(
-            "write", lambda *args: on_form_id_change(form_id_field.var.get())
-        )
-        scale_value_field.var.trace_add(
-            "write", lambda *args: on_scale_value_change(scale_value_field.var.get())
-        )
+        # For entry fields, queue the typed values on the current pokemon
+        def make_on_entry_change(
+            field: FieldFrame, attr: str
+        ) -> ty.Callable[[str, str, str], None]:
+            """Factory to create entry trace callbacks with proper closure."""
+
+            def on_entry_change(*_: object) -> None:
+                self.updates.push(pkmn_frame.pokemon_ref, attr, field.var.get(), int)
+
+            return on_entry_change
+
+        for field, attr in (
+            (level_field, "level"),
+            (form_id_field, "form_id"),
+            (scale_value_field, "scale_value"),
+        ):
+            field.var.trace_add("write", make_on_entry_change(field, attr))
 
         # Reconfigure waza frame setters
         self._configure_waza_setters(pkmn_frame)
@@ -838,10 +896,10 @@ class ZATrainerEditor(ctk.CTk):
         )
         waza_name_label.pack(anchor="w", padx=10, pady=5)
 
-        waza_variable = ctk.StringVar(value=waza.waza_id_english)
-        waza_option_menu = ctk.CTkOptionMenu(
+        waza_variable = ctk.StringVar(value=waza.waza_id_label)
+        waza_option_menu = FilterDropdown(
             waza_frame_widget,
-            values=WAZAS,
+            options=WAZA_OPTIONS,
             command=lambda v: None,  # Placeholder, will be configured later
             variable=waza_variable,
         )
@@ -879,8 +937,10 @@ class ZATrainerEditor(ctk.CTk):
 
                 def on_waza_change(val: str) -> None:
                     logger.trace(f"On Waza Change: {val}")
-                    wf.waza_ref.waza_id = settings.za_waza_table.index(val)
+                    waza_id = settings.za_waza_names.to_id(val)
+                    self.updates.push(wf.waza_ref, "waza_id", waza_id, debounce=False)
                     logger.trace(f"New Waza ID: {wf.waza_ref.waza_id} | {val}")
+                    pkmn_frame.flag_illegal_moves()
 
                 return on_waza_change
 
@@ -889,7 +949,12 @@ class ZATrainerEditor(ctk.CTk):
 
                 def on_plus_change() -> None:
                     logger.trace(f"On Plus Change: {wf.waza_ref.is_plus_waza}")
-                    wf.waza_ref.is_plus_waza = not wf.waza_ref.is_plus_waza
+                    self.updates.push(
+                        wf.waza_ref,
+                        "is_plus_waza",
+                        not wf.waza_ref.is_plus_waza,
+                        debounce=False,
+                    )
                     logger.trace(f"New Plus Waza: {wf.waza_ref.is_plus_waza}")
 
                 return on_plus_change
@@ -906,45 +971,31 @@ class ZATrainerEditor(ctk.CTk):
         """
         tf = trainer_frame  # Short alias
 
-        # Configure field setters via var.trace_add
-        def on_money_rate_change(*_: object) -> None:
-            _set_attr(tf.trainer_ref, "money_rate", tf.money_rate_field.var.get(), int)
+        # Configure field setters via var.trace_add: typed values are queued on the
+        # current trainer, and applied in debounced batches
+        def make_entry_setter(
+            attr_name: str,
+            dtype: type,
+        ) -> ty.Callable[[str, str, str], None]:
+            """Factory to create entry setter."""
 
-        def on_view_horizontal_angle_change(*_: object) -> None:
-            _set_attr(
-                tf.trainer_ref,
-                "view_horizontal_angle",
-                tf.view_horizontal_angle_field.var.get(),
-                float,
-            )
+            def setter(*_: object) -> None:
+                field = getattr(tf, f"{attr_name}_field")
+                self.updates.push(tf.trainer_ref, attr_name, field.var.get(), dtype)
 
-        def on_view_vertical_angle_change(*_: object) -> None:
-            _set_attr(
-                tf.trainer_ref,
-                "view_vertical_angle",
-                tf.view_vertical_angle_field.var.get(),
-                float,
-            )
+            return setter
 
-        def on_view_range_change(*_: object) -> None:
-            _set_attr(
-                tf.trainer_ref, "view_range", tf.view_range_field.var.get(), float
-            )
+        entry_attrs = {
+            "money_rate": int,
+            "view_horizontal_angle": float,
+            "view_vertical_angle": float,
+            "view_range": float,
+            "hearing_range": float,
+        }
 
-        def on_hearing_range_change(*_: object) -> None:
-            _set_attr(
-                tf.trainer_ref, "hearing_range", tf.hearing_range_field.var.get(), float
-            )
-
-        tf.money_rate_field.var.trace_add("write", on_money_rate_change)
-        tf.view_horizontal_angle_field.var.trace_add(
-            "write", on_view_horizontal_angle_change
-        )
-        tf.view_vertical_angle_field.var.trace_add(
-            "write", on_view_vertical_angle_change
-        )
-        tf.view_range_field.var.trace_add("write", on_view_range_change)
-        tf.hearing_range_field.var.trace_add("write", on_hearing_range_change)
+        for attr, dtype in entry_attrs.items():
+            field = getattr(tf, f"{attr}_field")
+            field.var.trace_add("write", make_entry_setter(attr, dtype))
 
         # Configure checkbox setters
         def make_checkbox_setter(
@@ -954,7 +1005,13 @@ class ZATrainerEditor(ctk.CTk):
 
             def setter(*_: object) -> None:
                 checkbox = getattr(tf, f"{attr_name}_checkbox")
-                setattr(tf.trainer_ref, attr_name, bool(checkbox.var.get()))
+                self.updates.push(
+                    tf.trainer_ref,
+                    attr_name,
+                    checkbox.var.get(),
+                    bool,
+                    debounce=False,
+                )
 
             return setter
 
@@ -1102,23 +1159,31 @@ class ZATrainerEditor(ctk.CTk):
         self,
         label_text: str,
         value: str,
-        values: list[str],
+        values: list[str] | OptionList,
         setter: ty.Callable[[str], None],
         parent: ctk.CTkFrame | None = None,
     ) -> DropdownFrame:
-        """Create a dropdown field."""
-        logger.trace(f"Creating dropdown: {label_text} = {value} (values: {values})")
+        """Create a dropdown field.
+
+        Long value lists should be passed as an `OptionList`, shown with a
+        `FilterDropdown` instead of a `CTkOptionMenu`.
+        """
+        logger.trace(
+            f"Creating dropdown: {label_text} = {value} ({len(values)} values)"
+        )
         field_frame = ctk.CTkFrame(parent or self.data_frame)
         field_frame.pack(fill="x", pady=2, padx=10)
 
         label = ctk.CTkLabel(field_frame, text=f"{label_text}:", width=200)
         label.pack(side="left", padx=5)
 
-        logger.trace("Sorting values...")
-        values.sort()
-        logger.trace("Sorted values.")
-
-        option_menu = ctk.CTkOptionMenu(field_frame, values=values, command=setter)
+        option_menu: ctk.CTkOptionMenu | FilterDropdown
+        if isinstance(values, OptionList):
+            option_menu = FilterDropdown(field_frame, options=values, command=setter)
+        else:
+            option_menu = ctk.CTkOptionMenu(
+                field_frame, values=sorted(values), command=setter
+            )
         option_menu.set(value)
         option_menu.pack(side="left", fill="x", expand=True, padx=5)
 
@@ -1160,7 +1225,7 @@ class ZATrainerEditor(ctk.CTk):
         )
 
     def on_trainer_selected(self, trainer_id: str) -> None:
-        """Handle trainer selection from combobox.
+        """Handle trainer selection from the trainer picker.
 
         Args:
             trainer_id (str):
@@ -1170,8 +1235,15 @@ class ZATrainerEditor(ctk.CTk):
         # Find the index of the selected trainer
         trainer: ZATrainerData = self.trdata.get_trainer(trainer_id)
 
-        # Update displayed data
-        self.trainer_frame.update_trainer_data(trainer)
+        # Update displayed data. Pending edits go to the previous trainer, and
+        # refreshing the widgets must not write their values back to the new one
+        with self.updates.suppressed():
+            self.trainer_frame.update_trainer_data(trainer)
+
+    @functools.cached_property
+    def save_worker(self) -> SaveWorker:
+        """Worker thread writing the trainer data."""
+        return SaveWorker()
 
     def save_trainer_data(
         self,
@@ -1179,7 +1251,17 @@ class ZATrainerEditor(ctk.CTk):
         file_name: str | None = None,
         bfbs_file: str | None = None,
     ) -> None:
-        """Save all trainer data to the JSON file and create binaries."""
+        """Save all trainer data to the JSON file and create binaries.
+
+        A snapshot of the trainer data is taken right away, then written by
+        `save_worker` in the background, so the window stays responsive. Progress and
+        outcome are shown in the status bar. Saves requested while one is running are
+        coalesced: only the latest snapshot is written next.
+
+        The layout of the binary is checked against `bfbs_file` (defaults to the
+        BFBS file of the top bar) first, if it exists. See
+        `skypy.schemas.check_bfbs_layout()`.
+        """
         with logger.catch(
             Exception,
             reraise=False,
@@ -1191,25 +1273,117 @@ class ZATrainerEditor(ctk.CTk):
             logger.trace(f"Saving trainer data ({type(self)}): {self}")
             output_dir = output_dir or self.output_dir
             file_name = file_name or self.file_name
-            bfbs_file = bfbs_file or self.bfbs_file
             os.makedirs(output_dir, exist_ok=True)
 
-            # Convert pydantic models back to dict format
             file_out = os.path.join(output_dir, file_name)
             logger.trace(f"Dumping data to {file_out}...")
-            self.trdata.dump(file_out, bfbs_file=bfbs_file, create_binaries=True)
-            logger.trace(f"Data dumped to {file_out}.")
+            self.updates.flush()
+            job = SaveJob(
+                self.trdata.snapshot(),
+                file_out,
+                create_binaries=True,
+                bfbs_file=bfbs_file or self.bfbs_file,
+            )
+            self.save_worker.submit(job)
+            self.status_label.configure(text="Saving...", text_color="gray")
+            if self._save_job is None:
+                self._save_job = self.after(SAVE_POLL_MS, self._poll_save_events)
 
-            # Show confirmation
+    def _on_updates_applied(self, changed: int) -> None:
+        """Show the unsaved changes, once `updates` applied edits.
+
+        The headers of the Pokemon slots are refreshed too: their species or level
+        may have changed (e.g. from the `dev_id` dropdown or the level entry).
+        """
+        self.refresh_dirty_status()
+        trainer_frame: TrainerFrame | None = getattr(self, "trainer_frame", None)
+        if trainer_frame is not None:
+            for slot in trainer_frame.pokemon_slots:
+                slot.refresh_header()
+
+    def _poll_save_events(self) -> None:
+        """Show the progress of background saves, until they are all done."""
+        # Read before draining: the last events are put before the worker is idle
+        busy = self.save_worker.busy
+        while True:
+            try:
+                event = self.save_worker.events.get_nowait()
+            except queue.Empty:
+                break
+            self._on_save_event(event)
+        if busy:
+            self._save_job = self.after(SAVE_POLL_MS, self._poll_save_events)
+        else:
+            self._save_job = None
+
+    def _on_save_event(self, event: SaveEvent) -> None:
+        """Handle an event of the save worker, on the GUI thread."""
+        if event.kind == "progress":
+            self.status_label.configure(text=event.message, text_color="gray")
+            return
+        if event.kind == "error":
             self.status_label.configure(
-                text=f"Saved to {file_out}",
-                text_color="green",
+                text=f"Error: {event.message}", text_color="red"
             )
+            return
+        # Trainers edited while saving stay dirty
+        self.trdata.commit(event.job.snapshot)
+        logger.trace(f"Data dumped to {event.job.path}.")
+        self._dirty_status = ""
 
-            # Clear status after 3 seconds
-            self.after(
-                3000, lambda: self.status_label.configure(text="", text_color="gray")
-            )
+        # Show confirmation
+        self.status_label.configure(text=event.message, text_color="green")
+
+        # Clear status after 3 seconds, then show what is still unsaved
+        self.after(3000, self._clear_save_status)
+
+    def _clear_save_status(self) -> None:
+        """Clear the outcome of a save, then show the unsaved changes, if any."""
+        self.status_label.configure(text="", text_color="gray")
+        self.refresh_dirty_status()
+
+    def refresh_dirty_status(self) -> str:
+        """Show the trainers modified since the last save in the status bar.
+
+        Called when `updates` applies edits and after saves, rather than periodically.
+        The label is only updated when the set of changes differs from the one shown.
+        It is cleared when the changes are reverted, and left alone once everything is
+        saved (it shows the outcome of the save).
+
+        Returns:
+            str: The status text, empty if there are no unsaved changes.
+        """
+        changes = self.trdata.changes()
+        status = ""
+        if changes:
+            shown = [
+                f"{trid} ({', '.join(paths)})" if paths else trid
+                for trid, paths in list(changes.items())[:DIRTY_STATUS_MAX_TRAINERS]
+            ]
+            if len(changes) > DIRTY_STATUS_MAX_TRAINERS:
+                shown.append("...")
+            status = f"Unsaved: {len(changes)} trainer(s): {'; '.join(shown)}"
+        if status != self._dirty_status:
+            self._dirty_status = status
+            if status:
+                self.status_label.configure(text=status, text_color="orange")
+            else:
+                self.status_label.configure(text="", text_color="gray")
+        return status
+
+    def destroy(self) -> None:
+        """Stop polling, wait for running saves, then destroy the window."""
+        if hasattr(self, "updates"):
+            self.updates.flush()
+        job = getattr(self, "_save_job", None)
+        if job is not None:
+            self.after_cancel(job)
+            self._save_job = None
+        if "save_worker" in self.__dict__ and not self.save_worker.join(
+            SAVE_DESTROY_TIMEOUT_S
+        ):
+            logger.error("Save still running, closing anyway.")
+        super().destroy()
 
     def zoom_in(self, event: tk.Event | None = None) -> None:
         """Zoom in (increase scale)."""
@@ -0,0 +1,192 @@
+__all__ = ["UpdateDispatcher"]
+
+import contextlib
+import typing as ty
+
+import pydantic
+from loguru import logger
+
+UPDATE_DEBOUNCE_MS = 300
+
+
+class _Update(ty.NamedTuple):
+    """A pending update of a model field, from its raw widget value."""
+
+    target: pydantic.BaseModel
+    attr: str
+    value: ty.Any
+    convert: ty.Callable[[ty.Any], ty.Any]
+
+
+class UpdateDispatcher:
+    """Applies field updates coming from Tk variable traces, in batches.
+
+    - While `suppressed()`, updates are ignored: refreshing the widgets from a model
+      (e.g. when switching trainers) must not write the values back to it.
+    - Updates are debounced: typing in an entry only queues the latest value of the
+      field, and pending updates are applied once no update came for `delay_ms`.
+    - Pending updates are applied with one validation per model, and only the values
+      that actually change are set.
+
+    Scheduling goes through Tk's `after()`/`after_cancel()` (or anything with the same
+    signatures), so updates are always applied on the GUI thread. `on_apply` is called
+    there too, after each batch that changed a field (e.g. to show the unsaved
+    changes).
+    """
+
+    def __init__(
+        self,
+        after: ty.Callable[[int, ty.Callable[[], None]], str],
+        after_cancel: ty.Callable[[str], None],
+        delay_ms: int = UPDATE_DEBOUNCE_MS,
+        on_apply: ty.Callable[[int], None] | None = None,
+    ) -> None:
+        """Args:
+        after (Callable[[int, Callable[[], None]], str]):
+            Schedules a call after a delay in milliseconds, returns a job ID.
+
+        after_cancel (Callable[[str], None]):
+            Cancels a scheduled call.
+
+        delay_ms (int):
+            Debounce delay, in milliseconds.
+
+        on_apply (Callable[[int], None], optional):
+            Called with the number of fields that changed, after applying updates
+            that changed any.
+        """
+        self._after = after
+        self._after_cancel = after_cancel
+        self.delay_ms = delay_ms
+        self.on_apply = on_apply
+        self._pending: dict[tuple[int, str], _Update] = {}
+        self._suppressed = 0
+        self._job: str | None = None
+
+    @property
+    def is_suppressed(self) -> bool:
+        """Whether updates are currently ignored."""
+        return self._suppressed > 0
+
+    @property
+    def pending_count(self) -> int:
+        """Number of fields waiting to be applied."""
+        return len(self._pending)
+
+    @contextlib.contextmanager
+    def suppressed(self) -> ty.Iterator[None]:
+        """Ignore updates within this context. Pending updates are applied first."""
+        self.flush()
+        self._suppressed += 1
+        try:
+            yield
+        finally:
+            self._suppressed -= 1
+
+    def push(
+        self,
+        target: pydantic.BaseModel,
+        attr: str,
+        value: ty.Any,
+        convert: ty.Callable[[ty.Any], ty.Any] = lambda v: v,
+        debounce: bool = True,
+    ) -> None:
+        """Queue an update of a model field.
+
+        Args:
+            target (pydantic.BaseModel):
+                The model, as referenced by the widget when the update happens.
+
+            attr (str):
+                Field name.
+
+            value (Any):
+                Raw widget value. It replaces any pending value for the same field.
+
+            convert (Callable[[Any], Any]):
+                Converts the raw value (e.g. `int`), when the update is applied.
+                Values it cannot convert (e.g. an entry being cleared) are skipped.
+
+            debounce (bool):
+                Whether to wait for more updates. Otherwise, all pending updates are
+                applied right away (e.g. for checkboxes).
+        """
+        if self.is_suppressed:
+            return
+        self._pending[(id(target), attr)] = _Update(target, attr, value, convert)
+        if self._job is not None:
+            self._after_cancel(self._job)
+            self._job = None
+        if debounce:
+            self._job = self._after(self.delay_ms, self._on_timeout)
+        else:
+            self.flush()
+
+    def cancel(self) -> None:
+        """Drop pending updates."""
+        if self._job is not None:
+            self._after_cancel(self._job)
+            self._job = None
+        self._pending.clear()
+
+    def _on_timeout(self) -> None:
+        """Apply pending updates, once the debounce delay has elapsed."""
+        self._job = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Apply pending updates now.
+
+        Returns:
+            int: Number of fields that changed.
+        """
+        if self._job is not None:
+            self._after_cancel(self._job)
+            self._job = None
+        if not self._pending:
+            return 0
+        batches: dict[int, tuple[pydantic.BaseModel, dict[str, ty.Any]]] = {}
+        for update in self._pending.values():
+            try:
+                value = update.convert(update.value)
+            except (ValueError, TypeError):
+                logger.trace(f"Skipping {update.attr}={update.value!r}.")
+                continue
+            if getattr(update.target, update.attr) == value:
+                continue
+            _, values = batches.setdefault(id(update.target), (update.target, {}))
+            values[update.attr] = value
+        self._pending.clear()
+        changed = 0
+        for target, values in batches.values():
+            changed += _apply(target, values)
+        if changed:
+            logger.trace(f"Applied {changed} field update(s).")
+            if self.on_apply is not None:
+                self.on_apply(changed)
+        return changed
+
+
+def _apply(target: pydantic.BaseModel, values: dict[str, ty.Any]) -> int:
+    """Set fields of a model, validating them together.
+
+    If the batch is invalid, fields are set one by one and the invalid ones are
+    skipped.
+    """
+    model = type(target)
+    try:
+        validated = model.model_validate({**target.__dict__, **values})
+    except pydantic.ValidationError as e:
+        logger.trace(f"Invalid update of {model.__name__}: {e}")
+        changed = 0
+        for attr, value in values.items():
+            try:
+                setattr(target, attr, value)
+            except pydantic.ValidationError:
+                continue
+            changed += 1
+        return changed
+    for attr in values:
+        target.__dict__[attr] = validated.__dict__[attr]
+    target.__pydantic_fields_set__.update(values)
+    return len(values)
@@ -0,0 +1,574 @@
+__all__ = [
+    "MEGA_STONE_POCKET",
+    "Severity",
+    "ValidationRule",
+    "ValidationIssue",
+    "ValidationReport",
+    "VALIDATION_RULES",
+    "SCHEMA_RULE",
+    "validate_trdata_array",
+    "validate_trdata_file",
+]
+
+import re
+import time
+import typing as ty
+
+import pydantic
+from loguru import logger
+
+from skypy import settings
+from skypy.schemas import (
+    ZAItemArray,
+    ZAPokemonData,
+    ZATrainerData,
+    ZATrainerDataArray,
+    ZAWazaData,
+    load_personal_array,
+)
+from skypy.types.za import ZABallID
+
+from .legality import LegalMoves, load_legal_moves
+from .load import read_trainer_data
+from .tables import to_frames, with_defaults
+
+if ty.TYPE_CHECKING:  # pragma: no cover
+    import polars as pl
+
+Severity = ty.Literal["error", "warning"]
+
+MEGA_STONE_POCKET = 7
+"""Bag pocket of the mega stones, in `item_data.json`."""
+
+SCHEMA_RULE = "schema"
+"""Rule of the values that do not fit `ZATrainerDataArray`, in
+`validate_trdata_file()`.
+"""
+
+_ISSUE_KEYS = ("trainer_idx", "slot", "waza_slot")
+_SLOT_FIELD = re.compile(r"(poke|waza)_?([1-6])")
+
+
+class _Tables(ty.NamedTuple):
+    """What the rules are evaluated over.
+
+    Unset fields are filled with their defaults. `pokemon` only has the non-empty
+    Pokémon, `moves` only the non-empty moves of these, with their `dev_id` and
+    `form_id`.
+    """
+
+    trainers: "pl.DataFrame"
+    pokemon: "pl.DataFrame"
+    moves: "pl.DataFrame"
+    species: "pl.DataFrame"
+    legal: LegalMoves
+    items: "pl.DataFrame"
+
+
+class ValidationRule(ty.NamedTuple):
+    """A constraint, checked over whole tables at once."""
+
+    name: str
+    """Name of the rule, used to select it."""
+    severity: Severity
+    """Whether breaking the rule is an error, or only suspicious."""
+    description: str
+    """What the rule checks."""
+    check: ty.Callable[[_Tables], "pl.DataFrame"]
+    """Returns the offending rows, with a `trainer_idx` and a `message` column, and the
+    `slot` and `waza_slot` columns they apply to, if any.
+    """
+
+
+class ValidationIssue(ty.NamedTuple):
+    """A broken rule."""
+
+    rule: str
+    """Name of the rule."""
+    severity: Severity
+    """Severity of the rule."""
+    tr_id: str
+    """ID of the trainer."""
+    slot: int | None
+    """Slot of the Pokémon (1 to 6), if the issue is about a Pokémon."""
+    waza_slot: int | None
+    """Slot of the move (1 to 4), if the issue is about a move."""
+    message: str
+    """What is wrong."""
+
+
+class ValidationReport(ty.NamedTuple):
+    """Outcome of `validate_trdata_array()`."""
+
+    issues: list[ValidationIssue]
+    """The broken rules, by rule, then in trainer, Pokémon and move order."""
+    counts: dict[str, int]
+    """Number of issues of each rule that was checked."""
+    pokemon: int
+    """Number of Pokémon checked."""
+    seconds: float
+    """Total time, including the conversion of the trainer data to tables."""
+
+    @property
+    def errors(self) -> int:
+        """Number of errors."""
+        return sum(issue.severity == "error" for issue in self.issues)
+
+    @property
+    def warnings(self) -> int:
+        """Number of warnings."""
+        return sum(issue.severity == "warning" for issue in self.issues)
+
+    def summary(self) -> str:
+        """Human-readable report, one line per issue, then the totals."""
+        lines: list[str] = []
+        for issue in self.issues:
+            where = issue.tr_id
+            if issue.slot is not None:
+                where += f" slot {issue.slot}"
+            if issue.waza_slot is not None:
+                where += f" move {issue.waza_slot}"
+            lines.append(f"{issue.severity}: [{issue.rule}] {where}: {issue.message}")
+        lines.append(
+            f"Checked {self.pokemon} Pokémon with {len(self.counts)} rule(s): "
+            f"{self.errors} error(s), {self.warnings} warning(s) "
+            f"({self.seconds:.3f}s)"
+        )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, ty.Any]:
+        """The report, as JSON-serializable data."""
+        return {
+            "pokemon": self.pokemon,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "counts": self.counts,
+            "seconds": self.seconds,
+            "issues": [issue._asdict() for issue in self.issues],
+        }
+
+
+def validate_trdata_array(
+    zatrdata: ZATrainerDataArray,
+    rules: ty.Sequence[str] | None = None,
+) -> ValidationReport:
+    """Check the trainer data against constraints spanning several tables.
+
+    The trainer data is converted to tables once, and each rule is a few joins and
+    filters over all Pokémon or moves at once, against the personal table
+    (`skypy.schemas.load_personal_array()`), the legal moves
+    (`skypy.za.load_legal_moves()`) and the items (`skypy.schemas.ZAItemArray`). See
+    `VALIDATION_RULES`.
+
+    Args:
+        zatrdata (ZATrainerDataArray):
+            The trainer data.
+
+        rules (Sequence[str], optional):
+            Names of the rules to check. Defaults to all of them.
+
+    Raises:
+        ValueError: If a rule is unknown.
+    """
+    import polars as pl
+
+    names = _rule_names(rules)
+    start = time.perf_counter()
+    tables = _load_tables(zatrdata)
+    tr_ids = tables.trainers.select("trainer_idx", pl.col("tr_id").cast(pl.String))
+    issues: list[ValidationIssue] = []
+    counts: dict[str, int] = {}
+    for name in names:
+        rule = VALIDATION_RULES[name]
+        found = rule.check(tables)
+        for key in _ISSUE_KEYS[1:]:
+            if key not in found.columns:
+                found = found.with_columns(pl.lit(None, pl.Int64).alias(key))
+        found = found.join(tr_ids, on="trainer_idx", how="left").sort(_ISSUE_KEYS)
+        counts[name] = found.height
+        issues.extend(
+            ValidationIssue(name, rule.severity, tr_id, slot, waza_slot, message)
+            for tr_id, slot, waza_slot, message in found.select(
+                "tr_id", "slot", "waza_slot", "message"
+            ).iter_rows()
+        )
+        logger.trace(f"Rule {name!r}: {found.height} issue(s).")
+    report = ValidationReport(
+        issues, counts, tables.pokemon.height, time.perf_counter() - start
+    )
+    logger.debug(
+        f"Validated {report.pokemon} Pokémon: {report.errors} error(s), "
+        f"{report.warnings} warning(s) in {report.seconds:.3f}s"
+    )
+    return report
+
+
+def validate_trdata_file(
+    path: str,
+    rules: ty.Sequence[str] | None = None,
+) -> ValidationReport:
+    """Check a trainer data file, JSON or binary, against the schema, then against the
+    rules.
+
+    Every value is validated (unlike `load_trainer_data(trusted=True)`), so the values
+    out of range (e.g. a `level` of 500) and the unknown keys are reported, as issues
+    of the `SCHEMA_RULE`. The rules can only be checked on valid data: if there is any
+    such issue, only these are reported. See `validate_trdata_array()`.
+
+    Args:
+        path (str):
+            The file.
+
+        rules (Sequence[str], optional):
+            Names of the rules to check. Defaults to all of them.
+
+    Raises:
+        ValueError: If a rule is unknown.
+    """
+    _rule_names(rules)
+    start = time.perf_counter()
+    trdata = read_trainer_data(path)
+    try:
+        zatrdata = ZATrainerDataArray.model_validate(trdata)
+    except pydantic.ValidationError as ex:
+        issues = _schema_issues(trdata, ex)
+        report = ValidationReport(
+            issues,
+            {SCHEMA_RULE: len(issues)},
+            _count_pokemon(trdata),
+            time.perf_counter() - start,
+        )
+        logger.debug(f"{path}: {len(issues)} schema error(s), rules not checked.")
+        return report
+    return validate_trdata_array(zatrdata, rules)
+
+
+def _rule_names(rules: ty.Sequence[str] | None) -> list[str]:
+    """Names of the rules to check, in order and without duplicates.
+
+    Raises:
+        ValueError: If a rule is unknown.
+    """
+    names = list(VALIDATION_RULES) if rules is None else list(dict.fromkeys(rules))
+    unknown = [name for name in names if name not in VALIDATION_RULES]
+    if unknown:
+        raise ValueError(
+            f"Unknown rule(s) {unknown}, expected any of {list(VALIDATION_RULES)}."
+        )
+    return names
+
+
+def _schema_issues(
+    trdata: ty.Mapping[str, ty.Any],
+    error: pydantic.ValidationError,
+) -> list[ValidationIssue]:
+    """Issues of the `SCHEMA_RULE`, one per error of the validation of `trdata`."""
+    records = trdata.get("values")
+    tr_id_key = ZATrainerData.model_fields["tr_id"].alias or "tr_id"
+    issues: list[ValidationIssue] = []
+    for detail in error.errors(include_url=False):
+        loc = detail["loc"]
+        tr_id, path = "", loc
+        if loc[:1] == ("values",) and len(loc) > 1 and isinstance(loc[1], int):
+            record = records[loc[1]] if isinstance(records, list) else None
+            tr_id = str(
+                record.get(tr_id_key, record.get("tr_id", f"#{loc[1]}"))
+                if isinstance(record, dict)
+                else f"#{loc[1]}"
+            )
+            path = loc[2:]
+        slots: dict[str, int] = {}
+        for part in path:
+            match = _SLOT_FIELD.fullmatch(str(part))
+            if match:
+                slots[match.group(1)] = int(match.group(2))
+        message = f"{'.'.join(map(str, path)) or 'values'}: {detail['msg']}"
+        if detail["type"] != "missing":
+            message += f" (got {detail['input']!r})"
+        issues.append(
+            ValidationIssue(
+                SCHEMA_RULE,
+                "error",
+                tr_id,
+                slots.get("poke"),
+                slots.get("waza"),
+                message,
+            )
+        )
+    return issues
+
+
+def _count_pokemon(trdata: ty.Mapping[str, ty.Any]) -> int:
+    """Number of non-empty Pokémon of the (unvalidated) trainer data."""
+    records = trdata.get("values")
+    if not isinstance(records, list):
+        return 0
+    dev_id_key = ZAPokemonData.model_fields["dev_id"].alias or "dev_id"
+    return sum(
+        isinstance(value, dict) and bool(value.get(dev_id_key, value.get("dev_id")))
+        for record in records
+        if isinstance(record, dict)
+        for key, value in record.items()
+        if _SLOT_FIELD.fullmatch(key) and key.startswith("poke")
+    )
+
+
+def _load_tables(zatrdata: ZATrainerDataArray) -> _Tables:
+    """Tables of the trainer data, and of the game data the rules refer to."""
+    import polars as pl
+
+    frames = to_frames(zatrdata)
+    trainers = with_defaults(frames[ZATrainerData], ZATrainerData)
+    pokemon = with_defaults(frames[ZAPokemonData], ZAPokemonData).filter(
+        pl.col("dev_id") != 0
+    )
+    moves = (
+        with_defaults(frames[ZAWazaData], ZAWazaData)
+        .filter(pl.col("waza_id") != 0)
+        .join(
+            pokemon.select("trainer_idx", "slot", "dev_id", "form_id"),
+            on=["trainer_idx", "slot"],
+        )
+    )
+    personal = load_personal_array()
+    return _Tables(
+        trainers=trainers,
+        pokemon=pokemon,
+        moves=moves,
+        species=personal.species,
+        legal=load_legal_moves(),
+        items=ZAItemArray.load().to_polars(),
+    )
+
+
+def _label(column: str, names: ty.Any) -> "pl.Expr":
+    """Display label of an ID column, e.g. `Pikachu (25)`. See `DisplayNames`."""
+    import polars as pl
+
+    labels: tuple[str, ...] = names.labels
+    return (
+        pl.col(column)
+        .replace_strict(
+            range(len(labels)),
+            labels,
+            default=pl.col(column).cast(pl.String),
+            return_dtype=pl.String,
+        )
+        .alias(f"{column}_label")
+    )
+
+
+def _check_species(tables: _Tables) -> "pl.DataFrame":
+    """Pokémon whose species form is not in the personal table."""
+    import polars as pl
+
+    return tables.pokemon.join(
+        tables.species, on=["dev_id", "form_id"], how="anti"
+    ).select(
+        "trainer_idx",
+        "slot",
+        pl.format(
+            "{} has no form {}",
+            _label("dev_id", settings.za_species_names),
+            "form_id",
+        ).alias("message"),
+    )
+
+
+def _check_species_present(tables: _Tables) -> "pl.DataFrame":
+    """Pokémon whose species form is not in the game."""
+    import polars as pl
+
+    return (
+        tables.pokemon.join(tables.species, on=["dev_id", "form_id"])
+        .filter(~pl.col("is_present"))
+        .select(
+            "trainer_idx",
+            "slot",
+            pl.format(
+                "{} (form {}) is not in the game",
+                _label("dev_id", settings.za_species_names),
+                "form_id",
+            ).alias("message"),
+        )
+    )
+
+
+def _check_legal_moves(tables: _Tables) -> "pl.DataFrame":
+    """Moves the species form of the Pokémon cannot learn, see `LegalMoves.is_legal()`.
+
+    Each distinct species form and move is checked once, against the bitsets.
+    """
+    import polars as pl
+
+    keys = ["dev_id", "form_id", "waza_id"]
+    distinct = tables.moves.select(keys).unique()
+    is_illegal = pl.Series(
+        [not tables.legal.is_legal(*key) for key in distinct.iter_rows()],
+        dtype=pl.Boolean,
+    )
+    return tables.moves.join(distinct.filter(is_illegal), on=keys, how="semi").select(
+        *_ISSUE_KEYS,
+        pl.format(
+            "{} cannot learn {}",
+            _label("dev_id", settings.za_species_names),
+            _label("waza_id", settings.za_waza_names),
+        ).alias("message"),
+    )
+
+
+def _check_duplicate_moves(tables: _Tables) -> "pl.DataFrame":
+    """Moves a Pokémon knows more than once, reported on their later slots."""
+    import polars as pl
+
+    duplicated = pl.int_range(pl.len()).over("trainer_idx", "slot", "waza_id") > 0
+    return (
+        tables.moves.sort(_ISSUE_KEYS)
+        .filter(duplicated)
+        .select(
+            *_ISSUE_KEYS,
+            pl.format(
+                "{} is already known", _label("waza_id", settings.za_waza_names)
+            ).alias("message"),
+        )
+    )
+
+
+def _check_held_item(tables: _Tables) -> "pl.DataFrame":
+    """Held items that do not exist, or cannot be held."""
+    import polars as pl
+
+    pokemon = tables.pokemon.filter(pl.col("item") != 0).join(
+        tables.items.select(pl.col("id").alias("item"), "can_not_hold"),
+        on="item",
+        how="left",
+    )
+    return pokemon.filter(pl.col("can_not_hold").fill_null(True)).select(
+        "trainer_idx",
+        "slot",
+        pl.format(
+            "{} cannot be held",
+            _label("item", settings.za_item_names),
+        ).alias("message"),
+    )
+
+
+def _check_ball_id(tables: _Tables) -> "pl.DataFrame":
+    """Pokémon in a ball that is not one of `ZABallID`."""
+    import polars as pl
+
+    return tables.pokemon.filter(
+        ~pl.col("ball_id").is_in(list(ty.get_args(ZABallID)))
+    ).select(
+        "trainer_idx",
+        "slot",
+        pl.format("{} is not a ball", _label("ball_id", settings.za_item_names)).alias(
+            "message"
+        ),
+    )
+
+
+def _mega_stone_holders(tables: _Tables) -> "pl.DataFrame":
+    """Pokémon holding a mega stone."""
+    import polars as pl
+
+    stones = tables.items.filter(pl.col("pocket") == MEGA_STONE_POCKET)
+    return tables.pokemon.filter(
+        pl.col("item").is_in(stones.get_column("id").implode())
+    ).select("trainer_idx", "slot", "item")
+
+
+def _check_mega_evolution(tables: _Tables) -> "pl.DataFrame":
+    """Trainers allowed to mega evolve, without any Pokémon holding a mega stone."""
+    import polars as pl
+
+    return (
+        tables.trainers.filter(pl.col("meg_evolution"))
+        .join(_mega_stone_holders(tables), on="trainer_idx", how="anti")
+        .select(
+            "trainer_idx",
+            pl.lit("can mega evolve, but no Pokémon holds a mega stone").alias(
+                "message"
+            ),
+        )
+    )
+
+
+def _check_mega_stone(tables: _Tables) -> "pl.DataFrame":
+    """Pokémon holding a mega stone, for trainers not allowed to mega evolve. Each
+    holder is reported.
+    """
+    import polars as pl
+
+    return (
+        _mega_stone_holders(tables)
+        .join(
+            tables.trainers.filter(~pl.col("meg_evolution")),
+            on="trainer_idx",
+            how="semi",
+        )
+        .select(
+            "trainer_idx",
+            "slot",
+            pl.format(
+                "holds {}, but the trainer cannot mega evolve",
+                _label("item", settings.za_item_names),
+            ).alias("message"),
+        )
+    )
+
+
+VALIDATION_RULES: dict[str, ValidationRule] = {
+    rule.name: rule
+    for rule in (
+        ValidationRule(
+            "species",
+            "error",
+            "The species form exists in the personal table.",
+            _check_species,
+        ),
+        ValidationRule(
+            "species_present",
+            "error",
+            "The species form is in the game.",
+            _check_species_present,
+        ),
+        ValidationRule(
+            "legal_moves",
+            "error",
+            "The species form can learn its moves.",
+            _check_legal_moves,
+        ),
+        ValidationRule(
+            "duplicate_moves",
+            "error",
+            "A Pokémon knows each move once.",
+            _check_duplicate_moves,
+        ),
+        ValidationRule(
+            "held_item",
+            "error",
+            "The held item exists and can be held.",
+            _check_held_item,
+        ),
+        ValidationRule(
+            "ball_id",
+            "error",
+            "The Pokémon is in a ball.",
+            _check_ball_id,
+        ),
+        ValidationRule(
+            "mega_evolution",
+            "warning",
+            "A trainer allowed to mega evolve has a Pokémon holding a mega stone.",
+            _check_mega_evolution,
+        ),
+        ValidationRule(
+            "mega_stone",
+            "warning",
+            "A Pokémon holds a mega stone only if its trainer can mega evolve.",
+            _check_mega_stone,
+        ),
+    )
+}
+"""The rules checked by `validate_trdata_array()`, by name."""
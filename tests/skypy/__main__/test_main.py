@@ -1,22 +1,177 @@
+import json
+import os
 from unittest.mock import patch
 
+import pydantic
 import pytest
 from click.testing import CliRunner
 
+from skypy import settings
 from skypy.__main__ import app
-from skypy.za import ZATrainerEditor
+from skypy.schemas import ZAPokemonData
+from skypy.za import ZATrainerEditor, load_trainer_data
 
 
-def test_main(cli_runner: CliRunner) -> None:
+def test_main(cli_runner: CliRunner, artifacts_path: str) -> None:
     """Test the main function."""
     with (
         patch.object(ZATrainerEditor, "__init__", return_value=None) as init,
         patch.object(ZATrainerEditor, "mainloop", return_value=None) as mainloop,
+        patch.object(ZATrainerEditor, "output_dir", artifacts_path, create=True),
     ):
         result = cli_runner.invoke(app)  # type: ignore
         assert result.exit_code == 0, result.output
         init.assert_called_once()
         mainloop.assert_called_once()
+        assert not init.call_args.kwargs["profiler"].enabled
+
+
+def test_main_profile(cli_runner: CliRunner, artifacts_path: str) -> None:
+    """Test `--profile` writes a report per startup stage."""
+    with (
+        patch.object(ZATrainerEditor, "__init__", return_value=None) as init,
+        patch.object(ZATrainerEditor, "mainloop", return_value=None),
+        patch.object(ZATrainerEditor, "output_dir", artifacts_path, create=True),
+    ):
+        result = cli_runner.invoke(app, ["--profile"])  # type: ignore
+        assert result.exit_code == 0, result.output
+    profiler = init.call_args.kwargs["profiler"]
+    assert profiler.enabled and "import" in profiler.sessions
+    profile_dir = os.path.join(artifacts_path, "profile")
+    for fname in ("profile_import.html", "profile_import.json", "profile_summary.json"):
+        assert os.path.isfile(os.path.join(profile_dir, fname))
+
+
+def test_za_edit(cli_runner: CliRunner, artifacts_path: str) -> None:
+    """Test `za edit` writes the edited JSON and binary, and `--dry-run` writes nothing."""
+    output = os.path.join(artifacts_path, "edit", "trdata_array.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    for path in (output, output.replace(".json", ".bin")):
+        if os.path.exists(path):
+            os.remove(path)
+    args = [
+        "za",
+        "edit",
+        "level=50",
+        "ai_expert=false",
+        "-t",
+        "ev_m02_*",
+        "--level",
+        "5:",
+    ]
+    result = cli_runner.invoke(app, [*args, "--dry-run"])  # type: ignore
+    assert result.exit_code == 0, result.output
+    assert "level=50" in result.output and not os.path.exists(output)
+
+    result = cli_runner.invoke(app, [*args, "-o", output, "--bin"])  # type: ignore
+    assert result.exit_code == 0, result.output
+    assert os.path.isfile(output.replace(".json", ".bin"))
+    edited = load_trainer_data(
+        file_name=os.path.basename(output),
+        input_dir=os.path.dirname(output),
+        ignore_output_dir=True,
+    )
+    for trainer in edited.values:
+        if trainer.tr_id.lower().startswith("ev_m02_"):
+            assert not trainer.ai_expert and trainer.poke_1.level == 50
+
+
+def test_za_edit_invalid(cli_runner: CliRunner) -> None:
+    """Test invalid assignments and a missing output are usage errors."""
+    result = cli_runner.invoke(app, ["za", "edit", "foo=1", "--dry-run"])  # type: ignore
+    assert result.exit_code == 2 and "foo" in result.output
+    result = cli_runner.invoke(app, ["za", "edit", "level=50"])  # type: ignore
+    assert result.exit_code == 2 and "--output" in result.output
+    result = cli_runner.invoke(app, ["za", "edit", "ball_id+=1", "--dry-run"])  # type: ignore
+    assert result.exit_code == 2 and "not a number" in result.output
+
+
+def test_za_edit_validation_error(cli_runner: CliRunner) -> None:
+    """Test edits the schema rejects are summarized, with exit code 1."""
+    with pytest.raises(pydantic.ValidationError) as error:
+        ZAPokemonData.model_validate({"level": 500})
+    with patch("skypy.za.edit.edit_trdata_array", side_effect=error.value):
+        result = cli_runner.invoke(app, ["za", "edit", "level=50", "--dry-run"])  # type: ignore
+    assert result.exit_code == 1 and isinstance(result.exception, SystemExit)
+    assert "1 validation error(s)" in result.output and "level" in result.output
+
+
+@pytest.mark.parametrize(
+    "command", [["edit", "level=50"], ["mod"], ["query", "SELECT 1"]]
+)
+def test_za_invalid_input(
+    cli_runner: CliRunner, artifacts_path: str, command: list[str]
+) -> None:
+    """Test invalid input files are usage errors, rather than trusted."""
+    with open(settings.files.file_trainer_data, encoding="utf-8") as f:
+        trdata = json.load(f)
+    trdata["values"][0]["trid_typo"] = trdata["values"][0].pop("trid")
+    path = os.path.join(artifacts_path, "invalid_input", "trdata_array.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trdata, f)
+    args = ["za", *command, "-i", path]
+    if command[0] != "query":
+        args.append("--dry-run")
+    result = cli_runner.invoke(app, args)  # type: ignore
+    assert result.exit_code == 2, result.output
+    assert "--input" in result.output and "trid_typo" in result.output
+
+
+def test_za_mod(cli_runner: CliRunner, artifacts_path: str) -> None:
+    """Test `za mod` applies the default recipe, and reports each rule."""
+    output = os.path.join(artifacts_path, "mod", "trdata_array.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    result = cli_runner.invoke(app, ["za", "mod", "-o", output])  # type: ignore
+    assert result.exit_code == 0, result.output
+    assert "1 trainer(s)" in result.output and "Total" in result.output
+    edited = load_trainer_data(
+        file_name=os.path.basename(output),
+        input_dir=os.path.dirname(output),
+        ignore_output_dir=True,
+    )
+    assert edited.get_trainer("00_test_data").poke_1.level == 100
+
+
+def test_za_validate(cli_runner: CliRunner) -> None:
+    """Test `za validate` reports the issues, and exits with an error code on errors."""
+    result = cli_runner.invoke(app, ["za", "validate", "-r", "duplicate_moves"])  # type: ignore
+    assert result.exit_code == 1 and "[duplicate_moves]" in result.output
+    result = cli_runner.invoke(app, ["za", "validate", "-r", "ball_id", "--json"])  # type: ignore
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["counts"] == {"ball_id": 0}
+    result = cli_runner.invoke(app, ["za", "validate", "-r", "foo"])  # type: ignore
+    assert result.exit_code == 2 and "foo" in result.output
+
+
+def test_za_validate_out_of_range(cli_runner: CliRunner, artifacts_path: str) -> None:
+    """Test `za validate` reports values out of range and unknown keys as errors."""
+    with open(settings.files.file_trainer_data, encoding="utf-8") as f:
+        trdata = json.load(f)
+    trdata["values"][0]["poke1"].update(level=500, foo=1)
+    path = os.path.join(artifacts_path, "validate", "out_of_range.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trdata, f)
+    result = cli_runner.invoke(app, ["za", "validate", "-i", path])  # type: ignore
+    assert result.exit_code == 1 and isinstance(result.exception, SystemExit)
+    assert "[schema]" in result.output and "level" in result.output
+    assert "foo" in result.output and "Traceback" not in result.output
+    result = cli_runner.invoke(app, ["za", "validate", "-i", path, "--json"])  # type: ignore
+    assert json.loads(result.output)["counts"] == {"schema": 2}
+
+
+def test_za_query(cli_runner: CliRunner) -> None:
+    """Test `za query` prints the result of the query, and rejects invalid SQL."""
+    sql = "SELECT za_rank, count(*) AS n FROM trainers GROUP BY za_rank"
+    result = cli_runner.invoke(app, ["za", "query", sql, "-f", "json"])  # type: ignore
+    assert result.exit_code == 0, result.output
+    assert all(row.keys() == {"za_rank", "n"} for row in json.loads(result.output))
+    sql = "SELECT name FROM waza_names WHERE id = 33"
+    result = cli_runner.invoke(app, ["za", "query", sql, "-f", "csv"])  # type: ignore
+    assert result.exit_code == 0 and result.output == "name\nTackle\n"
+    result = cli_runner.invoke(app, ["za", "query", sql, "--no-raw"])  # type: ignore
+    assert result.exit_code == 2 and "waza_names" in result.output
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+import builtins
+import os
+from unittest.mock import patch
+
+import pytest
+
+from skypy import settings
+from skypy._settings import DisplayNames, LookupTableRegistry, NameIndex
+
+
+def test_tables_are_loaded_once() -> None:
+    """Test the lookup tables are parsed once, then served from the cache."""
+    registry = LookupTableRegistry()
+    species = registry.table(settings.za_species_table_file)
+    mappings = registry.mapping(settings.za_species_mappings_file)
+    with patch.object(builtins, "open", side_effect=AssertionError("File reopened.")):
+        assert registry.table(settings.za_species_table_file) is species
+        assert registry.mapping(settings.za_species_mappings_file) is mappings
+
+
+def test_tables_are_immutable() -> None:
+    """Test the lookup tables cannot be mutated by callers."""
+    assert isinstance(settings.za_species_table, tuple)
+    with pytest.raises(TypeError):
+        settings.za_species_mappings["DEV_PIKATYUU"] = 0  # type: ignore
+    assert settings.za_species_table[25] == "Pikachu"
+    assert settings.za_species_mappings["DEV_PIKATYUU"] == 25
+
+
+def test_tables_are_reloaded_on_mtime_change(artifacts_path: str) -> None:
+    """Test a cached table is invalidated when its file changes on disk."""
+    registry = LookupTableRegistry()
+    fname = os.path.join(artifacts_path, "lookup_table.txt")
+    try:
+        with open(fname, "w", encoding="utf-8") as f:
+            f.write("Egg\n\nBulbasaur\n")
+        os.utime(fname, ns=(1_000_000_000, 1_000_000_000))
+        assert registry.table(fname) == ("Egg", "Bulbasaur")
+
+        with open(fname, "w", encoding="utf-8") as f:
+            f.write("Egg\nIvysaur\n")
+        # Same mtime: the cached value is still served
+        os.utime(fname, ns=(1_000_000_000, 1_000_000_000))
+        assert registry.table(fname) == ("Egg", "Bulbasaur")
+
+        os.utime(fname, ns=(2_000_000_000, 2_000_000_000))
+        assert registry.table(fname) == ("Egg", "Ivysaur")
+
+        registry.clear()
+        assert registry.table(fname) == ("Egg", "Ivysaur")
+    finally:
+        os.remove(fname)
+
+
+def test_name_index_policy() -> None:
+    """Test the name/ID resolution policy for aliases and IDs without a name."""
+    index = NameIndex({"NONE": 0, "FIRST": 1, "ALIAS": 1, "SECOND": 2})
+    assert index.to_id("ALIAS") == 1
+    assert index.to_name(1) == "FIRST"
+    assert index.names == ("NONE", "FIRST", "ALIAS", "SECOND")
+    assert index.ids == (0, 1, 2)
+    assert "ALIAS" in index and len(index) == 4
+    assert index.name_or_id(3) == 3
+    assert not index.has_id(3)
+    with pytest.raises(KeyError):
+        index.to_name(3)
+    with pytest.raises(KeyError):
+        index.to_id("MISSING")
+
+
+def test_name_index_matches_mappings() -> None:
+    """Test the settings indexes agree with the underlying mappings."""
+    for name, value in settings.za_waza_mappings.items():
+        assert settings.za_waza_index.to_id(name) == value
+        assert settings.za_waza_index.to_name(value) == name
+    assert settings.za_waza_index is settings.za_waza_index
+
+
+def test_display_names_policy() -> None:
+    """Test duplicate names get unique labels, the first ID keeping the bare name."""
+    names = DisplayNames(["None", "Poké Ball", "???", "Poké Ball", "???", "???"])
+    assert names.labels == (
+        "None",
+        "Poké Ball",
+        "???",
+        "Poké Ball #3",
+        "??? #4",
+        "??? #5",
+    )
+    assert names.to_id("Poké Ball") == 1
+    assert names.to_id("Poké Ball #3") == 3
+    assert names.to_label(4) == "??? #4"
+    assert names.ids_of("???") == (2, 4, 5)
+    assert names.is_ambiguous("???") and not names.is_ambiguous("None")
+    assert names.label_or_id(6) == 6
+    with pytest.raises(KeyError):
+        names.to_label(6)
+    with pytest.raises(KeyError):
+        names.to_id("Great Ball")
+    # A generated label never shadows a real name
+    names = DisplayNames(["A", "A", "A #1"])
+    assert len(set(names.labels)) == 3
+    assert names.to_id("A #1") == 2
+
+
+def test_display_names_match_tables() -> None:
+    """Test every ID of the settings tables round-trips through its label."""
+    for table, names in (
+        (settings.za_species_table, settings.za_species_names),
+        (settings.za_waza_table, settings.za_waza_names),
+        (settings.za_items_table, settings.za_item_names),
+    ):
+        assert len(set(names.labels)) == len(names) == len(table)
+        for value, name in enumerate(table):
+            assert names.to_id(names.to_label(value)) == value
+            assert names.to_id(name) == table.index(name)
+    assert settings.za_item_names is settings.za_item_names
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
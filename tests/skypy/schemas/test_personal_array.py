@@ -0,0 +1,114 @@
+import os
+import shutil
+
+import polars as pl
+import pytest
+
+from skypy import settings
+from skypy.schemas import (
+    LEARN_SOURCES,
+    PERSONAL_ARRAY_FILE,
+    ZAPersonalTables,
+    load_personal_array,
+    parse_personal_array,
+)
+from skypy.schemas.za_personal import _read_sidecar, _sidecar_paths
+
+PERSONAL_ARRAY = os.path.join(settings.files.za_raw_assets, PERSONAL_ARRAY_FILE)
+
+
+@pytest.fixture(scope="module")
+def personal() -> ZAPersonalTables:
+    """The parsed personal table."""
+    return parse_personal_array(PERSONAL_ARRAY)
+
+
+def test_species(personal: ZAPersonalTables) -> None:
+    """Test there is one row per species form, with its cells split."""
+    species = personal.species
+    assert species.select("dev_id", "form_id").is_duplicated().sum() == 0
+    bulbasaur = personal.get_species(1)
+    assert bulbasaur["base"] == {
+        "HP": 45,
+        "ATK": 49,
+        "DEF": 49,
+        "SPA": 65,
+        "SPD": 65,
+        "SPE": 45,
+    }
+    assert bulbasaur["ev_yield"]["SPA"] == 1
+    assert bulbasaur["gender_group"] == "BOTH" and bulbasaur["gender_ratio"] == 12
+    assert bulbasaur["is_present"] is True
+    # Mega Venusaur
+    assert personal.get_species(3, 1)["base"]["DEF"] == 123
+    # Species IDs are the internal ones, as in the trainer data
+    assert personal.get_species(917)["national_dex"] == 982
+    with pytest.raises(KeyError):
+        personal.get_species(1, 99)
+
+
+def test_evolutions(personal: ZAPersonalTables) -> None:
+    """Test evolutions are exploded, one row per evolution."""
+    evolutions = personal.evolutions
+    bulbasaur = evolutions.filter(pl.col("dev_id") == 1).row(0, named=True)
+    assert bulbasaur == {
+        "dev_id": 1,
+        "form_id": 0,
+        "level": 16,
+        "method": 4,
+        "argument": 0,
+        "into_dev_id": 2,
+        "into_form_id": 0,
+    }
+    assert evolutions.filter(pl.col("dev_id") == 133).height == 8  # Eevee
+    assert evolutions.filter(pl.col("dev_id") == 3).is_empty()
+
+
+def test_learnset(personal: ZAPersonalTables) -> None:
+    """Test moves are exploded, one row per move and source."""
+    learnset = personal.learnset
+    assert set(learnset.get_column("source").unique()) <= set(LEARN_SOURCES)
+    bulbasaur = learnset.filter((pl.col("dev_id") == 1) & (pl.col("form_id") == 0))
+    tackle = bulbasaur.filter(pl.col("source") == "level_up").row(0, named=True)
+    assert (tackle["waza_id"], tackle["level"], tackle["plus_level"]) == (33, 1, 10)
+    machines = bulbasaur.filter(pl.col("source") == "machine")
+    assert machines.get_column("waza_id").to_list()[:3] == [14, 22, 33]
+    assert machines.get_column("level").null_count() == machines.height
+    # The placeholder species has no move
+    assert learnset.filter(pl.col("dev_id") == 0).is_empty()
+
+
+def test_parse_bytes(personal: ZAPersonalTables) -> None:
+    """Test the content of the file can be parsed too."""
+    with open(PERSONAL_ARRAY, "rb") as f:
+        parsed = parse_personal_array(f.read())
+    assert all(a.equals(b) for a, b in zip(parsed, personal, strict=True))
+
+
+def test_sidecar(personal: ZAPersonalTables, artifacts_path: str) -> None:
+    """Test the sidecar is written, read back, and ignored once stale."""
+    path = os.path.join(artifacts_path, PERSONAL_ARRAY_FILE)
+    shutil.copyfile(PERSONAL_ARRAY, path)
+    for cache in _sidecar_paths(path).values():
+        if os.path.exists(cache):
+            os.remove(cache)
+    assert _read_sidecar(path) is None
+
+    loaded = load_personal_array(path)
+    assert load_personal_array(path) is loaded
+    assert all(os.path.exists(cache) for cache in _sidecar_paths(path).values())
+    cached = _read_sidecar(path)
+    assert cached is not None
+    assert all(a.equals(b) for a, b in zip(cached, personal, strict=True))
+
+    # Changing the file invalidates the sidecar
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert _read_sidecar(path) is None
+    reloaded = load_personal_array(path)
+    assert reloaded is not loaded
+    assert _read_sidecar(path) is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
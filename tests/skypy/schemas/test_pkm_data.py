@@ -42,7 +42,8 @@ def test_pokemon_data_to_str() -> None:
     raw = data.model_dump(mode="json")
     assert raw["dev_id"] == get_key_by_value(settings.za_species_mappings, data.dev_id)
     assert raw["sex"] == get_key_by_value(settings.za_sex_mappings, data.sex)
-    assert raw["item"] == get_key_by_value(settings.za_item_mappings, data.item)
+    # Item 0 has no name: it is kept as an integer
+    assert raw["item"] == data.item
     assert raw["ball_id"] == get_key_by_value(settings.za_ball_mappings, data.ball_id)
     assert raw["seikaku"] == get_key_by_value(
         settings.za_seikaku_mappings, data.seikaku
@@ -55,6 +56,15 @@ def test_pokemon_data_to_str() -> None:
     )
 
 
+def test_pokemon_data_unnamed_id_round_trip() -> None:
+    """Test IDs without a name are dumped as integers and can be parsed back."""
+    data = ZAPokemonData(dev_id=0, item=0)
+    raw = data.model_dump(mode="json", by_alias=True)
+    assert raw["devId"] == 0
+    assert raw["item"] == 0
+    assert ZAPokemonData(**raw) == data
+
+
 def test_pokemon_data_from_str() -> None:
     """Test `ZAPokemonData` class can parse original trainer data from string representation, not only from the `int` version."""
     data = ZAPokemonData(dev_id="DEV_PIKATYUU")  # type: ignore
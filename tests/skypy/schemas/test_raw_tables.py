@@ -0,0 +1,113 @@
+import gc
+import json
+import os
+import typing as ty
+
+import polars as pl
+import pytest
+
+from skypy import settings
+from skypy.schemas import (
+    ZAItemArray,
+    ZAPersonalWazaArray,
+    ZARawTable,
+    ZATokuseiArray,
+    ZAWazaArray,
+    ZAWazaParamArray,
+    za_raw,
+)
+
+TABLES: list[type[ZARawTable[ty.Any]]] = [
+    ZAWazaArray,
+    ZAPersonalWazaArray,
+    ZAWazaParamArray,
+    ZAItemArray,
+    ZATokuseiArray,
+]
+
+
+@pytest.mark.parametrize("table", TABLES)
+def test_load(table: type[ZARawTable[ty.Any]]) -> None:
+    """Test tables load from the JSON bytes as from `json.load()`, and are cached."""
+    path = os.path.join(settings.files.za_raw_assets, table.file_name)
+    loaded = table.load()
+    assert len(loaded) > 0 and table.load() is loaded
+    with open(path, encoding="utf-8") as f:
+        assert table.model_validate(json.load(f)) == loaded
+    # Indexed by ID
+    for key in loaded.ids[:20]:
+        assert key in loaded
+        assert loaded.get_all(key)[0] is loaded[key]
+        if table.id_field is not None:
+            assert getattr(loaded[key], table.id_field) == key
+
+
+def test_waza_array() -> None:
+    """Test moves are indexed by their ID."""
+    waza = ZAWazaArray.load()
+    assert len(waza.ids) == len(waza)
+    assert waza[85].power == 90  # Thunderbolt
+    with pytest.raises(KeyError):
+        waza.get(-1)
+    assert -1 not in waza and waza.get_all(-1) == []
+
+
+def test_duplicate_ids() -> None:
+    """Test all rows sharing an ID are kept, in order."""
+    params = ZAPersonalWazaArray.load()
+    assert len(params.ids) < len(params)
+    rows = params.get_all(85)
+    assert len(rows) > 1 and rows[0] is params[85]
+    assert all(row.waza_id == 85 for row in rows)
+
+
+def test_positional_ids() -> None:
+    """Test tables without ID are indexed by position, also in their frame."""
+    tokusei = ZATokuseiArray.load()
+    assert tokusei.ids == list(range(len(tokusei)))
+    frame = tokusei.to_polars()
+    assert frame.columns[0] == "id"
+    assert frame.row(5, named=True)["breakable"] == tokusei[5].breakable
+
+
+def test_to_polars() -> None:
+    """Test the columnar view can be queried, and is built once."""
+    items = ZAItemArray.load()
+    frame = items.to_polars()
+    assert items.to_polars() is frame
+    assert frame.height == len(items)
+    priced = frame.filter(pl.col("price") > 0).get_column("id").to_list()
+    assert priced == [i for i in items.ids if items[i].price > 0]
+    waza = ZAWazaArray.load().to_polars()
+    assert isinstance(waza.schema["inflict"], pl.Struct)
+
+
+def test_to_polars_equality() -> None:
+    """Test tables still compare equal once their columnar view is built, and the
+    view is dropped with its table.
+    """
+    row = {"Id": 1, "Price": 100}
+    first = ZAItemArray.model_validate({"Table": [row]})
+    second = ZAItemArray.model_validate({"Table": [row]})
+    first.to_polars()
+    assert first == second
+    second.to_polars()
+    assert first == second
+    key = id(first)
+    del first
+    gc.collect()
+    assert key not in za_raw._FRAMES
+
+
+def test_wrapped_rows() -> None:
+    """Test wrapped rows are unwrapped, and unwrapped ones are accepted too."""
+    row = {"WazaId": 7, "EffectTime": 1.5}
+    wrapped = ZAWazaParamArray.model_validate_json(
+        json.dumps({"Table": [{"Table": [row]}, row]})
+    )
+    assert [r.waza_id for r in wrapped.values] == [7, 7]
+    assert wrapped.get_all(7) == wrapped.values
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -0,0 +1,62 @@
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from skypy.schemas import ZATrainerDataArray, ZATrainerTables
+
+
+def _dump(zatrdata: ZATrainerDataArray) -> dict:
+    """JSON dump, as written to disk."""
+    return zatrdata.model_dump(mode="json", by_alias=True, exclude_unset=True)
+
+
+def test_to_arrow_layout(zatrdata: ZATrainerDataArray) -> None:
+    """Test the normalized trainers/pokemon/moves layout."""
+    tables = zatrdata.to_arrow()
+    assert isinstance(tables, ZATrainerTables)
+    assert tables.trainers.num_rows == len(zatrdata)
+    assert tables.pokemon.num_rows == 6 * len(zatrdata)
+    assert tables.moves.num_rows == 4 * tables.pokemon.num_rows
+    assert pa.types.is_dictionary(tables.pokemon.schema.field("dev_id").type)
+    assert pa.types.is_dictionary(tables.moves.schema.field("waza_id").type)
+    assert pa.types.is_dictionary(tables.moves.schema.field("tr_id").type)
+    assert tables.trainers.column("tr_id").to_pylist()[0] == zatrdata[0].tr_id
+    row = tables.pokemon.slice(0, 1).to_pylist()[0]
+    assert row["slot"] == 1
+    assert row["dev_id"] == zatrdata[0].poke_1.dev_id
+    # Unset fields are null
+    assert "sex" not in zatrdata[0].poke_1.model_fields_set
+    assert row["sex"] is None
+
+
+def test_arrow_round_trip(zatrdata: ZATrainerDataArray) -> None:
+    """Test converting to Arrow and back loses nothing, including unset fields."""
+    assert _dump(ZATrainerDataArray.from_arrow(*zatrdata.to_arrow())) == (
+        _dump(zatrdata)
+    )
+
+
+def test_polars_round_trip(zatrdata: ZATrainerDataArray) -> None:
+    """Test converting to Polars and back loses nothing, including unset fields."""
+    frames = zatrdata.to_polars()
+    assert frames.pokemon.schema["tr_id"] == pl.Categorical
+    assert _dump(ZATrainerDataArray.from_polars(*frames)) == _dump(zatrdata)
+
+
+def test_polars_vectorized_edit(zatrdata: ZATrainerDataArray) -> None:
+    """Test a bulk edit done on the data frames ends up in the models."""
+    frames = zatrdata.to_polars()
+    pokemon = frames.pokemon.with_columns(
+        pl.when(pl.col("tr_id") == "00_test_data")
+        .then(100)
+        .otherwise(pl.col("level"))
+        .alias("level")
+    )
+    edited = ZATrainerDataArray.from_polars(frames.trainers, pokemon, frames.moves)
+    trainer = edited["00_test_data"]
+    assert all(getattr(trainer, f"poke_{slot}").level == 100 for slot in range(1, 7))
+    assert edited[1] == zatrdata[1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -0,0 +1,53 @@
+import copy
+
+import pydantic
+import pytest
+
+from skypy.schemas import (
+    ZATrainerDataArray,
+    construct_trdata_array,
+    validate_in_background,
+)
+
+
+def test_construct_matches_validation(za_trainer_data_raw: dict) -> None:
+    """Test trusted construction builds the same models as validation."""
+    validated = ZATrainerDataArray.model_validate(za_trainer_data_raw)
+    constructed = construct_trdata_array(za_trainer_data_raw)
+    assert constructed == validated
+    for trainer, expected in zip(constructed.values, validated.values):
+        assert trainer.model_fields_set == expected.model_fields_set
+        assert trainer.poke_1.model_fields_set == expected.poke_1.model_fields_set
+    assert constructed.model_dump(mode="json", by_alias=True, exclude_unset=True) == (
+        validated.model_dump(mode="json", by_alias=True, exclude_unset=True)
+    )
+    # Lookups and assignment validation still work
+    assert constructed["00_test_data"] is constructed.values[0]
+    assert constructed.values[1].poke_1 is not constructed.values[2].poke_1
+    with pytest.raises(pydantic.ValidationError):
+        constructed.values[0].poke_1.level = 500
+
+
+def test_construct_unknown_key(za_trainer_data_raw: dict) -> None:
+    """Test unknown keys are still rejected."""
+    data = copy.deepcopy(za_trainer_data_raw)
+    data["values"][0]["xxx"] = 1
+    with pytest.raises(KeyError):
+        construct_trdata_array(data)
+
+
+def test_validate_in_background(za_trainer_data_raw: dict) -> None:
+    """Test the background validation reports valid and invalid data."""
+    assert isinstance(
+        validate_in_background(za_trainer_data_raw).result(), ZATrainerDataArray
+    )
+    data = copy.deepcopy(za_trainer_data_raw)
+    data["values"][0]["poke1"]["level"] = 500
+    constructed = construct_trdata_array(data)
+    assert constructed.values[0].poke_1.level == 500
+    error = validate_in_background(data).exception()
+    assert isinstance(error, pydantic.ValidationError)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
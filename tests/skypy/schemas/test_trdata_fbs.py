@@ -0,0 +1,183 @@
+import json
+import os
+import shutil
+import subprocess
+
+import flatbuffers
+import pytest
+
+from skypy import settings
+from skypy.schemas import (
+    BFBS_BASE_TYPES,
+    ZA_TRDATA_ARRAY_FBS,
+    FbsTable,
+    ZATrainerDataArray,
+    check_bfbs_layout,
+    decode_trdata_array,
+    encode_trdata_array,
+    trdata_array_from_fbs_json,
+    trdata_array_to_fbs_json,
+)
+
+
+@pytest.fixture(scope="module")
+def raw_trdata() -> dict:
+    """The `flatc --json` output of the original `trdata_array.bin`."""
+    fname = os.path.join("assets", "za", "Raw", "trdata_array.json")
+    with open(fname, encoding="utf-8") as f:
+        data: dict = json.load(f)
+    return data
+
+
+def test_trdata_fbs_round_trip(raw_trdata: dict) -> None:
+    """Test encoding then decoding the raw trainer data loses nothing."""
+    zatrdata = trdata_array_from_fbs_json(raw_trdata)
+    buf = encode_trdata_array(zatrdata)
+    decoded = decode_trdata_array(buf)
+    assert trdata_array_to_fbs_json(decoded) == raw_trdata
+    # Decoded data re-encodes to the same bytes
+    assert encode_trdata_array(decoded) == buf
+
+
+def test_trdata_fbs_matches_editor_json(
+    raw_trdata: dict,
+    zatrdata: ZATrainerDataArray,
+) -> None:
+    """Test the editor JSON and the raw JSON encode to the same binary."""
+    buf = encode_trdata_array(trdata_array_from_fbs_json(raw_trdata))
+    assert encode_trdata_array(zatrdata) == buf
+
+
+def _bfbs(spec: FbsTable, **overrides: dict[str, int]) -> bytes:
+    """Binary schema (`reflection.Schema`) of a layout, as `flatc --binary --schema`
+    writes it. `overrides` maps schema field names to a `base_type` or a `default`.
+    """
+    tables: list[FbsTable] = []
+
+    def collect(table: FbsTable) -> None:
+        if all(t.name != table.name for t in tables):
+            tables.append(table)
+            for field in table.fields:
+                if field.table is not None:
+                    collect(field.table)
+
+    collect(spec)
+    index = {table.name: i for i, table in enumerate(tables)}
+    builder = flatbuffers.Builder(1024)
+    objects = []
+    for table in tables:
+        fields = []
+        for slot, field in enumerate(table.fields):
+            override = overrides.get(field.fbs_name, {})
+            name = builder.CreateString(field.fbs_name)
+            builder.StartObject(3)  # reflection.Type
+            builder.PrependInt8Slot(
+                0, override.get("base_type", BFBS_BASE_TYPES[field.kind]), 0
+            )
+            if field.kind == "vector":
+                builder.PrependInt8Slot(1, BFBS_BASE_TYPES["table"], 0)
+            if field.table is not None:
+                builder.PrependInt32Slot(2, index[field.table.name], -1)
+            type_ = builder.EndObject()
+            builder.StartObject(7)  # reflection.Field
+            builder.PrependUOffsetTRelativeSlot(0, name, 0)
+            builder.PrependUOffsetTRelativeSlot(1, type_, 0)
+            builder.PrependUint16Slot(2, slot, 0)
+            builder.PrependUint16Slot(3, 4 + 2 * slot, 0)
+            builder.PrependInt64Slot(4, override.get("default", 0), 0)
+            fields.append(builder.EndObject())
+        name = builder.CreateString(f"pkNX.Structures.FlatBuffers.{table.name}")
+        builder.StartVector(4, len(fields), 4)
+        for offset in reversed(fields):
+            builder.PrependUOffsetTRelative(offset)
+        vector = builder.EndVector()
+        builder.StartObject(2)  # reflection.Object
+        builder.PrependUOffsetTRelativeSlot(0, name, 0)
+        builder.PrependUOffsetTRelativeSlot(1, vector, 0)
+        objects.append(builder.EndObject())
+    builder.StartVector(4, len(objects), 4)
+    for offset in reversed(objects):
+        builder.PrependUOffsetTRelative(offset)
+    vector = builder.EndVector()
+    builder.StartVector(4, 0, 4)
+    enums = builder.EndVector()
+    builder.StartObject(5)  # reflection.Schema
+    builder.PrependUOffsetTRelativeSlot(0, vector, 0)
+    builder.PrependUOffsetTRelativeSlot(1, enums, 0)
+    builder.PrependUOffsetTRelativeSlot(4, objects[0], 0)
+    builder.Finish(builder.EndObject(), file_identifier=b"BFBS")
+    return bytes(builder.Output())
+
+
+def test_check_bfbs_layout() -> None:
+    """Test the layout is checked against the slots, names, types and defaults of a
+    binary schema.
+    """
+    check_bfbs_layout(_bfbs(ZA_TRDATA_ARRAY_FBS))
+    with pytest.raises(ValueError, match="PokeData.Sex: int32 in the layout"):
+        check_bfbs_layout(
+            _bfbs(ZA_TRDATA_ARRAY_FBS, Sex={"base_type": BFBS_BASE_TYPES["uint8"]})
+        )
+    with pytest.raises(ValueError, match="ScaleValue: the default is not 0"):
+        check_bfbs_layout(_bfbs(ZA_TRDATA_ARRAY_FBS, ScaleValue={"default": 128}))
+    with pytest.raises(ValueError, match="not a FlatBuffers binary schema"):
+        check_bfbs_layout(b"\0" * 16)
+
+
+def test_dump_checks_bfbs(artifacts_path: str, zatrdata: ZATrainerDataArray) -> None:
+    """Test binaries are not written if the binary schema does not match."""
+    path = os.path.join(artifacts_path, "bfbs", "trdata_array.json")
+    bfbs_file = os.path.join(artifacts_path, "bfbs", "trdata_array.bfbs")
+    shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+    os.makedirs(os.path.dirname(path))
+    with open(bfbs_file, "wb") as f:
+        f.write(_bfbs(ZA_TRDATA_ARRAY_FBS, DevId={"base_type": 7}))
+    with pytest.raises(ValueError, match="DevId"):
+        zatrdata.dump(path, bfbs_file=bfbs_file, create_binaries=True)
+    assert not os.path.exists(path)
+
+    with open(bfbs_file, "wb") as f:
+        f.write(_bfbs(ZA_TRDATA_ARRAY_FBS))
+    zatrdata.dump(path, bfbs_file=bfbs_file, create_binaries=True)
+    assert os.path.exists(os.path.splitext(path)[0] + ".bin")
+    with pytest.raises(FileNotFoundError):
+        zatrdata.dump_binary(path, bfbs_file=bfbs_file + ".missing")
+
+
+@pytest.mark.skipif(
+    shutil.which("flatc") is None
+    or not os.path.exists(settings.files.za_trainers_bfbs_file),
+    reason="Needs `flatc` and the game's binary schema.",
+)
+def test_trdata_fbs_matches_flatc(raw_trdata: dict, artifacts_path: str) -> None:
+    """Test the encoder and `flatc` agree on the game's schema, both ways."""
+    bfbs_file = settings.files.za_trainers_bfbs_file
+    check_bfbs_layout(bfbs_file)
+    out = os.path.join(artifacts_path, "flatc")
+    os.makedirs(out, exist_ok=True)
+    expected = trdata_array_to_fbs_json(trdata_array_from_fbs_json(raw_trdata))
+
+    # `flatc -b` output, decoded by skypy
+    json_file = os.path.join(out, "trdata_array.json")
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump(raw_trdata, f)
+    subprocess.run(["flatc", "-b", "-o", out, bfbs_file, json_file], check=True)
+    with open(os.path.join(out, "trdata_array.bin"), "rb") as f:
+        assert trdata_array_to_fbs_json(decode_trdata_array(f.read())) == expected
+
+    # skypy output, decoded by `flatc --json`
+    bin_file = os.path.join(out, "encoded.bin")
+    with open(bin_file, "wb") as f:
+        f.write(encode_trdata_array(trdata_array_from_fbs_json(raw_trdata)))
+    subprocess.run(
+        ["flatc", "--json", "--strict-json", "--raw-binary", "-o", out]
+        + [bfbs_file, "--", bin_file],
+        check=True,
+    )
+    with open(os.path.join(out, "encoded.json"), encoding="utf-8") as f:
+        decoded = json.load(f)
+    assert trdata_array_to_fbs_json(trdata_array_from_fbs_json(decoded)) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
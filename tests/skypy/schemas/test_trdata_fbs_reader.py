@@ -0,0 +1,79 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from skypy.schemas import (
+    FbsView,
+    ZATrainerDataArray,
+    ZATrainerDataReader,
+    encode_trdata_array,
+    trdata_array_to_fbs_json,
+    za_fbs,
+)
+from skypy.za import load_trainer_data
+
+
+@pytest.fixture
+def trdata_bin(artifacts_path: str, zatrdata: ZATrainerDataArray) -> str:
+    """Binary trainer data, on disk."""
+    fname = os.path.join(artifacts_path, "trdata_array_reader.bin")
+    zatrdata.dump_binary(fname)
+    return fname
+
+
+def test_reader_lazy_fields(trdata_bin: str, zatrdata: ZATrainerDataArray) -> None:
+    """Test fields are read on access, without decoding whole tables."""
+    with (
+        ZATrainerDataReader(trdata_bin) as reader,
+        patch.object(za_fbs, "_decode_table", side_effect=AssertionError("Decoded.")),
+    ):
+        assert len(reader) == len(zatrdata)
+        assert reader.tr_ids == [trainer.tr_id for trainer in zatrdata.values]
+        trainer = reader["00_test_data"]
+        assert isinstance(trainer, FbsView)
+        expected = zatrdata["00_test_data"]
+        assert trainer.poke_1.level == expected.poke_1.level
+        assert trainer.poke_1.waza_1.waza_id == expected.poke_1.waza_1.waza_id
+        assert trainer.poke_1.talent_value.HP == expected.poke_1.talent_value.HP
+        assert trainer.ai_basic == expected.ai_basic
+        assert reader[-1].tr_id == zatrdata.values[-1].tr_id
+        assert "00_test_data" in reader and "xxx" not in reader
+        with pytest.raises(ValueError):
+            reader["xxx"]
+        with pytest.raises(AttributeError):
+            trainer.xxx
+
+
+def test_reader_unset_fields(zatrdata: ZATrainerDataArray) -> None:
+    """Test fields not written to the binary read as the schema defaults."""
+    reader = ZATrainerDataReader(buf=encode_trdata_array(zatrdata))
+    trainer = reader[0]
+    assert "sex" not in zatrdata[0].poke_1.model_fields_set
+    assert not trainer.poke_1.has_field("sex")
+    assert trainer.poke_1.sex == 0
+    assert trainer.poke_1.has_field("level")
+
+
+def test_reader_to_model(trdata_bin: str, zatrdata: ZATrainerDataArray) -> None:
+    """Test the views materialize to the same data as a full decode."""
+    with ZATrainerDataReader(trdata_bin) as reader:
+        assert trdata_array_to_fbs_json(reader.to_model()) == (
+            trdata_array_to_fbs_json(zatrdata)
+        )
+        model = reader[5].to_model()
+    assert model.tr_id == zatrdata.values[5].tr_id  # type: ignore[attr-defined]
+
+
+def test_load_trainer_data_binary(
+    trdata_bin: str, zatrdata: ZATrainerDataArray
+) -> None:
+    """Test `load_trainer_data` reads binaries."""
+    trainers = load_trainer_data(
+        os.path.basename(trdata_bin), input_dir=os.path.dirname(trdata_bin)
+    )
+    assert trdata_array_to_fbs_json(trainers) == trdata_array_to_fbs_json(zatrdata)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
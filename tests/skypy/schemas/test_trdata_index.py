@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+import pytest
+
+from skypy.schemas import ZATrainerData, ZATrainerDataArray
+
+
+def test_trainer_lookup_by_id(zatrdata: ZATrainerDataArray) -> None:
+    """Test `get_trainer`, `__getitem__` and `__contains__`."""
+    trainer = zatrdata.values[10]
+    assert zatrdata.get_trainer(trainer.tr_id) is trainer
+    assert zatrdata[trainer.tr_id] is trainer
+    assert zatrdata[10] is trainer
+    assert trainer.tr_id in zatrdata
+    assert "xxx" not in zatrdata
+    assert len(zatrdata) == len(zatrdata.values)
+    with pytest.raises(ValueError):
+        zatrdata["xxx"]
+
+
+def test_trainer_set_many_get_many(zatrdata: ZATrainerDataArray) -> None:
+    """Test bulk `get_many` and `set_many`."""
+    trids = [trainer.tr_id for trainer in zatrdata.values[1:200]]
+    copies = {trid: zatrdata[trid].model_copy(deep=True) for trid in trids}
+    for trainer in copies.values():
+        trainer.money_rate = 20
+    zatrdata.set_many(copies)
+    assert zatrdata.get_many(trids) == list(copies.values())
+    assert all(trainer.money_rate == 20 for trainer in zatrdata.get_many(trids))
+
+
+def test_trainer_add_remove(zatrdata: ZATrainerDataArray) -> None:
+    """Test the index is maintained on insert, replace and delete."""
+    new = zatrdata[0].model_copy(update={"tr_id": "new_trainer"})
+    zatrdata.add_trainer(new, index=1)
+    assert zatrdata.values[1] is new
+    assert zatrdata["new_trainer"] is new
+    last = zatrdata.values[-1]
+    assert zatrdata[last.tr_id] is last
+    with pytest.raises(ValueError):
+        zatrdata.add_trainer(new)
+
+    renamed = new.model_copy(update={"tr_id": "renamed_trainer"})
+    zatrdata.set_trainer("new_trainer", renamed)
+    assert "new_trainer" not in zatrdata
+    assert zatrdata["renamed_trainer"] is renamed
+
+    assert zatrdata.remove_trainer("renamed_trainer") is renamed
+    assert "renamed_trainer" not in zatrdata
+    assert zatrdata[last.tr_id] is last
+
+
+def test_trainer_index_survives_direct_edits(zatrdata: ZATrainerDataArray) -> None:
+    """Test lookups stay correct when `values` or a `tr_id` is edited directly."""
+    first = zatrdata.values[0]
+    old_id = first.tr_id
+    first.tr_id = "edited"
+    # The stale entry of the old ID is detected, and the index rebuilt
+    assert old_id not in zatrdata
+    assert zatrdata["edited"] is first
+    zatrdata.values = zatrdata.values[::-1]
+    assert zatrdata["edited"] is zatrdata.values[-1]
+    zatrdata.values.append(ZATrainerData(**zatrdata.values[0].model_dump()))
+    zatrdata.values[-1].tr_id = "appended"
+    assert zatrdata["appended"] is zatrdata.values[-1]
+
+
+def test_trainer_index_miss(zatrdata: ZATrainerDataArray) -> None:
+    """Test a miss rebuilds the index once, so direct edits are found, and hits do
+    not rebuild it.
+    """
+    zatrdata.values[1] = zatrdata.values[1].model_copy(update={"tr_id": "replaced"})
+    zatrdata.values[2].tr_id = "renamed"
+    with patch.object(
+        ZATrainerDataArray, "_reindex", side_effect=zatrdata._reindex
+    ) as reindex:
+        assert zatrdata.get_trainer("replaced") is zatrdata.values[1]
+        reindex.assert_called_once()
+        assert zatrdata.get_trainer("renamed") is zatrdata.values[2]
+        assert "xxx" not in zatrdata
+        assert reindex.call_count == 2
+        zatrdata.get_trainer("replaced")
+        assert reindex.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -0,0 +1,132 @@
+import copy
+import json
+import os
+
+import pydantic
+import pytest
+
+from skypy.schemas import LazyTrainerList, ZATrainerDataArray, lazy_trdata_array
+
+
+def test_lazy_materialization(za_trainer_data_raw: dict) -> None:
+    """Test trainers are only built when accessed."""
+    zatrdata = lazy_trdata_array(za_trainer_data_raw)
+    values = zatrdata.values
+    assert isinstance(values, LazyTrainerList)
+    assert len(zatrdata) == len(za_trainer_data_raw["values"])
+    assert zatrdata.tr_ids[0] == "00_test_data"
+    assert "00_test_data" in zatrdata
+    assert values.materialized_count == 0
+
+    trainer = zatrdata["00_test_data"]
+    assert values.materialized_count == 1 and values.is_materialized(0)
+    assert zatrdata["00_test_data"] is trainer
+    assert zatrdata == ZATrainerDataArray.model_validate(za_trainer_data_raw)
+
+
+def test_lazy_dump(za_trainer_data_raw: dict) -> None:
+    """Test untouched records are dumped verbatim, and edits are dumped."""
+    zatrdata = lazy_trdata_array(za_trainer_data_raw)
+    zatrdata["00_test_data"].poke_1.level = 99
+    dumped = zatrdata.model_dump(mode="json", by_alias=True, exclude_unset=True)
+    records = za_trainer_data_raw["values"]
+    assert dumped["values"][1:] == records[1:]
+    assert dumped["values"][0]["poke1"]["level"] == 99
+    assert zatrdata.values.materialized_count == 1  # type: ignore[attr-defined]
+
+
+def test_lazy_edits(za_trainer_data_raw: dict) -> None:
+    """Test list edits and the trainer index on lazy trainers."""
+    zatrdata = lazy_trdata_array(za_trainer_data_raw)
+    last = zatrdata.tr_ids[-1]
+    new = zatrdata[1].model_copy(update={"tr_id": "new_trainer"})
+    zatrdata.add_trainer(new, index=0)
+    assert zatrdata.values[0] is new
+    assert zatrdata.tr_ids[:2] == ["new_trainer", "00_test_data"]
+    assert zatrdata[last].tr_id == last
+    assert zatrdata.remove_trainer("00_test_data").tr_id == "00_test_data"
+    zatrdata.values[1:3] = zatrdata.values[2:0:-1]
+    dumped = zatrdata.model_dump(mode="json", by_alias=True, exclude_unset=True)
+    assert [t["trid"] for t in dumped["values"]] == zatrdata.tr_ids
+    # The new trainer, the last one and the two swapped ones
+    assert zatrdata.values.materialized_count == 4  # type: ignore[attr-defined]
+
+
+def test_lazy_untrusted(za_trainer_data_raw: dict) -> None:
+    """Test untrusted records are validated when accessed."""
+    data = copy.deepcopy(za_trainer_data_raw)
+    data["values"][1]["poke1"]["level"] = 500
+    zatrdata = lazy_trdata_array(data, trusted=False)
+    assert zatrdata[0].tr_id == "00_test_data"
+    with pytest.raises(pydantic.ValidationError):
+        zatrdata[1]
+
+
+def test_lazy_changes(za_trainer_data_raw: dict) -> None:
+    """Test modified, added and removed trainers are tracked until the next dump."""
+    zatrdata = lazy_trdata_array(za_trainer_data_raw)
+    # Accessing or setting the same value does not make a trainer dirty
+    zatrdata[3].poke_2.level = zatrdata[3].poke_2.level
+    assert not zatrdata.is_dirty and zatrdata.changes() == {}
+
+    zatrdata["00_test_data"].poke_1.level = 42
+    zatrdata[5].ai_high = not zatrdata[5].ai_high
+    assert zatrdata.is_dirty
+    assert zatrdata.changes() == {
+        "00_test_data": ["poke1.level"],
+        zatrdata.tr_ids[5]: ["aiHigh"],
+    }
+    assert zatrdata.values.mark_clean() == [0, 5]  # type: ignore[attr-defined]
+    assert not zatrdata.is_dirty
+
+    zatrdata.add_trainer(zatrdata[1].model_copy(update={"tr_id": "new_trainer"}))
+    assert list(zatrdata.changes()) == ["new_trainer"]
+    zatrdata.values.mark_clean()  # type: ignore[attr-defined]
+    zatrdata.remove_trainer(zatrdata.tr_ids[2])
+    assert zatrdata.is_dirty and zatrdata.changes() == {}
+
+
+def test_lazy_incremental_dump(za_trainer_data_raw: dict, artifacts_path: str) -> None:
+    """Test incremental dumps write the same data as a full dump."""
+    zatrdata = lazy_trdata_array(copy.deepcopy(za_trainer_data_raw))
+    eager = ZATrainerDataArray.model_validate(za_trainer_data_raw)
+    fname = os.path.join(artifacts_path, "trdata_lazy.json")
+    fname_eager = os.path.join(artifacts_path, "trdata_eager.json")
+    for level in (42, 43):
+        for data in (zatrdata, eager):
+            data["00_test_data"].poke_1.level = level
+            data[7].poke_3.waza_1.is_plus_waza = level == 42
+        zatrdata.dump(fname)
+        eager.dump(fname_eager)
+        assert not zatrdata.is_dirty
+        with open(fname, encoding="utf-8") as f, open(fname_eager) as f_eager:
+            assert json.load(f) == json.load(f_eager)
+    with open(fname, encoding="utf-8") as f:
+        assert ZATrainerDataArray.model_validate(json.load(f)) == eager
+
+
+def test_lazy_snapshot_commit(za_trainer_data_raw: dict) -> None:
+    """Test edits made after a snapshot stay dirty once it is committed."""
+    zatrdata = lazy_trdata_array(za_trainer_data_raw)
+    zatrdata["00_test_data"].poke_1.level = 42
+    zatrdata[5].ai_high = not zatrdata[5].ai_high
+    snapshot = zatrdata.snapshot()
+    assert snapshot.records[0]["poke1"]["level"] == 42
+    assert snapshot.records[1] is za_trainer_data_raw["values"][1]
+
+    # Edited while saving
+    zatrdata[5].money_rate = 7
+    json.loads(snapshot.to_json())
+    assert zatrdata.commit(snapshot)
+    assert list(zatrdata.changes()) == [zatrdata.tr_ids[5]]
+    assert zatrdata.changes()[zatrdata.tr_ids[5]] == ["moneyRate"]
+
+    # Positions no longer match: nothing is committed
+    snapshot = zatrdata.snapshot()
+    zatrdata.remove_trainer(zatrdata.tr_ids[2])
+    assert not zatrdata.commit(snapshot)
+    assert zatrdata.is_dirty
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -8,7 +8,6 @@ from unittest.mock import patch
 import pytest
 from loguru import logger
 
-from skypy import settings
 from skypy.schemas import ZATrainerDataArray
 
 
@@ -38,19 +37,16 @@ def test_trdata_save(
             json.load(open(f.name))
 
         logger.info(f"Temporary file: {f.name}")
-        # Dump the data
+        # Dump the data: the binary is encoded in-process, `flatc` is not needed
         with patch.object(subprocess, "run") as run:
             zatrdata.dump(f.name, create_binaries=True)
-            run.assert_called_once_with(
-                [
-                    "flatc",
-                    "-b",
-                    "-o",
-                    artifacts_path,
-                    settings.files.za_trainers_bfbs_file,
-                    f.name,
-                ]
-            )
+            run.assert_not_called()
+        fname_bin = f"{os.path.splitext(f.name)[0]}.bin"
+        assert os.path.exists(fname_bin)
+        assert ZATrainerDataArray.load_binary(fname_bin).values[0].tr_id == (
+            zatrdata.values[0].tr_id
+        )
+        os.remove(fname_bin)
 
         # Tests
         assert os.path.exists(f.name)
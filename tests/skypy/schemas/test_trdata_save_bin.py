@@ -13,6 +13,10 @@ def test_trdata_save_with_bfbs_file(
     zatrdata = ZATrainerDataArray(values=za_trainers)  # type: ignore
     fname = os.path.join(artifacts_path, "trdata_array.json")
     zatrdata.dump(fname, create_binaries=True)
+    loaded = ZATrainerDataArray.load_binary(
+        os.path.join(artifacts_path, "trdata_array.bin")
+    )
+    assert [t.tr_id for t in loaded.values] == [t.tr_id for t in zatrdata.values]
 
 
 if __name__ == "__main__":
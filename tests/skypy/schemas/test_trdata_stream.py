@@ -0,0 +1,82 @@
+import io
+import json
+import os
+
+import pytest
+
+from skypy.schemas import (
+    ZATrainerDataArray,
+    iter_trdata_array,
+    iter_trdata_records,
+    normalize_trdata_record,
+    trdata_array_from_fbs_json,
+)
+from skypy.za import load_trainer_data
+
+RAW_TRDATA = os.path.join("assets", "za", "Raw", "trdata_array.json")
+
+
+@pytest.mark.parametrize("chunk_size", [7, 1 << 16])
+def test_iter_trdata_records(za_trainer_data_raw: dict, chunk_size: int) -> None:
+    """Test records are streamed as `json.load` reads them, whatever the chunk size."""
+    text = json.dumps({"version": [1, {"a": 2}], **za_trainer_data_raw}, indent=2)
+    records = iter_trdata_records(io.StringIO(text), chunk_size=chunk_size)
+    assert list(records) == za_trainer_data_raw["values"]
+
+
+def test_iter_trdata_records_lazily() -> None:
+    """Test the first record is yielded before the rest of the file is read."""
+    with open(RAW_TRDATA, encoding="utf-8") as f:
+        records = iter_trdata_records(f, chunk_size=1024)
+        first = next(records)
+        assert first["trid"] == "00_test_data" and "poke1" in first
+        assert f.tell() < os.path.getsize(RAW_TRDATA) / 10
+
+
+def test_iter_trdata_array_raw(zatrdata: ZATrainerDataArray) -> None:
+    """Test the `flatc --json` layout and keys are read as the editor JSON."""
+    with open(RAW_TRDATA, encoding="utf-8") as f:
+        expected = trdata_array_from_fbs_json(json.load(f))
+    for trusted in (False, True):
+        trainers = list(iter_trdata_array(RAW_TRDATA, trusted=trusted))
+        assert trainers == expected.values
+    assert [t.tr_id for t in trainers] == zatrdata.tr_ids
+    # Editor keys under `Table`, as `model_dump_json(by_alias=True)` writes them
+    text = zatrdata.model_dump_json(by_alias=True, exclude_unset=True)
+    assert list(iter_trdata_array(io.StringIO(text))) == list(zatrdata.values)
+
+
+def test_load_trainer_data_raw() -> None:
+    """Test `load_trainer_data` reads the `flatc --json` layout too."""
+    trainers = load_trainer_data(
+        os.path.basename(RAW_TRDATA),
+        input_dir=os.path.dirname(RAW_TRDATA),
+        trusted=True,
+    )
+    with open(RAW_TRDATA, encoding="utf-8") as f:
+        assert trainers == trdata_array_from_fbs_json(json.load(f))
+
+
+def test_normalize_trdata_record(za_trainer_data_raw: dict) -> None:
+    """Test editor records are left as they are."""
+    record = za_trainer_data_raw["values"][0]
+    assert normalize_trdata_record(record) is record
+    raw = {"TrId": "x", "Poke1": {"DevId": 25, "TalentValue": {"HP": 31}}}
+    assert normalize_trdata_record(raw) == {
+        "trid": "x",
+        "poke1": {"devId": 25, "talentValue": {"hp": 31}},
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"other": []}', "{}", '{"values": [1]}', '{"values": [{}', "[]"],
+)
+def test_iter_trdata_records_invalid(text: str) -> None:
+    """Test invalid files raise, truncated ones included."""
+    with pytest.raises(ValueError):
+        list(iter_trdata_records(io.StringIO(text)))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
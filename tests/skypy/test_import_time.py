@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = (
+    "tkinter",
+    "customtkinter",
+    "polars",
+    "pyarrow",
+    "pandas",
+    "duckdb",
+    "openpyxl",
+    "pandastable",
+    "ndspy",
+)
+"""Modules that headless imports must not pull in."""
+
+IMPORT_BUDGET_S = 2.0
+"""Maximum cumulative import time of a headless module, generous for slow CI runners."""
+
+
+def _import_times(module: str) -> dict[str, float]:
+    """Cumulative import time of each module imported by `import <module>`, in seconds.
+
+    The import runs in a fresh interpreter with `-X importtime`.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+@pytest.mark.parametrize(
+    "module", ["skypy.schemas", "skypy.za.load", "skypy.za.search", "skypy.__main__"]
+)
+def test_import_time(module: str) -> None:
+    """Test headless imports stay lean, and within the import time budget."""
+    times = _import_times(module)
+    assert module in times
+    heavy = sorted(name for name in times if name.split(".")[0] in HEAVY_MODULES)
+    assert not heavy, f"`import {module}` imports {heavy}"
+    assert times[module] < IMPORT_BUDGET_S, f"{module}: {times[module]:.2f}s"
+
+
+def test_import_gui_on_access() -> None:
+    """Test GUI names of `skypy.za` are still importable, on first access."""
+    times = _import_times("skypy.za")
+    assert "customtkinter" not in times
+    from skypy.za import ZATrainerEditor
+
+    assert ZATrainerEditor.__module__ == "skypy.za.trainer_editor"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
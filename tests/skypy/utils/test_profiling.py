@@ -0,0 +1,40 @@
+import json
+import os
+import time
+
+import pytest
+
+from skypy.utils.profiling import StartupProfiler
+
+
+def test_startup_profiler(artifacts_path: str) -> None:
+    """Test stages are profiled separately, and reported as HTML and JSON."""
+    profiler = StartupProfiler()
+    with profiler.stage("first"):
+        time.sleep(0.01)
+    with profiler.stage("second"):
+        sum(range(10_000))
+    assert list(profiler.sessions) == ["first", "second"]
+    assert profiler.durations["first"] >= 0.01
+
+    output_dir = os.path.join(artifacts_path, "profile_test")
+    paths = profiler.write(output_dir)
+    assert len(paths) == 5 and all(os.path.isfile(path) for path in paths)
+    with open(os.path.join(output_dir, "profile_first.json"), encoding="utf-8") as f:
+        assert json.load(f)["duration"] > 0
+    with open(os.path.join(output_dir, "profile_summary.json"), encoding="utf-8") as f:
+        assert set(json.load(f)["durations"]) == {"first", "second"}
+
+
+def test_startup_profiler_disabled(artifacts_path: str) -> None:
+    """Test a disabled profiler only records durations, and writes nothing."""
+    profiler = StartupProfiler(enabled=False)
+    with profiler.stage("first"):
+        pass
+    assert not profiler.sessions and "first" in profiler.durations
+    assert profiler.write(os.path.join(artifacts_path, "profile_disabled")) == []
+    assert not os.path.exists(os.path.join(artifacts_path, "profile_disabled"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
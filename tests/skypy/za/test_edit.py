@@ -0,0 +1,139 @@
+import fnmatch
+
+import pytest
+
+from skypy.schemas import ZATrainerDataArray
+from skypy.za import (
+    TrainerSelector,
+    edit_trdata_array,
+    parse_assignment,
+    parse_level_range,
+)
+
+
+def test_parse_assignment() -> None:
+    """Test operators, booleans, numbers and names are parsed."""
+    assert parse_assignment("level *= 1.2")[:3] == ("level", "*=", 1.2)
+    assert parse_assignment("ai_expert=true")[:3] == ("ai_expert", "=", True)
+    assert parse_assignment("dev_id=Pikachu").value == 25
+    assert parse_assignment("dev_id=DEV_PIKATYUU").value == 25
+    assert parse_assignment("waza_id=Thunderbolt").value > 0
+    for text in (
+        "level",
+        "foo=1",
+        "poke_1=1",
+        "talent=1",
+        "level=200",
+        "dev_id=Foo",
+        "level/=0",
+        "level/=0.0",
+        "ball_id+=1",
+        "seikaku+=1000",
+        "ai_expert*=2",
+    ):
+        with pytest.raises(ValueError):
+            parse_assignment(text)
+
+
+def test_parse_level_range() -> None:
+    """Test level ranges, with optional bounds."""
+    assert parse_level_range("10:20") == (10, 20)
+    assert parse_level_range("50:") == (50, None)
+    assert parse_level_range(":5") == (None, 5)
+    assert parse_level_range("7") == (7, 7)
+    with pytest.raises(ValueError):
+        parse_level_range("a:b")
+
+
+def test_edit_trdata_array(zatrdata: ZATrainerDataArray) -> None:
+    """Test assignments only change the selected trainers and Pokémon."""
+    selector = TrainerSelector(tr_ids=("ev_m02_*",), level=(8, None))
+    assignments = [
+        parse_assignment("level*=20"),
+        parse_assignment("ai_expert=false"),
+        parse_assignment("item=Leftovers"),
+    ]
+    result = edit_trdata_array(zatrdata, selector, assignments)
+    assert result.trainers > 0 and result.pokemon > 0
+    assert result.changed["level*=20"] > 0
+
+    leftovers = assignments[2].value
+    selected = 0
+    for before, after in zip(zatrdata.values, result.zatrdata.values):
+        pokemon = [
+            (getattr(before, f"poke_{i}"), getattr(after, f"poke_{i}"))
+            for i in range(1, 7)
+        ]
+        matched = [p.dev_id != 0 and p.level >= 8 for p, _ in pokemon]
+        if not before.tr_id.lower().startswith("ev_m02_") or not any(matched):
+            assert after == before
+            continue
+        selected += 1
+        assert not after.ai_expert
+        for (old, new), match in zip(pokemon, matched):
+            if match:
+                # Clipped to the level bound
+                assert new.level == 100 and new.item == leftovers
+            else:
+                assert new == old
+    assert selected == result.trainers
+    # The input is left untouched
+    assert result.zatrdata is not zatrdata
+
+
+@pytest.mark.parametrize("glob", ["*_boss_*", "ev_m0[2-3]_*", "00_test_dat?", "*"])
+def test_edit_trdata_array_glob(zatrdata: ZATrainerDataArray, glob: str) -> None:
+    """Test trainer ID globs match as `fnmatch` does, case-insensitive."""
+    result = edit_trdata_array(
+        zatrdata, TrainerSelector(tr_ids=(glob,)), [parse_assignment("ai_item=true")]
+    )
+    expected = [
+        t.tr_id for t in zatrdata.values if fnmatch.fnmatch(t.tr_id.lower(), glob)
+    ]
+    assert expected and result.trainers == len(expected)
+
+
+def test_edit_trdata_array_rank(zatrdata: ZATrainerDataArray) -> None:
+    """Test trainer selection by rank, and unset fields starting from their default."""
+    rank = zatrdata.values[0].za_rank
+    result = edit_trdata_array(
+        zatrdata,
+        TrainerSelector(ranks=(rank,)),
+        [parse_assignment("money_rate+=1")],
+    )
+    expected = [t.tr_id for t in zatrdata.values if t.za_rank == rank]
+    assert result.trainers == len(expected)
+    for before, after in zip(zatrdata.values, result.zatrdata.values):
+        if before.tr_id in expected:
+            assert after.money_rate == min(before.money_rate + 1, 20)
+        else:
+            assert after.money_rate == before.money_rate
+
+
+def test_edit_trdata_array_moves(zatrdata: ZATrainerDataArray) -> None:
+    """Test move fields are edited on the selected Pokémon only."""
+    species = zatrdata.values[0].poke_1.dev_id
+    result = edit_trdata_array(
+        zatrdata,
+        TrainerSelector(species=(species,)),
+        [parse_assignment("is_plus_waza=true")],
+    )
+    for before, after in zip(zatrdata.values, result.zatrdata.values):
+        for i in range(1, 7):
+            old, new = getattr(before, f"poke_{i}"), getattr(after, f"poke_{i}")
+            plus = {getattr(new, f"waza_{k}").is_plus_waza for k in range(1, 5)}
+            if old.dev_id == species:
+                assert plus == {True}
+            else:
+                assert new == old
+
+
+@pytest.mark.parametrize("text", ["level*=inf", "level+=-inf", "level*=nan"])
+def test_edit_trdata_array_non_finite(zatrdata: ZATrainerDataArray, text: str) -> None:
+    """Test non-finite results are rejected, rather than clipped to the bounds."""
+    with pytest.raises(ValueError, match="not finite"):
+        edit_trdata_array(zatrdata, TrainerSelector(), [parse_assignment(text)])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
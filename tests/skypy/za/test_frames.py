@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+import customtkinter as ctk
+import pytest
+
+from skypy.schemas import ZAPokemonData
+from skypy.za import PkmnSlot
+
+
+def test_pkmn_slot_builds_on_expand() -> None:
+    """Test a slot builds its widgets once, on first expand, and reuses them."""
+    content = MagicMock()
+    build = MagicMock(return_value=content)
+    header = MagicMock(spec=ctk.CTkButton)
+    slot = PkmnSlot(
+        index=1,
+        frame=MagicMock(spec=ctk.CTkFrame),
+        header=header,
+        pokemon_ref=ZAPokemonData(),
+        build=build,
+    )
+    header.configure.assert_any_call(command=slot.toggle)
+    assert "(empty)" in header.configure.call_args.kwargs["text"]
+
+    # Updating a collapsed slot builds nothing
+    pikachu = ZAPokemonData(dev_id=25, level=50)
+    slot.update_pokemon_data(pikachu)
+    build.assert_not_called()
+    assert "Pikachu" in header.configure.call_args.kwargs["text"]
+
+    slot.toggle()
+    build.assert_called_once_with(slot.frame, pikachu)
+    assert slot.expanded and slot.is_built
+    content.frame.pack.assert_called_once()
+
+    slot.toggle()
+    content.frame.pack_forget.assert_called_once()
+    slot.toggle()
+    build.assert_called_once()
+
+    # Built slots are reused for the next trainer
+    bulbasaur = ZAPokemonData(dev_id=1)
+    slot.update_pokemon_data(bulbasaur)
+    content.update_pokemon_data.assert_called_once_with(bulbasaur)
+    assert slot.fields is content
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -0,0 +1,72 @@
+import polars as pl
+import pytest
+
+from skypy.schemas import ZATrainerDataArray, load_personal_array
+from skypy.za import IllegalMove, LegalMoves, find_illegal_moves, load_legal_moves
+
+
+@pytest.fixture
+def legal() -> LegalMoves:
+    """Index of the legal moves of the personal table."""
+    return load_legal_moves()
+
+
+def test_from_learnset() -> None:
+    """Test moves are indexed by species form, as bitsets."""
+    learnset = pl.DataFrame(
+        {
+            "dev_id": [1, 1, 1, 2],
+            "form_id": [0, 0, 1, 0],
+            "waza_id": [33, 45, 33, 33],
+            "source": ["level_up", "machine", "machine", "egg"],
+        }
+    )
+    legal = LegalMoves.from_learnset(learnset)
+    assert len(legal) == 3 and (1, 1) in legal
+    assert legal.bitset(1, 0) == 1 << 33 | 1 << 45
+    assert legal.moves(1, 0) == [33, 45]
+    assert legal.moves(1, 1) == [33]
+    assert legal.is_legal(1, 0, 45) and not legal.is_legal(1, 1, 45)
+    # Missing forms fall back to the base form
+    assert legal.is_legal(2, 3, 33) and not legal.is_legal(2, 3, 45)
+    # Unknown species are not checked, the empty move is always legal
+    assert legal.is_legal(99, 0, 45) and legal.moves(99) == []
+    assert legal.is_legal(1, 1, 0)
+
+
+def test_load_legal_moves(legal: LegalMoves) -> None:
+    """Test the index matches the learnset of the personal table, and is cached."""
+    assert load_legal_moves() is legal
+    learnset = load_personal_array().learnset
+    bulbasaur = learnset.filter((pl.col("dev_id") == 1) & (pl.col("form_id") == 0))
+    assert legal.moves(1) == sorted(bulbasaur.get_column("waza_id").unique())
+    assert legal.is_legal(1, 0, 33)  # Tackle
+    assert not legal.is_legal(1, 0, 85)  # Thunderbolt
+
+
+def test_find_illegal_moves(zatrdata: ZATrainerDataArray, legal: LegalMoves) -> None:
+    """Test illegal moves are reported with their trainer, Pokémon and move slots."""
+    assert find_illegal_moves(zatrdata, legal) == []
+    trainer = next(t for t in zatrdata.values if t.poke_2.dev_id)
+    pokemon = trainer.poke_2
+    waza_id = next(
+        w
+        for w in range(1, 900)
+        if not legal.is_legal(pokemon.dev_id, pokemon.form_id, w)
+    )
+    pokemon.waza_3.waza_id = waza_id
+    assert legal.illegal_moves(pokemon) == [3]
+    assert find_illegal_moves(zatrdata, legal) == [
+        IllegalMove(
+            tr_id=trainer.tr_id,
+            slot=2,
+            waza_slot=3,
+            dev_id=pokemon.dev_id,
+            form_id=pokemon.form_id,
+            waza_id=waza_id,
+        )
+    ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
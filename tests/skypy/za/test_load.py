@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from skypy.schemas import ZATrainerDataArray
+from skypy.za import load_trainer_data
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_load_trainer_data(
+    artifacts_path: str,
+    zatrdata: ZATrainerDataArray,
+    trusted: bool,
+    lazy: bool,
+) -> None:
+    """Test `load_trainer_data` with and without validation, from JSON and binary."""
+    zatrdata.dump(
+        os.path.join(artifacts_path, "trdata_load.json"), create_binaries=True
+    )
+    for file_name in ("trdata_load.json", "trdata_load.bin"):
+        trainers = load_trainer_data(
+            file_name,
+            input_dir=artifacts_path,
+            trusted=trusted,
+            background_validation=trusted,
+            lazy=lazy,
+        )
+        assert [t.tr_id for t in trainers.values] == [t.tr_id for t in zatrdata.values]
+    assert (
+        trainers["00_test_data"].poke_1.level == zatrdata["00_test_data"].poke_1.level
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -0,0 +1,83 @@
+import os
+
+import pytest
+import toml
+import yaml
+
+from skypy.schemas import ZATrainerDataArray
+from skypy.za import apply_trdata_mod, load_mod_recipe, parse_mod_recipe
+
+RECIPE = {
+    "name": "hard mode",
+    "rules": [
+        {
+            "name": "stronger ev_m02",
+            "trainers": "ev_m02_*",
+            "level": "8:",
+            "set": ["level+=10", "ai_expert=true"],
+        },
+        {
+            "name": "leftovers",
+            "trainers": ["ev_m02_*"],
+            "level": [15, None],
+            "slots": [1, 2],
+            "set": {"item": "Leftovers"},
+        },
+    ],
+}
+
+
+def test_parse_mod_recipe() -> None:
+    """Test rules are parsed, and invalid rules are reported by name."""
+    recipe = parse_mod_recipe(RECIPE)
+    assert recipe.name == "hard mode"
+    first, second = recipe.rules
+    assert first.selector.tr_ids == ("ev_m02_*",)
+    assert first.selector.level == (8, None)
+    assert [a.text for a in first.assignments] == ["level+=10", "ai_expert=true"]
+    assert second.selector.level == (15, None) and second.selector.slots == (1, 2)
+    assert second.assignments[0].field == "item"
+
+    with pytest.raises(ValueError, match="rules"):
+        parse_mod_recipe({"name": "empty"})
+    with pytest.raises(ValueError, match="bad rule"):
+        parse_mod_recipe({"rules": [{"name": "bad rule", "set": "foo=1"}]})
+    with pytest.raises(ValueError, match="unknown key"):
+        parse_mod_recipe({"rules": [{"set": "level=1", "trainer": "x"}]})
+    with pytest.raises(ValueError, match="nothing"):
+        parse_mod_recipe({"rules": [{"trainers": "x"}]})
+
+
+@pytest.mark.parametrize("ext", ["yaml", "toml"])
+def test_load_mod_recipe(artifacts_path: str, ext: str) -> None:
+    """Test YAML and TOML recipes load the same."""
+    # TOML has no null: use the string form of the level range
+    data = {**RECIPE, "rules": [RECIPE["rules"][0]]}
+    path = os.path.join(artifacts_path, f"recipe.{ext}")
+    with open(path, "w", encoding="utf-8") as f:
+        (yaml.safe_dump if ext == "yaml" else toml.dump)(data, f)
+    assert load_mod_recipe(path) == parse_mod_recipe(data)
+    with pytest.raises(ValueError, match="Unsupported"):
+        load_mod_recipe(os.path.join(artifacts_path, "recipe.json"))
+
+
+def test_apply_trdata_mod(zatrdata: ZATrainerDataArray) -> None:
+    """Test rules apply in order, each on the output of the previous ones."""
+    report = apply_trdata_mod(zatrdata, parse_mod_recipe(RECIPE))
+    first, second = report.rules
+    assert first.trainers > 0 and first.changed["level+=10"] == first.pokemon
+    # Levels 8 and 9 reach the second rule's range once the first rule applied
+    assert second.pokemon > 0 and second.seconds >= 0
+    assert "leftovers" in report.summary()
+    leftovers = parse_mod_recipe(RECIPE).rules[1].assignments[0].value
+    for before, after in zip(zatrdata.values, report.zatrdata.values):
+        if not before.tr_id.lower().startswith("ev_m02_"):
+            assert after == before
+            continue
+        if before.poke_1.dev_id and before.poke_1.level >= 8:
+            assert after.poke_1.level == before.poke_1.level + 10
+            assert after.poke_1.item == leftovers
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -0,0 +1,73 @@
+import duckdb
+import polars as pl
+import pytest
+
+from skypy import settings
+from skypy.schemas import ZATrainerDataArray
+from skypy.za import RAW_VIEWS, TRAINER_VIEWS, connect, query
+
+
+def test_connect(zatrdata: ZATrainerDataArray) -> None:
+    """Test the trainer data and the game data are registered as views."""
+    con = connect(zatrdata)
+    tables = set(con.sql("SHOW TABLES").pl().get_column("name"))
+    assert tables == {*TRAINER_VIEWS, *RAW_VIEWS}
+    # Empty Pokémon and moves are left out
+    n_pokemon, n_moves = con.sql(
+        "SELECT (SELECT count(*) FROM pokemon), (SELECT count(*) FROM moves)"
+    ).fetchone()  # type: ignore
+    trainers = zatrdata.values
+    assert n_pokemon == sum(
+        bool(getattr(t, f"poke_{i}").dev_id) for t in trainers for i in range(1, 7)
+    )
+    assert 0 < n_moves <= 4 * n_pokemon
+    con.close()
+
+    con = connect(raw=False)
+    assert con.sql("SHOW TABLES").fetchall() == []
+    con.close()
+
+
+def test_query(zatrdata: ZATrainerDataArray) -> None:
+    """Test queries join the trainer data with the game data."""
+    trainer = next(t for t in zatrdata.values if t.poke_1.waza_1.waza_id)
+    levels = query(
+        "SELECT slot, level FROM pokemon WHERE tr_id = ? ORDER BY slot",
+        zatrdata,
+        raw=False,
+        params=[trainer.tr_id],
+    )
+    assert levels.row(0) == (1, trainer.poke_1.level)
+
+    # Trainers using a move, by name
+    name = settings.za_waza_names.to_label(trainer.poke_1.waza_1.waza_id)
+    users = query(
+        "SELECT DISTINCT tr_id FROM moves JOIN waza_names ON waza_id = id "
+        "WHERE name = $name",
+        zatrdata,
+        params={"name": name},
+    )
+    assert trainer.tr_id in users.get_column("tr_id").to_list()
+
+    ranks = query(
+        "SELECT za_rank, avg(level) AS level FROM trainers JOIN pokemon "
+        "USING (trainer_idx) GROUP BY za_rank ORDER BY za_rank",
+        zatrdata,
+    )
+    assert ranks.columns == ["za_rank", "level"] and ranks.height > 1
+
+    # Nested columns of the game data are structs
+    atk = query("SELECT base.ATK FROM species WHERE dev_id = 1 AND form_id = 0")
+    assert atk.item() == 49
+    assert query("SET threads = 1").is_empty()
+    assert isinstance(query("SELECT 1"), pl.DataFrame)
+
+
+def test_query_invalid() -> None:
+    """Test invalid queries raise DuckDB errors."""
+    with pytest.raises(duckdb.Error):
+        query("SELECT * FROM trainers")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
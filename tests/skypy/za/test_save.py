@@ -0,0 +1,78 @@
+import json
+import os
+import threading
+import typing as ty
+
+import pytest
+
+from skypy.schemas import ZATrainerDataArray, lazy_trdata_array
+from skypy.za import SaveEvent, SaveJob, SaveWorker, save_snapshot
+
+
+def _events(worker: SaveWorker) -> list[SaveEvent]:
+    """Drain the events of a worker."""
+    events = []
+    while not worker.events.empty():
+        events.append(worker.events.get_nowait())
+    return events
+
+
+def test_save_snapshot(za_trainer_data_raw: dict, artifacts_path: str) -> None:
+    """Test a snapshot is written as JSON and binary."""
+    zatrdata = lazy_trdata_array(za_trainer_data_raw)
+    zatrdata["00_test_data"].poke_1.level = 42
+    path = os.path.join(artifacts_path, "trdata_snapshot.json")
+    messages: list[str] = []
+    save_snapshot(SaveJob(zatrdata.snapshot(), path), messages.append)
+    assert len(messages) == 2
+    with open(path, encoding="utf-8") as f:
+        assert ZATrainerDataArray.model_validate(json.load(f)) == zatrdata
+    binary = ZATrainerDataArray.load_binary(f"{os.path.splitext(path)[0]}.bin")
+    assert binary["00_test_data"].poke_1.level == 42
+
+
+def test_save_worker_coalesces(za_trainer_data_raw: dict) -> None:
+    """Test jobs submitted while saving are coalesced, and run in the background."""
+    started, release = threading.Event(), threading.Event()
+    saved: list[SaveJob] = []
+
+    def _save(job: SaveJob, progress: ty.Callable[[str], None]) -> None:
+        """Save, blocking until released."""
+        progress("saving")
+        started.set()
+        assert release.wait(10)
+        saved.append(job)
+
+    zatrdata = lazy_trdata_array(za_trainer_data_raw)
+    worker = SaveWorker(save=_save)
+    jobs = [SaveJob(zatrdata.snapshot(), f"trdata_{i}.json") for i in range(4)]
+    assert not worker.submit(jobs[0])
+    assert started.wait(10) and worker.busy
+    assert not worker.submit(jobs[1])
+    assert worker.submit(jobs[2])
+    assert worker.submit(jobs[3])
+    release.set()
+    assert worker.join(10) and not worker.busy
+    assert saved == [jobs[0], jobs[3]]
+    events = _events(worker)
+    assert [e.kind for e in events] == ["progress", "done"] * 2
+    assert [e.job for e in events if e.kind == "done"] == saved
+
+
+def test_save_worker_error(za_trainer_data_raw: dict) -> None:
+    """Test a failed save is reported as an event."""
+
+    def _save(job: SaveJob, progress: ty.Callable[[str], None]) -> None:
+        """Fail."""
+        raise OSError("disk full")
+
+    worker = SaveWorker(save=_save)
+    worker.submit(SaveJob(lazy_trdata_array(za_trainer_data_raw).snapshot(), "x"))
+    assert worker.join(10)
+    (event,) = _events(worker)
+    assert event.kind == "error" and isinstance(event.error, OSError)
+    assert event.message == "disk full"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
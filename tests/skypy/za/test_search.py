@@ -0,0 +1,97 @@
+import pytest
+
+from skypy import settings
+from skypy.schemas import ZATrainerDataArray, lazy_trdata_array
+from skypy.za import OptionList, TrainerSearchIndex
+
+
+def test_search_index(za_trainer_data_raw: dict, zatrdata: ZATrainerDataArray) -> None:
+    """Test lazy and eager data are indexed the same, without materializing."""
+    lazy = lazy_trdata_array(za_trainer_data_raw)
+    index = TrainerSearchIndex(lazy)
+    assert lazy.values.materialized_count == 0  # type: ignore[attr-defined]
+    assert index.entries == TrainerSearchIndex(zatrdata).entries
+    assert index.search("") == lazy.tr_ids
+    assert index.search("", limit=3) == lazy.tr_ids[:3]
+
+
+def test_search_ranking(zatrdata: ZATrainerDataArray) -> None:
+    """Test prefix, substring, term and fuzzy matches, best first."""
+    index = TrainerSearchIndex(zatrdata)
+    # Prefix matches come first, fuzzy matches (e.g. "Ev_m03_0125") after
+    results = index.search("ev_m02")
+    prefixed = [trid.lower().startswith("ev_m02") for trid in results]
+    assert prefixed[0] and prefixed == sorted(prefixed, reverse=True)
+    assert not all(prefixed)
+
+    # Species and held items
+    trainer = next(
+        t
+        for t in zatrdata.values
+        if t.poke_1.dev_id and 0 < t.poke_1.item < len(settings.za_items_table)
+    )
+    species, item = trainer.poke_1.dev_id_english, trainer.poke_1.item_english
+    assert trainer.tr_id in index.search(species.upper())
+    assert trainer.tr_id in index.search(f"{species} {item}")
+
+    # Fuzzy: characters of the ID in order
+    fuzzy = trainer.tr_id.replace("_", "")[:6]
+    assert trainer.tr_id in index.search(fuzzy)
+
+    # Substring matches rank before fuzzy matches
+    results = index.search("hono")
+    substring = ["hono" in trid.lower() for trid in results]
+    assert substring[0] and substring == sorted(substring, reverse=True)
+    assert index.search("zzzzzzzz") == []
+
+
+def test_search_incremental_and_sync(za_trainer_data_raw: dict) -> None:
+    """Test narrowing queries reuse previous results, and edits are picked up."""
+    lazy = lazy_trdata_array(za_trainer_data_raw)
+    index = TrainerSearchIndex(lazy)
+    full = index.search("m0")
+    narrowed = index.search("m02")
+    assert set(narrowed) <= set(full)
+    assert narrowed == TrainerSearchIndex(lazy).search("m02")
+
+    lazy[5].tr_id = "renamed_trainer"
+    assert index.search("renamed") == []
+    index.sync()
+    assert index.search("renamed") == ["renamed_trainer"]
+    assert index.label("renamed_trainer").startswith("renamed_trainer")
+
+    # Edits saved before the next sync are picked up too
+    lazy[6].tr_id = "saved_trainer"
+    lazy.commit(lazy.snapshot())
+    assert not lazy.is_dirty
+    index.sync()
+    assert index.search("saved_trainer") == ["saved_trainer"]
+
+
+def test_option_list_filter() -> None:
+    """Test values are filtered case-insensitively, prefix matches first."""
+    options = OptionList(["Pikachu", "Raichu", "Pichu", "Pikachu", "Charizard"])
+    assert options.values == ("Pikachu", "Raichu", "Pichu", "Charizard")
+    assert len(options) == 4 and "Pichu" in options
+    assert options.filter("") == list(options.values)
+    assert options.filter("PI") == ["Pikachu", "Pichu"]
+    # Prefix matches first, then substrings, each in display order
+    assert options.filter("chu") == ["Pikachu", "Raichu", "Pichu"]
+    assert options.filter("ichu") == ["Raichu", "Pichu"]
+    # Narrowing the query only filters the previous matches, widening it does not
+    assert options.filter("ch") == ["Charizard", "Pikachu", "Raichu", "Pichu"]
+    assert options.filter("xyz") == []
+
+
+def test_option_list_species() -> None:
+    """Test filtering the species table."""
+    species = sorted(settings.za_species_names.labels)
+    options = OptionList(species)
+    assert len(options) <= len(species)
+    results = options.filter("pika")
+    assert results and all("pika" in name.lower() for name in results)
+    assert options.filter("pikac") == [n for n in results if "pikac" in n.lower()]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -8,10 +8,11 @@ from skypy.za import create_trdata_mod
 
 def test_trainer_data_editor(zatrdata: ZATrainerDataArray, artifacts_path: str) -> None:
     """Test we can edit the trainer data."""
-    create_trdata_mod(
+    report = create_trdata_mod(
         zatrdata,
         path=os.path.join(artifacts_path, "trdata_array.json"),
     )
+    assert report.zatrdata.get_trainer("00_test_data").poke_1.level == 100
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+import polars as pl
+import pytest
+
+from skypy.schemas import ZAPokemonData, ZATrainerData, ZATrainerDataArray, ZAWazaData
+from skypy.za import (
+    TrainerSelector,
+    apply_assignments,
+    field_default,
+    from_frames,
+    parse_assignment,
+    to_frames,
+    with_defaults,
+)
+
+
+def test_frames_round_trip(zatrdata: ZATrainerDataArray) -> None:
+    """Test the tables convert back to the same trainer data, edits included."""
+    frames = to_frames(zatrdata)
+    assert set(frames) == {ZATrainerData, ZAPokemonData, ZAWazaData}
+    assert frames[ZATrainerData].height == len(zatrdata.values)
+    assert from_frames(frames).values[:10] == zatrdata.values[:10]
+
+    selector = TrainerSelector(tr_ids=(zatrdata.values[0].tr_id,))
+    trainers, _, changed = apply_assignments(
+        frames, selector, [parse_assignment("ai_expert=true")]
+    )
+    assert trainers == 1 and "_selected" in frames[ZATrainerData].columns
+    edited = from_frames(frames)
+    assert edited.values[0].ai_expert and edited.values[1:10] == zatrdata.values[1:10]
+
+
+def test_with_defaults(zatrdata: ZATrainerDataArray) -> None:
+    """Test unset fields hold their default, and integers are `Int64`."""
+    pokemon = to_frames(zatrdata)[ZAPokemonData]
+    filled = with_defaults(pokemon, ZAPokemonData)
+    assert filled["level"].null_count() == 0 and filled["level"].dtype == pl.Int64
+    default = field_default(ZAPokemonData, "level")
+    unset = pokemon["level"].is_null()
+    assert (filled.filter(unset)["level"] == default).all()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
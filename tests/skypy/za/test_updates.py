@@ -0,0 +1,109 @@
+import typing as ty
+
+import pytest
+
+from skypy.schemas import ZATrainerDataArray, lazy_trdata_array
+from skypy.za import UpdateDispatcher
+
+
+class FakeScheduler:
+    """Stand-in for Tk's `after()`/`after_cancel()`."""
+
+    def __init__(self) -> None:
+        """Init."""
+        self.jobs: dict[str, ty.Callable[[], None]] = {}
+        self.count = 0
+
+    def after(self, ms: int, func: ty.Callable[[], None]) -> str:
+        """Schedule a call."""
+        self.count += 1
+        job = f"after#{self.count}"
+        self.jobs[job] = func
+        return job
+
+    def after_cancel(self, job: str) -> None:
+        """Cancel a call."""
+        self.jobs.pop(job, None)
+
+    def run(self) -> None:
+        """Run the scheduled calls."""
+        jobs, self.jobs = self.jobs, {}
+        for func in jobs.values():
+            func()
+
+
+@pytest.fixture
+def zatrdata_lazy(za_trainer_data_raw: dict) -> ZATrainerDataArray:
+    """Lazy trainer data."""
+    return lazy_trdata_array(za_trainer_data_raw)
+
+
+def test_updates_debounced(zatrdata_lazy: ZATrainerDataArray) -> None:
+    """Test typed values are coalesced, and applied once the delay elapsed."""
+    scheduler = FakeScheduler()
+    updates = UpdateDispatcher(scheduler.after, scheduler.after_cancel)
+    trainer = zatrdata_lazy[0]
+    for text in ("4", "42"):
+        updates.push(trainer.poke_1, "level", text, int)
+    updates.push(trainer, "money_rate", "7", int)
+    updates.push(trainer, "view_range", "", float)
+    assert updates.pending_count == 4 - 1
+    assert len(scheduler.jobs) == 1
+    assert trainer.poke_1.level != 42
+
+    scheduler.run()
+    assert updates.pending_count == 0
+    assert trainer.poke_1.level == 42 and trainer.money_rate == 7
+    assert zatrdata_lazy.changes() == {"00_test_data": ["moneyRate", "poke1.level"]}
+
+
+def test_updates_suppressed(zatrdata_lazy: ZATrainerDataArray) -> None:
+    """Test updates are ignored while suppressed, and no-op writes are skipped."""
+    scheduler = FakeScheduler()
+    updates = UpdateDispatcher(scheduler.after, scheduler.after_cancel)
+    trainer = zatrdata_lazy[0]
+    updates.push(trainer.poke_1, "level", "42", int)
+    with updates.suppressed():
+        # Pending updates were applied first
+        assert trainer.poke_1.level == 42
+        updates.push(trainer, "money_rate", "7", int)
+        assert updates.is_suppressed and updates.pending_count == 0
+    assert not scheduler.jobs
+
+    updates.push(trainer, "ai_high", trainer.ai_high, bool, debounce=False)
+    assert updates.flush() == 0
+    assert "aiHigh" not in zatrdata_lazy.changes()["00_test_data"]
+
+
+def test_updates_invalid(zatrdata_lazy: ZATrainerDataArray) -> None:
+    """Test invalid values of a batch are skipped, and valid ones are applied."""
+    scheduler = FakeScheduler()
+    updates = UpdateDispatcher(scheduler.after, scheduler.after_cancel)
+    pokemon = zatrdata_lazy[0].poke_1
+    updates.push(pokemon, "level", "1000", int)
+    updates.push(pokemon, "scale_value", "12", int)
+    assert updates.flush() == 1
+    assert pokemon.scale_value == 12 and pokemon.level != 1000
+
+
+def test_updates_on_apply(zatrdata_lazy: ZATrainerDataArray) -> None:
+    """Test `on_apply` is called after each batch that changed a field."""
+    scheduler = FakeScheduler()
+    applied: list[int] = []
+    updates = UpdateDispatcher(
+        scheduler.after, scheduler.after_cancel, on_apply=applied.append
+    )
+    trainer = zatrdata_lazy[0]
+    updates.push(trainer.poke_1, "level", "42", int)
+    updates.push(trainer, "money_rate", "7", int)
+    assert applied == []
+    scheduler.run()
+    assert applied == [2]
+    # No-op and invalid updates change nothing
+    updates.push(trainer.poke_1, "level", "42", int, debounce=False)
+    updates.push(trainer.poke_1, "level", "", int, debounce=False)
+    assert applied == [2]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
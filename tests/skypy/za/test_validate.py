@@ -0,0 +1,133 @@
+import json
+import os
+
+import pytest
+
+from skypy import settings
+from skypy.schemas import ZATrainerDataArray, load_personal_array
+from skypy.za import (
+    SCHEMA_RULE,
+    VALIDATION_RULES,
+    LegalMoves,
+    find_illegal_moves,
+    load_legal_moves,
+    validate_trdata_array,
+    validate_trdata_file,
+)
+
+# Items of `item_data.json`: a mega stone (Gengarite), an item that cannot be held
+GENGARITE = 656
+CAN_NOT_HOLD = 2619
+
+
+def test_validate_trdata_array(zatrdata: ZATrainerDataArray) -> None:
+    """Test the game data only has the expected issues, and is checked quickly."""
+    report = validate_trdata_array(zatrdata)
+    assert set(report.counts) == set(VALIDATION_RULES)
+    assert report.pokemon > 1000
+    assert report.counts["legal_moves"] == 0 and report.counts["species"] == 0
+    assert report.errors == report.counts["duplicate_moves"]
+    assert report.warnings == report.counts["mega_evolution"]
+    assert report.seconds < 5
+    json.dumps(report.to_dict())
+
+
+def test_validate_trdata_array_issues(zatrdata: ZATrainerDataArray) -> None:
+    """Test each rule reports the Pokémon and moves breaking it."""
+    legal: LegalMoves = load_legal_moves()
+    trainer = next(
+        t
+        for t in zatrdata.values
+        if t.poke_1.dev_id
+        and t.poke_2.dev_id
+        and t.poke_3.dev_id
+        and not t.meg_evolution
+    )
+    first, second = trainer.poke_1, trainer.poke_2
+    with pytest.raises(KeyError):
+        load_personal_array().get_species(second.dev_id, 9)
+    illegal = next(
+        w for w in range(1, 900) if not legal.is_legal(first.dev_id, first.form_id, w)
+    )
+    first.waza_1.waza_id = illegal
+    first.waza_2.waza_id = first.waza_3.waza_id = legal.moves(
+        first.dev_id, first.form_id
+    )[0]
+    # Each holder of a mega stone is reported
+    first.item = trainer.poke_3.item = GENGARITE
+    # Out of range values, as loaded from a trusted file without validation
+    trainer.poke_2 = second.model_copy(
+        update={"form_id": 9, "item": CAN_NOT_HOLD, "ball_id": 1}
+    )
+
+    report = validate_trdata_array(zatrdata)
+    found = {
+        (issue.rule, issue.slot, issue.waza_slot)
+        for issue in report.issues
+        if issue.tr_id == trainer.tr_id
+    }
+    assert found == {
+        ("legal_moves", 1, 1),
+        ("duplicate_moves", 1, 3),
+        ("mega_stone", 1, None),
+        ("mega_stone", 3, None),
+        ("species", 2, None),
+        ("held_item", 2, None),
+        ("ball_id", 2, None),
+    }
+    # Same moves as the index of legal moves
+    assert report.counts["legal_moves"] == len(find_illegal_moves(zatrdata, legal))
+
+    trainer.meg_evolution = True
+    first.item = trainer.poke_3.item = 0
+    report = validate_trdata_array(zatrdata, ["mega_evolution", "mega_stone"])
+    assert list(report.counts) == ["mega_evolution", "mega_stone"]
+    assert any(
+        issue.tr_id == trainer.tr_id and issue.severity == "warning"
+        for issue in report.issues
+    )
+
+
+def test_validate_trdata_array_unknown_rule(zatrdata: ZATrainerDataArray) -> None:
+    """Test unknown rules are rejected."""
+    with pytest.raises(ValueError, match="foo"):
+        validate_trdata_array(zatrdata, ["species", "foo"])
+
+
+def write_out_of_range(artifacts_path: str) -> str:
+    """Write the game data with a level, a scale and a key out of the schema."""
+    with open(settings.files.file_trainer_data, encoding="utf-8") as f:
+        trdata = json.load(f)
+    record = trdata["values"][3]
+    record["poke1"].update(level=500, scaleValue=9999)
+    record["poke2"]["waza1"]["foo"] = 1
+    path = os.path.join(artifacts_path, "validate", "trdata_array.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(trdata, f)
+    return path
+
+
+def test_validate_trdata_file(artifacts_path: str) -> None:
+    """Test values out of range and unknown keys are reported, rather than trusted."""
+    report = validate_trdata_file(settings.files.file_trainer_data, ["species"])
+    assert report.counts == {"species": 0} and report.pokemon > 1000
+
+    path = write_out_of_range(artifacts_path)
+    report = validate_trdata_file(path)
+    assert report.counts == {SCHEMA_RULE: 3} and report.errors == 3
+    assert report.pokemon > 1000
+    with open(path, encoding="utf-8") as f:
+        tr_id = json.load(f)["values"][3]["trid"]
+    level, scale, key = report.issues
+    assert level.tr_id == tr_id and (level.slot, level.waza_slot) == (1, None)
+    assert level.message.startswith("poke1.level:") and "500" in level.message
+    assert scale.message.startswith("poke1.scaleValue:") and "9999" in scale.message
+    assert (key.slot, key.waza_slot) == (2, 1) and "foo" in key.message
+    json.dumps(report.to_dict())
+    with pytest.raises(ValueError, match="foo"):
+        validate_trdata_file(path, ["foo"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
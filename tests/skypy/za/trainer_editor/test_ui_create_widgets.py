@@ -22,8 +22,8 @@ def test_create_widgets(zatrdata: ZATrainerDataArray) -> None:
         ) as create_bfbs_file_input,
         mock.patch.object(ZATrainerEditor, "create_top_frame") as create_top_frame,
         mock.patch.object(
-            ZATrainerEditor, "create_trainer_combobox"
-        ) as create_trainer_combobox,
+            ZATrainerEditor, "create_trainer_picker"
+        ) as create_trainer_picker,
         mock.patch.object(ZATrainerEditor, "create_data_frame") as create_data_frame,
         mock.patch.object(
             ZATrainerEditor, "create_bottom_frame"
@@ -39,7 +39,7 @@ def test_create_widgets(zatrdata: ZATrainerDataArray) -> None:
         create_output_directory_input.assert_called_once()
         create_trainer_data.assert_called_once()
         create_top_frame.assert_called_once()
-        create_trainer_combobox.assert_called_once()
+        create_trainer_picker.assert_called_once()
         create_data_frame.assert_called_once()
         create_bottom_frame.assert_called_once()
         create_save_button.assert_called_once()
@@ -59,17 +59,14 @@ def test_create_top_frame(za_trainer_editor_app: ZATrainerEditor) -> None:
         pack.assert_called_once_with(fill="x", padx=10, pady=10)
 
 
-def test_create_trainer_combobox(za_trainer_editor_app: ZATrainerEditor) -> None:
-    """Test `create_trainer_combobox` method."""
+def test_create_trainer_picker(za_trainer_editor_app: ZATrainerEditor) -> None:
+    """Test `create_trainer_picker` method."""
     ui = za_trainer_editor_app
-    with (
-        mock.patch.object(
-            ctk.CTkLabel, "__init__", side_effect=ctk.CTkLabel.__init__, autospec=True
-        ) as label_init,
-    ):
-        ui.create_top_frame()
-        ui.create_trainer_combobox()
-        label_init.assert_called_once()
+    ui.create_top_frame()
+    picker = ui.create_trainer_picker()
+    assert picker is ui.trainer_picker
+    assert len(picker.rows) == picker.visible_rows
+    assert picker.results == ui.trdata.tr_ids
 
 
 if __name__ == "__main__":
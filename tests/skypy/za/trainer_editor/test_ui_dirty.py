@@ -0,0 +1,59 @@
+import os
+import typing as ty
+from unittest.mock import MagicMock, patch
+
+import customtkinter as ctk
+import pytest
+
+from skypy import settings
+from skypy.types.za import ZABallID
+from skypy.za import ZATrainerEditor
+
+
+def test_ui_dirty_status(
+    za_trainer_editor_app: ZATrainerEditor,
+    artifacts_path: str,
+) -> None:
+    """Test unsaved changes are shown in the status bar when edits are applied, and
+    cleared by a save.
+    """
+    app = za_trainer_editor_app
+    status_label = MagicMock(spec=ctk.CTkLabel)
+    with patch.object(app, "status_label", status_label, create=True):
+        assert app.refresh_dirty_status() == ""
+        status_label.configure.assert_not_called()
+
+        level = app.trdata["00_test_data"].poke_1.level
+        app.trdata["00_test_data"].poke_1.level = 42
+        status = app.refresh_dirty_status()
+        assert "00_test_data (poke1.level)" in status
+        status_label.configure.assert_called_once_with(text=status, text_color="orange")
+        # Unchanged: the label is not updated again
+        app.refresh_dirty_status()
+        status_label.configure.assert_called_once()
+
+        # Reverting the edit clears the label
+        app.trdata["00_test_data"].poke_1.level = level
+        assert app.refresh_dirty_status() == ""
+        status_label.configure.assert_called_with(text="", text_color="gray")
+
+        # Edits applied by the dispatcher refresh the status, without polling
+        app.updates.push(app.trdata["00_test_data"], "money_rate", "7", int)
+        app.updates.flush()
+        assert "moneyRate" in status_label.configure.call_args.kwargs["text"]
+        # So do the option menus, e.g. of the ball
+        pokemon = app.trdata["00_test_data"].poke_1
+        ball_id = next(b for b in ty.get_args(ZABallID) if b != pokemon.ball_id)
+        fields = app.trainer_frame.pokemon_slots[0].fields
+        fields.ball_id_field.option_menu.select(settings.za_item_names.labels[ball_id])
+        assert "poke1.ballId" in status_label.configure.call_args.kwargs["text"]
+
+        app.save_trainer_data(output_dir=os.path.join(artifacts_path, "za", "Output"))
+        assert app.save_worker.join(30)
+        app._poll_save_events()
+        assert not app.trdata.is_dirty
+        assert app.refresh_dirty_status() == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
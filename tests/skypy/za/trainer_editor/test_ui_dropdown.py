@@ -0,0 +1,43 @@
+import pytest
+
+from skypy.za import DropdownPopup, FilterDropdown, ZATrainerEditor
+from skypy.za.trainer_editor import SPECIES_OPTIONS, WAZA_OPTIONS
+
+
+def test_ui_dropdown(za_trainer_editor_app: ZATrainerEditor) -> None:
+    """Test picking a species and a move from the shared dropdown popup."""
+    app = za_trainer_editor_app
+    pkmn_frame = app.trainer_frame.pokemon_slots[0].fields
+    dev_id_menu = pkmn_frame.dev_id_field.option_menu
+    waza_menu = pkmn_frame.waza_frames[0].option_menu
+    assert isinstance(dev_id_menu, FilterDropdown)
+    assert isinstance(waza_menu, FilterDropdown)
+    assert dev_id_menu.options is SPECIES_OPTIONS
+    assert waza_menu.options is WAZA_OPTIONS
+
+    # One popup per window, listing only visible rows
+    dev_id_menu.open()
+    popup = DropdownPopup.of(dev_id_menu)
+    assert popup is DropdownPopup.of(waza_menu)
+    assert popup.is_open and popup.target is dev_id_menu
+    assert len(popup.list.rows) < len(SPECIES_OPTIONS)
+    assert popup.list.get() == dev_id_menu.get()
+
+    popup.list.search_var.set("pikachu")
+    assert popup.list.results[0] == "Pikachu"
+    popup.list.select_highlighted()
+    assert not popup.is_open
+    assert dev_id_menu.get() == "Pikachu"
+    assert pkmn_frame.pokemon_ref.dev_id_english == "Pikachu"
+
+    waza_menu.open()
+    assert popup.target is waza_menu
+    assert popup.list.search_var.get() == ""
+    popup.list.search_var.set("thunderbolt")
+    popup.list.select_highlighted()
+    assert pkmn_frame.waza_frames[0].waza_ref.waza_id_english == "Thunderbolt"
+    assert pkmn_frame.waza_frames[0].waza_variable.get() == "Thunderbolt"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -6,7 +6,7 @@ import pytest
 from loguru import logger
 
 from skypy.schemas import ZATrainerDataArray
-from skypy.za import TrainerFrame, ZATrainerEditor
+from skypy.za import TrainerFrame, TrainerPicker, ZATrainerEditor
 
 
 @pytest.mark.parametrize("output_dir", ["assets/za/Output"])
@@ -51,16 +51,17 @@ def test_ui_initialization_simple(
     assert isinstance(ui.data_frame, ctk.CTkScrollableFrame)
     assert isinstance(ui.bottom_frame, ctk.CTkFrame)
     assert isinstance(ui.trainer_frame.pokemon_label, ctk.CTkLabel)
+    # Pokemon slots are built on first expand
+    assert len(ui.trainer_frame.pokemon_slots) == 6
+    assert not any(slot.is_built for slot in ui.trainer_frame.pokemon_slots)
 
-    # Test Trainer combobox
-    assert isinstance(ui.trainer_combobox, ctk.CTkComboBox)
+    # Test Trainer picker
+    assert isinstance(ui.trainer_picker, TrainerPicker)
     assert isinstance(ui.trainer_combobox_label, ctk.CTkLabel)
     assert ui.trainer_combobox_label._text == "Select Trainer:"
-    assert ui.trainer_combobox.get() == ui.trdata.values[0].tr_id
-    assert ui.trainer_combobox._values == [
-        trainer.tr_id for trainer in ui.trdata.values
-    ]
-    assert ui.trainer_combobox._command == ui.on_trainer_selected
+    assert ui.trainer_picker.get() == ui.trdata.values[0].tr_id
+    assert ui.trainer_picker.results == [trainer.tr_id for trainer in ui.trdata.values]
+    assert ui.trainer_picker.command == ui.on_trainer_selected
 
     # Test Save button
     assert isinstance(ui.save_button, ctk.CTkButton)
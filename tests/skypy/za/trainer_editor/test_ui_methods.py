@@ -1,20 +1,9 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import customtkinter as ctk
 import pytest
 
 from skypy.za import ZATrainerEditor
-from skypy.za.trainer_editor import _set_attr
-
-
-def test_set_attr() -> None:
-    """Test `_set_attr` method."""
-    obj = MagicMock()
-    _set_attr(obj, "money_rate", "100", dtype=int)
-    assert obj.money_rate == 100
-
-    _set_attr(obj, "money_rate", "true", dtype=bool)
-    assert obj.money_rate is True
 
 
 def test_create_trainer_combobox(za_trainer_editor_app: ZATrainerEditor) -> None:
@@ -14,32 +14,16 @@ def _validate_pkmns(
     pokemon: ZAPokemonData,
 ) -> None:
     """Validate the pokemon data in the trainer frame."""
-    assert (
-        app.trainer_frame.pokemon_fields[pkmn_index].dev_id_field.option_menu.get()
-        == pokemon.dev_id_english
-    )
-    assert (
-        app.trainer_frame.pokemon_fields[pkmn_index].item_field.option_menu.get()
-        == pokemon.item_english
-    )
-    assert app.trainer_frame.pokemon_fields[pkmn_index].level_field.var.get() == str(
-        pokemon.level
-    )
-    assert app.trainer_frame.pokemon_fields[pkmn_index].form_id_field.var.get() == str(
-        pokemon.form_id
-    )
-    assert app.trainer_frame.pokemon_fields[
-        pkmn_index
-    ].sex_field.option_menu.get() == str(pokemon.sex)
-    assert (
-        app.trainer_frame.pokemon_fields[pkmn_index].ball_id_field.option_menu.get()
-        == pokemon.ball_id_english
-    )
-    assert app.trainer_frame.pokemon_fields[
-        pkmn_index
-    ].scale_value_field.var.get() == str(pokemon.scale_value)
+    fields = app.trainer_frame.pokemon_slots[pkmn_index].fields
+    assert fields.dev_id_field.option_menu.get() == pokemon.dev_id_label
+    assert fields.item_field.option_menu.get() == pokemon.item_label
+    assert fields.level_field.var.get() == str(pokemon.level)
+    assert fields.form_id_field.var.get() == str(pokemon.form_id)
+    assert fields.sex_field.option_menu.get() == str(pokemon.sex)
+    assert fields.ball_id_field.option_menu.get() == pokemon.ball_id_label
+    assert fields.scale_value_field.var.get() == str(pokemon.scale_value)
     for waza_frame, waza in zip(
-        app.trainer_frame.pokemon_fields[pkmn_index].waza_frames,
+        fields.waza_frames,
         (
             pokemon.waza_1,
             pokemon.waza_2,
@@ -47,7 +31,7 @@ def _validate_pkmns(
             pokemon.waza_4,
         ),
     ):
-        assert waza_frame.option_menu.get() == waza.waza_id_english
+        assert waza_frame.option_menu.get() == waza.waza_id_label
         assert waza_frame.plus_checkbox.get() == waza.is_plus_waza
 
 
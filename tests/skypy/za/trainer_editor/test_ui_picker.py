@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+import pytest
+
+from skypy.za import ZATrainerEditor
+
+
+def test_ui_picker(za_trainer_editor_app: ZATrainerEditor) -> None:
+    """Test searching, scrolling and selecting in the trainer picker."""
+    app = za_trainer_editor_app
+    picker = app.trainer_picker
+    # Only the visible rows exist
+    assert len(picker.rows) == picker.visible_rows < len(app.trdata)
+
+    picker.scroll_to(10)
+    assert picker.offset == 10
+    assert picker.rows[0].cget("text") == app.trainer_index.label(picker.results[10])
+    picker.scroll_to(10_000)
+    assert picker.offset == len(picker.results) - picker.visible_rows
+
+    picker.search_var.set("ev_m02")
+    assert picker.offset == 0
+    assert picker.results[0].lower().startswith("ev_m02")
+    with patch.object(app.trainer_frame, "update_trainer_data") as update:
+        picker.move(1)
+        picker.select_highlighted()
+        update.assert_called_once_with(app.trdata[picker.results[1]])
+    assert picker.get() == picker.results[1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])
@@ -1,12 +1,10 @@
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import customtkinter as ctk
 import pytest
 
-from skypy import settings
-from skypy.schemas import ZATrainerDataArray
-from skypy.za import ZATrainerEditor
+from skypy.za import SaveEvent, SaveJob, SaveWorker, ZATrainerEditor
 
 
 @pytest.mark.parametrize("output_dir", [None, "pytest_artifacts/za/Output"])
@@ -14,30 +12,68 @@ def test_ui_save(
     za_trainer_editor_app: ZATrainerEditor,
     output_dir: str | None,
 ) -> None:
-    """Test `save_trainer_data`."""
+    """Test `save_trainer_data` submits a snapshot to the save worker."""
     app = za_trainer_editor_app
     status_label = MagicMock(spec=ctk.CTkLabel)
     configure = MagicMock()
     status_label.configure = configure
     with (
-        patch.object(ZATrainerDataArray, "dump") as dump,
+        patch.object(SaveWorker, "submit") as submit,
         patch.object(app, "status_label", status_label, create=True),
     ):
         app.trdata.values[0].tr_id = "test_trainer"
         assert app.trdata.values[0].tr_id == "test_trainer"
         app.save_trainer_data(output_dir=output_dir)
-        dump.assert_called_once()
+        submit.assert_called_once()
         if output_dir is None:
             expected_output_dir = app.output_dir
         else:
             expected_output_dir = output_dir
-        dump.assert_called_once_with(
-            os.path.join(expected_output_dir, app.file_name),
-            bfbs_file=settings.files.za_trainers_bfbs_file,
-            create_binaries=True,
-        )
+        job = submit.call_args.args[0]
+        assert isinstance(job, SaveJob)
+        assert job.path == os.path.join(expected_output_dir, app.file_name)
+        assert job.create_binaries
+        assert job.snapshot.records[0]["trid"] == "test_trainer"
         configure.assert_called()
 
 
+def test_ui_save_background(
+    za_trainer_editor_app: ZATrainerEditor,
+    artifacts_path: str,
+) -> None:
+    """Test the save runs in the background, and edits made meanwhile stay dirty."""
+    app = za_trainer_editor_app
+    app.trdata.values[0].poke_1.level = 42
+    app.save_trainer_data(output_dir=artifacts_path)
+    app.trdata.values[0].poke_1.level = 43
+    assert app.save_worker.join(30)
+    app._poll_save_events()
+    assert app._save_job is None
+    assert app.trdata.changes() == {app.trdata.tr_ids[0]: ["poke1.level"]}
+    assert os.path.exists(os.path.join(artifacts_path, "trdata_array.bin"))
+
+
+def test_ui_save_poll_last_event(
+    za_trainer_editor_app: ZATrainerEditor,
+    artifacts_path: str,
+) -> None:
+    """Test the last event is handled when the worker turns idle while polling."""
+    app = za_trainer_editor_app
+    job = SaveJob(app.trdata.snapshot(), os.path.join(artifacts_path, "last.json"))
+    event = SaveEvent("done", job, "Saved")
+    # Busy when polled, the last event is only posted after the queue is drained
+    with (
+        patch.object(SaveWorker, "busy", new_callable=PropertyMock, return_value=True),
+        patch.object(app, "after", return_value="job") as after,
+    ):
+        app._poll_save_events()
+    after.assert_called_once()
+    app.save_worker.events.put(event)
+    with patch.object(app, "_on_save_event") as on_save_event:
+        app._poll_save_events()
+    on_save_event.assert_called_once_with(event)
+    assert app._save_job is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-x", "-s"])
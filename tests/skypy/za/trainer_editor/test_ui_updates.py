@@ -0,0 +1,45 @@
+import pytest
+
+from skypy import settings
+from skypy.za import ZATrainerEditor
+
+
+def test_ui_updates(za_trainer_editor_app: ZATrainerEditor) -> None:
+    """Test switching trainers writes nothing, and typed values are batched."""
+    app = za_trainer_editor_app
+    trid = app.trdata.tr_ids[1]
+    app.on_trainer_selected(trid)
+    assert not app.trdata.is_dirty
+    assert app.updates.pending_count == 0
+
+    level_field = app.trainer_frame.pokemon_slots[0].fields.level_field
+    for text in ("", "4", "42"):
+        level_field.var.set(text)
+    app.trainer_frame.money_rate_field.var.set("7")
+    assert app.updates.pending_count == 2
+    assert app.trdata[trid].poke_1.level != 42 or app.trdata[trid].money_rate != 7
+
+    # Switching trainers applies pending edits to the previous one
+    app.on_trainer_selected(app.trdata.tr_ids[0])
+    assert app.updates.pending_count == 0
+    assert app.trdata[trid].poke_1.level == 42
+    assert app.trdata[trid].money_rate == 7
+    assert list(app.trdata.changes()) == [trid]
+
+
+def test_ui_updates_slot_header(za_trainer_editor_app: ZATrainerEditor) -> None:
+    """Test the header of an open slot shows the new species and level."""
+    app = za_trainer_editor_app
+    slot = app.trainer_frame.pokemon_slots[0]
+    slot.expand()
+    slot.fields.level_field.var.set("42")
+    app.updates.flush()
+    assert "Lv. 42" in slot.header.cget("text")
+
+    species = settings.za_species_names.labels[25]
+    slot.fields.dev_id_field.option_menu.select(species)
+    assert species in slot.header.cget("text")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-x", "-s"])